@@ -3,9 +3,9 @@ PROJECT PREDATOR - BaseAgent
 Base class for all agents
 """
 import logging
-from typing import Any
+from typing import Any, Callable, Iterable, Optional
 from backend.interfaces.agent import IAgent
-from backend.core.event_bus import EventBus
+from backend.core.event_bus import EventBus, EventType, DispatchMode
 from backend.core.registry import Registry
 
 
@@ -17,16 +17,18 @@ class BaseAgent(IAgent):
     Provides common functionality for event subscription and lifecycle.
     """
     
-    def __init__(self, event_bus: EventBus, registry: Registry):
+    def __init__(self, event_bus: EventBus, registry: Registry, symbols: Optional[Iterable[str]] = None):
         """
         Initialize base agent
         
         Args:
             event_bus: Reference to EventBus
             registry: Reference to Registry
+            symbols: Optional symbol universe; None means all symbols
         """
         self.event_bus = event_bus
         self.registry = registry
+        self.symbols = tuple(symbols) if symbols is not None else None
         self.logger = logging.getLogger(self.__class__.__name__)
         self._running = False
         self._event_count = 0
@@ -89,6 +91,31 @@ class BaseAgent(IAgent):
         """
         pass
     
+    def _subscribe_routed(self, event_type: EventType, handler: Callable, conflate: bool = False) -> None:
+        """
+        Subscribe to a symbol-routed event type
+        
+        Wildcard subscription if the agent covers all symbols, otherwise one
+        keyed subscription per symbol so the bus skips other symbols.
+        With conflate=True the handler runs on the agent's ASYNC worker
+        (shared by all its async subscriptions), which only keeps the
+        latest pending event per symbol.
+        """
+        options = {"mode": DispatchMode.ASYNC, "conflate": True, "group": self.get_name()} if conflate else {}
+        if self.symbols is None:
+            self.event_bus.subscribe(event_type, handler, **options)
+            return
+        for symbol in self.symbols:
+            self.event_bus.subscribe(event_type, handler, key=symbol, **options)
+    
+    def _unsubscribe_routed(self, event_type: EventType, handler: Callable) -> None:
+        """Undo _subscribe_routed()"""
+        if self.symbols is None:
+            self.event_bus.unsubscribe(event_type, handler)
+            return
+        for symbol in self.symbols:
+            self.event_bus.unsubscribe(event_type, handler, key=symbol)
+    
     def _log_event(self, event: Any) -> None:
         """
         Log event receipt
@@ -25,6 +25,10 @@ class ExecutionAgent(BaseAgent):
         self._fake_market = None
         self.logger.info("ExecutionAgent initialized (SKELETON)")
     
+    def get_dependencies(self):
+        """FakeMarket must be registered and started before orders are routed to it"""
+        return ("FakeMarket",)
+    
     def _subscribe_events(self) -> None:
         """Subscribe to ORDER_REQUEST events"""
         self._order_handler = self._on_order_request
@@ -2,6 +2,7 @@
 PROJECT PREDATOR - MarketScannerAgent
 FAZ 2: Agent skeleton - NO REAL LOGIC
 """
+from typing import Iterable, Optional
 from backend.agents.base import BaseAgent
 from backend.core.event_bus import EventBus, EventType, Event
 from backend.core.registry import Registry
@@ -18,8 +19,10 @@ class MarketScannerAgent(BaseAgent):
     Just event subscription and logging.
     """
     
-    def __init__(self, event_bus: EventBus, registry: Registry):
-        super().__init__(event_bus, registry)
+    def __init__(self, event_bus: EventBus, registry: Registry, symbols: Optional[Iterable[str]] = None,
+                 conflate_prices: bool = False):
+        super().__init__(event_bus, registry, symbols)
+        self.conflate_prices = conflate_prices
         self._tick_handler = None
         self._price_handler = None
         self.logger.info("MarketScannerAgent initialized (SKELETON)")
@@ -29,7 +32,7 @@ class MarketScannerAgent(BaseAgent):
         self._tick_handler = self._on_tick
         self._price_handler = self._on_price_update
         self.event_bus.subscribe(EventType.TICK, self._tick_handler)
-        self.event_bus.subscribe(EventType.PRICE_UPDATE, self._price_handler)
+        self._subscribe_routed(EventType.PRICE_UPDATE, self._price_handler, conflate=self.conflate_prices)
         self.logger.info("Subscribed to TICK and PRICE_UPDATE events")
     
     def _unsubscribe_events(self) -> None:
@@ -37,7 +40,7 @@ class MarketScannerAgent(BaseAgent):
         if self._tick_handler:
             self.event_bus.unsubscribe(EventType.TICK, self._tick_handler)
         if self._price_handler:
-            self.event_bus.unsubscribe(EventType.PRICE_UPDATE, self._price_handler)
+            self._unsubscribe_routed(EventType.PRICE_UPDATE, self._price_handler)
     
     def _on_tick(self, event: Event) -> None:
         """
@@ -57,14 +60,16 @@ class MarketScannerAgent(BaseAgent):
         self._log_event(event)
         data = event.data or {}
         regime = "RANGE"  # stub/placeholder regime
+        symbol = data.get("symbol", "BTC/USD")
         self.event_bus.publish(
             EventType.MARKET_REGIME,
             {
-                "symbol": data.get("symbol", "BTC/USD"),
+                "symbol": symbol,
                 "regime": regime,
                 "source_price": data.get("price"),
                 "fake": True
             },
-            source=self.get_name()
+            source=self.get_name(),
+            key=symbol
         )
         self.logger.debug(f"Published MARKET_REGIME: {regime}")
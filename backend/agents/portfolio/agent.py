@@ -2,11 +2,18 @@
 PROJECT PREDATOR - PortfolioManagerAgent
 FAZ 2: Agent skeleton - NO REAL LOGIC
 """
+import threading
+from typing import Iterable, Optional
 from backend.agents.base import BaseAgent
 from backend.core.event_bus import EventBus, EventType, Event
+from backend.core.payloads import Fill, PositionSnapshot, PriceUpdate
 from backend.core.registry import Registry
 
 
+# Legacy dict payloads without a symbol are booked under UNKNOWN
+_UNKNOWN_SYMBOL = {"symbol": "UNKNOWN"}
+
+
 class PortfolioManagerAgent(BaseAgent):
     """
     Portfolio Manager Agent (FAZ 3 - Fake PnL)
@@ -17,8 +24,12 @@ class PortfolioManagerAgent(BaseAgent):
     - Publish POSITION_UPDATE
     """
     
-    def __init__(self, event_bus: EventBus, registry: Registry):
-        super().__init__(event_bus, registry)
+    def __init__(self, event_bus: EventBus, registry: Registry, symbols: Optional[Iterable[str]] = None,
+                 conflate_prices: bool = False):
+        super().__init__(event_bus, registry, symbols)
+        self.conflate_prices = conflate_prices
+        # Fills arrive synchronously while conflated prices arrive on a worker
+        self._lock = threading.RLock()
         self._fill_handler = None
         self._price_handler = None
         self._positions = {}  # symbol -> {"qty": float, "avg_cost": float, "last_price": float}
@@ -29,97 +40,95 @@ class PortfolioManagerAgent(BaseAgent):
         """Subscribe to ORDER_FILLED and PRICE_UPDATE"""
         self._fill_handler = self._on_fill
         self._price_handler = self._on_price_update
-        self.event_bus.subscribe(EventType.ORDER_FILLED, self._fill_handler)
-        self.event_bus.subscribe(EventType.PRICE_UPDATE, self._price_handler)
+        self._subscribe_routed(EventType.ORDER_FILLED, self._fill_handler)
+        self._subscribe_routed(EventType.PRICE_UPDATE, self._price_handler, conflate=self.conflate_prices)
         self.logger.info("Subscribed to ORDER_FILLED and PRICE_UPDATE")
     
     def _unsubscribe_events(self) -> None:
         """Unsubscribe from events"""
         if self._fill_handler:
-            self.event_bus.unsubscribe(EventType.ORDER_FILLED, self._fill_handler)
+            self._unsubscribe_routed(EventType.ORDER_FILLED, self._fill_handler)
         if self._price_handler:
-            self.event_bus.unsubscribe(EventType.PRICE_UPDATE, self._price_handler)
+            self._unsubscribe_routed(EventType.PRICE_UPDATE, self._price_handler)
     
     def _on_fill(self, event: Event) -> None:
         """Handle ORDER_FILLED to update positions and realized PnL"""
         self._log_event(event)
-        data = event.data or {}
-        symbol = data.get("symbol", "UNKNOWN")
-        side = data.get("side")
-        qty = float(data.get("quantity", 0.0))
-        price = float(data.get("price", 0.0))
-        pos = self._positions.get(symbol, {"qty": 0.0, "avg_cost": 0.0, "last_price": price})
-        old_qty = pos["qty"]
-        avg = pos["avg_cost"]
+        fill = Fill.from_mapping(event.data, _UNKNOWN_SYMBOL)
+        symbol = fill.symbol
+        side = fill.side
+        qty = float(fill.quantity)
+        price = float(fill.price)
+        with self._lock:
+            pos = self._positions.get(symbol, {"qty": 0.0, "avg_cost": 0.0, "last_price": price})
+            old_qty = pos["qty"]
+            avg = pos["avg_cost"]
         
-        if side == "BUY":
-            new_qty = old_qty + qty
-            if new_qty != 0:
-                new_avg = (avg * old_qty + price * qty) / new_qty
+            if side == "BUY":
+                new_qty = old_qty + qty
+                if new_qty != 0:
+                    new_avg = (avg * old_qty + price * qty) / new_qty
+                else:
+                    new_avg = 0.0
+                pos["qty"] = new_qty
+                pos["avg_cost"] = new_avg
+            elif side == "SELL":
+                # Realized PnL on sold quantity
+                sell_qty = qty
+                self._realized += (price - avg) * sell_qty
+                new_qty = old_qty - sell_qty
+                pos["qty"] = new_qty
+                if new_qty == 0:
+                    pos["avg_cost"] = 0.0
             else:
-                new_avg = 0.0
-            pos["qty"] = new_qty
-            pos["avg_cost"] = new_avg
-        elif side == "SELL":
-            # Realized PnL on sold quantity
-            sell_qty = qty
-            self._realized += (price - avg) * sell_qty
-            new_qty = old_qty - sell_qty
-            pos["qty"] = new_qty
-            if new_qty == 0:
-                pos["avg_cost"] = 0.0
-        else:
-            self.logger.warning("Unknown side in fill")
+                self.logger.warning("Unknown side in fill")
         
-        pos["last_price"] = price
-        self._positions[symbol] = pos
+            pos["last_price"] = price
+            self._positions[symbol] = pos
         self._publish_position(symbol)
     
     def _on_price_update(self, event: Event) -> None:
         """Update unrealized PnL with latest price"""
-        data = event.data or {}
-        symbol = data.get("symbol", "UNKNOWN")
-        price = float(data.get("price", 0.0))
-        pos = self._positions.get(symbol)
-        if not pos:
-            return
-        pos["last_price"] = price
-        self._positions[symbol] = pos
+        update = PriceUpdate.from_mapping(event.data, _UNKNOWN_SYMBOL)
+        symbol = update.symbol
+        price = float(update.price)
+        with self._lock:
+            pos = self._positions.get(symbol)
+            if not pos:
+                return
+            pos["last_price"] = price
+            self._positions[symbol] = pos
         self._publish_position(symbol)
     
     def _publish_position(self, symbol: str) -> None:
-        pos = self._positions.get(symbol, {"qty": 0.0, "avg_cost": 0.0, "last_price": 0.0})
-        qty = pos["qty"]
-        avg = pos["avg_cost"]
-        price = pos["last_price"]
+        with self._lock:
+            pos = self._positions.get(symbol, {"qty": 0.0, "avg_cost": 0.0, "last_price": 0.0})
+            qty = pos["qty"]
+            avg = pos["avg_cost"]
+            price = pos["last_price"]
+            realized = self._realized
         unrealized = qty * (price - avg)
-        snapshot = {
-            "symbol": symbol,
-            "qty": qty,
-            "avg_cost": avg,
-            "last_price": price,
-            "unrealized": unrealized,
-            "realized": self._realized,
-            "fake": True,
-        }
-        self.event_bus.publish(EventType.POSITION_UPDATE, snapshot, source=self.get_name())
-        self.logger.debug(f"POSITION_UPDATE {snapshot}")
+        snapshot = PositionSnapshot(symbol, qty, avg, price, unrealized, realized, True)
+        self.event_bus.publish(EventType.POSITION_UPDATE, snapshot, source=self.get_name(), key=symbol)
+        self.logger.debug("POSITION_UPDATE %s", snapshot)
     
     def get_equity(self) -> float:
         """Get total equity (realized + unrealized PnL)"""
-        total = self._realized
-        for symbol, pos in self._positions.items():
-            total += pos["qty"] * (pos["last_price"] - pos["avg_cost"])
-        return total
+        with self._lock:
+            total = self._realized
+            for symbol, pos in self._positions.items():
+                total += pos["qty"] * (pos["last_price"] - pos["avg_cost"])
+            return total
     
     def get_portfolio_state(self) -> dict:
         """Get full portfolio state for backtest reporting"""
-        unrealized = 0.0
-        for symbol, pos in self._positions.items():
-            unrealized += pos["qty"] * (pos["last_price"] - pos["avg_cost"])
-        return {
-            "total_equity": self._realized + unrealized,
-            "realized_pnl": self._realized,
-            "unrealized_pnl": unrealized,
-            "positions": {k: v.copy() for k, v in self._positions.items()}
-        }
\ No newline at end of file
+        with self._lock:
+            unrealized = 0.0
+            for symbol, pos in self._positions.items():
+                unrealized += pos["qty"] * (pos["last_price"] - pos["avg_cost"])
+            return {
+                "total_equity": self._realized + unrealized,
+                "realized_pnl": self._realized,
+                "unrealized_pnl": unrealized,
+                "positions": {k: v.copy() for k, v in self._positions.items()}
+            }
\ No newline at end of file
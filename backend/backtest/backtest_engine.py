@@ -3,36 +3,53 @@ PROJECT PREDATOR - BacktestEngine
 Wires replayer, fake market, strategy, portfolio skeleton.
 """
 import logging
-from typing import List, Dict, Any
+from collections import deque
+from typing import List, Dict, Any, Iterable, Optional, Union
 
 from backend.core.event_bus import EventBus, EventType
+from backend.core.payloads import PriceUpdate
 from backend.core.registry import Registry
 from backend.simulation.time_source import TimeSource
-from backend.simulation.historical_replayer import HistoricalReplayer
+from backend.simulation.time_warp import TimeWarp
+from backend.simulation.historical_replayer import HistoricalReplayer, peek_candles
 from backend.market.fake_market import FakeMarket
 from backend.market.candle import Candle
 from backend.strategies.fake_strategy_random import FakeStrategyRandom
 from backend.strategies.fake_strategy_trend import FakeStrategyTrend
 from backend.agents.execution.agent import ExecutionAgent
 from backend.agents.portfolio.agent import PortfolioManagerAgent
+from backend.backtest.backtest_report import RunningReport
 
 
 class BacktestEngine:
     """
     Minimal backtest orchestrator (stub).
+
+    candles is any iterable of Candle: a list, a columnar CandleStore or
+    a stream (HistoricalDataLoader.stream), which is consumed once.
+    Metrics are accumulated as the run goes; with history_window set,
+    trades and equity_curve keep only the latest history_window entries,
+    so a streamed run holds a bounded window whatever its length.
     """
-    def __init__(self, candles: List[Candle], strategy_name: str = "fake_trend", speed: float = 100.0, seed: int = 1337, emit_ticks: bool = False, deterministic: bool = False):
+    def __init__(self, candles: Iterable[Candle], strategy_name: str = "fake_trend", speed: float = 100.0, seed: int = 1337, emit_ticks: bool = False, deterministic: bool = False, batch_size: Optional[int] = None, run_to_completion: bool = False, max_cascade: Optional[int] = None, virtual_time: bool = False, history_window: Optional[int] = None):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.event_bus = EventBus()
+        first, candles = peek_candles(candles)
+        # Virtual time: replay jumps from candle to candle instead of sleeping (speed is ignored)
+        if virtual_time:
+            self.time_source = TimeWarp(start=first.timestamp if first else None)
+        else:
+            self.time_source = TimeSource(speed=speed)
+        # Stamp events in simulated time, not wall time
+        self.event_bus = EventBus(clock=self.time_source.now_ns, run_to_completion=run_to_completion, max_cascade=max_cascade)
         self.registry = Registry()
-        self.time_source = TimeSource(speed=speed)
-        self.replayer = HistoricalReplayer(self.event_bus, self.time_source, emit_ticks=emit_ticks, deterministic=deterministic)
+        self.replayer = HistoricalReplayer(self.event_bus, self.time_source, emit_ticks=emit_ticks, deterministic=deterministic, batch_size=batch_size)
         self.market = FakeMarket(self.event_bus)
         self.strategy = self._build_strategy(strategy_name, seed)
         self.execution = ExecutionAgent(self.event_bus, self.registry)
         self.portfolio = PortfolioManagerAgent(self.event_bus, self.registry)
-        self.trades: List[Dict[str, Any]] = []
-        self.equity_curve: List[Dict[str, Any]] = []
+        self.trades: Union[List[Dict[str, Any]], deque] = [] if history_window is None else deque(maxlen=history_window)
+        self.equity_curve: Union[List[Dict[str, Any]], deque] = [] if history_window is None else deque(maxlen=history_window)
+        self.report = RunningReport()
         self._last_price = 0.0
         self.seed = seed
         # register components for lookup
@@ -52,7 +69,8 @@ class BacktestEngine:
         return FakeStrategyTrend(self.event_bus)
 
     def run(self) -> Dict[str, Any]:
-        self.logger.info(f"Starting backtest with {len(self.candles)} candles, strategy={self.strategy.get_name()}")
+        count = len(self.candles) if hasattr(self.candles, "__len__") else "streamed"
+        self.logger.info(f"Starting backtest with {count} candles, strategy={self.strategy.get_name()}")
         self.market.start()
         self.execution.start()
         self.portfolio.start()
@@ -66,10 +84,9 @@ class BacktestEngine:
         self.execution.stop()
         self.market.stop()
         
-        # Calculate final metrics
-        from backend.backtest.backtest_report import BacktestReport
-        report = BacktestReport.summarize(self.trades, self.equity_curve)
-        
+        # Final metrics (accumulated over the whole run, not just the kept window)
+        report = self.report.summary()
+
         return {
             "trades": self.trades,
             "equity_curve": self.equity_curve,
@@ -85,14 +102,18 @@ class BacktestEngine:
     def _on_fill(self, event):
         data = event.data or {}
         self.trades.append(data)
+        self.report.add_trade(data)
 
     def _on_price(self, event):
-        data = event.data or {}
-        self._last_price = data.get("price", self._last_price)
+        data = event.data
+        if not isinstance(data, PriceUpdate):
+            data = PriceUpdate.from_mapping(data, {"price": self._last_price, "timestamp": None})
+        self._last_price = data.price
         # Get equity from portfolio (includes realized + unrealized PnL)
         portfolio_state = self.portfolio.get_portfolio_state()
         equity = portfolio_state.get("total_equity", 0.0)
-        timestamp = data.get("timestamp", self.time_source.now())
+        timestamp = data.timestamp if data.timestamp is not None else self.time_source.now()
+        self.report.add_equity(equity)
         self.equity_curve.append({
             "timestamp": timestamp,
             "price": self._last_price,
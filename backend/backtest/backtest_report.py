@@ -2,55 +2,65 @@
 PROJECT PREDATOR - BacktestReport
 Generates simple metrics from trades/equity.
 """
-from typing import List, Dict
+from typing import Dict, Iterable, List
 
 
-class BacktestReport:
-    @staticmethod
-    def summarize(trades: List[Dict], equity: List[Dict]) -> Dict:
-        # Calculate winrate from trades (simplified - assumes round trips)
-        win = 0
-        total = len(trades)
-        if total > 0:
-            # Simple heuristic: if we have more SELL than BUY, we're winning
-            buys = sum(1 for t in trades if t.get("side") == "BUY")
-            sells = sum(1 for t in trades if t.get("side") == "SELL")
-            if sells > buys:
-                win = sells - buys
-        
-        winrate = (win / total) if total > 0 else 0.0
-        
-        # Max drawdown from equity curve
-        max_dd = BacktestReport._max_drawdown(equity)
-        
-        # Total return from final equity (if available) or sum of trades
-        total_return = 0.0
-        if equity:
-            final_equity = equity[-1].get("equity", 0.0)
-            initial_equity = equity[0].get("equity", 0.0) if equity else 0.0
-            total_return = final_equity - initial_equity
-        
+class RunningReport:
+    """
+    BacktestReport.summarize computed incrementally
+
+    Holds counters instead of the trade list and equity curve, so a
+    streaming backtest can report on its whole run in constant memory.
+    """
+
+    def __init__(self):
+        self.trades = 0
+        self.buys = 0
+        self.sells = 0
+        self.points = 0
+        self.initial_equity = 0.0
+        self.final_equity = 0.0
+        self.peak = 0.0
+        self.max_drawdown = 0.0
+
+    def add_trade(self, trade: Dict) -> None:
+        self.trades += 1
+        side = trade.get("side")
+        if side == "BUY":
+            self.buys += 1
+        elif side == "SELL":
+            self.sells += 1
+
+    def add_equity(self, equity: float) -> None:
+        if not self.points:
+            self.initial_equity = self.peak = equity
+        self.points += 1
+        self.final_equity = equity
+        if equity > self.peak:
+            self.peak = equity
+        if self.peak - equity > self.max_drawdown:
+            self.max_drawdown = self.peak - equity
+
+    def summary(self) -> Dict:
+        # Simple heuristic (as in summarize): if we have more SELL than BUY, we're winning
+        win = self.sells - self.buys if self.sells > self.buys else 0
         return {
-            "total_return": total_return,
-            "num_trades": total,
-            "winrate": winrate,
-            "max_drawdown": max_dd,
+            "total_return": self.final_equity - self.initial_equity if self.points else 0.0,
+            "num_trades": self.trades,
+            "winrate": (win / self.trades) if self.trades > 0 else 0.0,
+            "max_drawdown": self.max_drawdown,
         }
 
+
+class BacktestReport:
     @staticmethod
-    def _max_drawdown(equity: List[Dict]) -> float:
-        if not equity:
-            return 0.0
-        peak = equity[0].get("equity", 0.0)
-        max_dd = 0.0
+    def summarize(trades: Iterable[Dict], equity: Iterable[Dict]) -> Dict:
+        report = RunningReport()
+        for trade in trades:
+            report.add_trade(trade)
         for point in equity:
-            val = point.get("equity", 0.0)
-            if val > peak:
-                peak = val
-            dd = peak - val
-            if dd > max_dd:
-                max_dd = dd
-        return max_dd
+            report.add_equity(point.get("equity", 0.0))
+        return report.summary()
 
     @staticmethod
     def to_csv(equity: List[Dict], path: str) -> None:
@@ -3,24 +3,60 @@ PROJECT PREDATOR - BacktestRunner
 CLI entry (simple argparse).
 """
 import argparse
+import time
+from backend.core.config import config
 from backend.simulation.historical_data_loader import HistoricalDataLoader
 from backend.backtest.backtest_engine import BacktestEngine
 
 
 def main():
     parser = argparse.ArgumentParser(description="PROJECT PREDATOR Backtest Runner (FAZ 3, stub)")
-    parser.add_argument("--data", required=True, help="Path to CSV with OHLCV")
+    parser.add_argument("--data", required=True, help="Path to CSV (or .parquet, needs pyarrow) with OHLCV")
+    parser.add_argument("--start", type=float, default=None, help="First candle time (epoch seconds, inclusive)")
+    parser.add_argument("--end", type=float, default=None, help="Last candle time (epoch seconds, exclusive)")
+    parser.add_argument("--stream", action="store_true", help="Parse and replay chunk by chunk (constant memory)")
+    parser.add_argument("--history-window", type=int, default=None,
+                        help="Keep only the last N trades / equity points (default with --stream: 10000)")
+    parser.add_argument("--cache-dir", default=None, help="Memory-mapped candle cache (default: CANDLE_CACHE_DIR; '' = off)")
     parser.add_argument("--strategy", default="fake_trend", choices=["fake_trend", "fake_random"])
     parser.add_argument("--speed", type=float, default=100.0, help="Time speed multiplier")
     parser.add_argument("--seed", type=int, default=1337, help="Deterministic seed")
+    parser.add_argument("--batch-size", type=int, default=None, help="Replay candles in batches of N (publish_batch; ticks follow each batch rather than each candle)")
+    parser.add_argument("--run-to-completion", action="store_true", help="Drain nested publishes iteratively (breadth-first)")
+    parser.add_argument("--virtual-time", action="store_true", help="Run on a TimeWarp virtual clock (no wall-clock sleeps)")
+    parser.add_argument("--max-cascade", type=int, default=None, help="Cap events triggered per root event (with --run-to-completion)")
     args = parser.parse_args()
 
+    cache_dir = config.CANDLE_CACHE_DIR if args.cache_dir is None else args.cache_dir
+
     loader = HistoricalDataLoader()
-    candles = loader.load_csv(args.data)
-    engine = BacktestEngine(candles, strategy_name=args.strategy, speed=args.speed, seed=args.seed)
+    history_window = args.history_window
+    if args.stream:
+        candles = loader.stream(args.data, args.start, args.end)
+        if history_window is None:
+            history_window = 10_000
+    elif cache_dir:
+        from backend.simulation.candle_cache import CandleCache
+        cache = CandleCache(cache_dir, loader)
+        started = time.perf_counter()
+        candles = cache.load(args.data).between(args.start, args.end)
+        print(f"Opened {len(candles)} cached candles in {time.perf_counter() - started:.3f}s "
+              f"({'hit' if cache.hits else 'converted'})")
+    elif args.data.endswith(".parquet"):
+        candles = loader.load_parquet(args.data, args.start, args.end)
+        if candles is None:
+            parser.error("Parquet input requires pyarrow")
+    else:
+        candles = loader.load_csv(args.data).between(args.start, args.end)
+    stats = loader.get_stats()
+    if stats and not args.stream:
+        print(f"Parsed {stats['rows']} candles in {stats['seconds']:.2f}s ({stats['rows_per_second']:,.0f} rows/s)")
+    engine = BacktestEngine(candles, strategy_name=args.strategy, speed=args.speed, seed=args.seed, batch_size=args.batch_size,
+                            run_to_completion=args.run_to_completion, max_cascade=args.max_cascade,
+                            virtual_time=args.virtual_time, history_window=history_window)
     report = engine.run()
     print("Backtest complete")
-    print(f"Trades: {len(report['trades'])}")
+    print(f"Trades: {report['num_trades']}")
     print(f"Total return (stub): {report['total_return']}")
 
 
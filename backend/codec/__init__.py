@@ -0,0 +1,4 @@
+"""
+PROJECT PREDATOR - Codec Package
+Compact binary encoding of events (journal, IPC, snapshots)
+"""
@@ -0,0 +1,401 @@
+"""
+PROJECT PREDATOR - Binary Event Codec
+Schema-driven binary encoding with interned symbols and a version byte
+"""
+import pickle
+import struct
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from backend.codec.schema import SCHEMA_BY_CLASS, SCHEMA_BY_ID, SCHEMAS, PayloadSchema
+from backend.core.event_bus import Event, EventType
+
+VERSION = 1
+
+# Every encoded buffer starts with HEAD (version, number of symbol
+# definitions) followed by the definitions (id, length, UTF-8 name).
+HEAD = struct.Struct("<BH")
+DEFINITION = struct.Struct("<HB")
+_NO_DEFINITIONS = HEAD.pack(VERSION, 0)
+
+# Then the fixed part, the payload, and (only for KEY_VALUE) the key:
+#   body:  source id, key tag, key symbol id, payload schema id (0 = generic)
+#   event: event type symbol id, timestamp_ns, then the body fields
+BODY = "<HBHB"
+EVENT = "<HqHBHB"
+BODY_GENERIC = struct.Struct(BODY)
+EVENT_GENERIC = struct.Struct(EVENT)
+_BODY_STRUCTS = {s.schema_id: struct.Struct(BODY + s.format) for s in SCHEMAS}
+_EVENT_STRUCTS = {s.schema_id: struct.Struct(EVENT + s.format) for s in SCHEMAS}
+
+# Symbol id / text length meaning None
+NO_SYMBOL = 0xFFFF
+# Encoder symbol tables are cleared before they get this big
+_RESET_AT = 0xF000
+# Longest key / dict key interned as a symbol (characters, so <= 255 UTF-8 bytes)
+_MAX_SYMBOL_CHARS = 63
+
+KEY_NONE = 0
+KEY_SYMBOL = 1
+KEY_VALUE = 2
+
+# Generic (self-describing) value tags
+V_NONE = 0
+V_FALSE = 1
+V_TRUE = 2
+V_INT = 3
+V_FLOAT = 4
+V_SYMBOL = 5
+V_STR = 6
+V_BYTES = 7
+V_LIST = 8
+V_TUPLE = 9
+V_DICT = 10
+V_PAYLOAD = 11
+V_BIGINT = 12
+V_PICKLE = 13
+
+_INT = struct.Struct("<Bq")
+_FLOAT = struct.Struct("<Bd")
+_SYMBOL = struct.Struct("<BH")
+_LEN = struct.Struct("<BI")
+_U16 = struct.Struct("<H")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+_U32 = struct.Struct("<I")
+
+_PACK_ERRORS = (struct.error, TypeError, ValueError, AttributeError, OverflowError)
+
+_EVENT_TYPES = {event_type.value: event_type for event_type in EventType}
+
+
+class BinaryCodec:
+    """
+    Compact binary event codec
+
+    Payloads with a registered schema (Candle, PriceUpdate, OrderRequest,
+    Fill, PositionSnapshot, ExposureReport) are written as one
+    fixed-layout struct.
+    Everything else (the dict payloads of control events, or a typed
+    payload holding a value its schema cannot store, such as a None
+    price) falls back to a self-describing tagged encoding; objects it
+    does not know are pickled, so no event is ever unencodable.
+
+    Sources, routing keys, event types, symbol-like payload fields and
+    dict keys are interned: the first buffer that uses a string carries
+    its definition, later ones only a 2-byte id. A codec instance is
+    therefore one end of an ordered stream - the decoder must see every
+    buffer the encoder produced since its last reset() (observe() learns
+    the definitions of a buffer without decoding it). After reset() the
+    encoder re-defines every symbol on first use, so a decoder can pick
+    up a stream at any reset point. Instances are not thread-safe.
+    """
+
+    def __init__(self):
+        self._ids: Dict[str, int] = {}
+        self._new: List[Tuple[int, bytes]] = []
+        self._names: Dict[int, str] = {}
+
+    def reset(self) -> None:
+        """Forget the encoder's symbols (the next buffers re-define them)"""
+        self._ids = {}
+
+    # ==================== Encoding ====================
+
+    def encode_body(self, source: Optional[str], key: Optional[Hashable], data: Any) -> bytes:
+        """Encode (source, key, data) for a container that stores type and time itself"""
+        self._begin()
+        try:
+            source_id = self._symbol(source)
+            key_tag, key_id = self._key(key)
+            encoded = self._pack(_BODY_STRUCTS, BODY_GENERIC, (source_id, key_tag, key_id), data, key, key_tag)
+        except Exception:
+            self._abort()
+            raise
+        return self._finish(encoded)
+
+    def encode_event(self, event: Event) -> bytes:
+        """Encode a complete Event"""
+        self._begin()
+        try:
+            type_id = self._symbol(event.event_type.value)
+            source_id = self._symbol(event.source)
+            key = event.key
+            key_tag, key_id = self._key(key)
+            prefix = (type_id, event.timestamp_ns, source_id, key_tag, key_id)
+            encoded = self._pack(_EVENT_STRUCTS, EVENT_GENERIC, prefix, event.data, key, key_tag)
+        except Exception:
+            self._abort()
+            raise
+        return self._finish(encoded)
+
+    def _begin(self) -> None:
+        if len(self._ids) >= _RESET_AT:
+            self.reset()
+        self._new = []
+
+    def _abort(self) -> None:
+        # Symbols interned by a failed encode were never defined on the wire
+        if self._new:
+            self.reset()
+
+    def _finish(self, encoded: bytes) -> bytes:
+        new = self._new
+        if not new:
+            return _NO_DEFINITIONS + encoded
+        parts = [HEAD.pack(VERSION, len(new))]
+        for symbol_id, raw in new:
+            parts.append(DEFINITION.pack(symbol_id, len(raw)))
+            parts.append(raw)
+        parts.append(encoded)
+        return b"".join(parts)
+
+    def _symbol(self, name: Optional[str]) -> int:
+        ids = self._ids
+        symbol_id = ids.get(name)
+        if symbol_id is not None:
+            return symbol_id
+        if name is None:
+            return NO_SYMBOL
+        if type(name) is not str:
+            raise TypeError(f"Cannot intern {name!r}")
+        raw = name.encode("utf-8")
+        if len(raw) > 255:
+            raise ValueError(f"Symbol too long: {name[:32]!r}...")
+        symbol_id = len(ids)
+        if symbol_id >= NO_SYMBOL:
+            raise OverflowError("Symbol table full")
+        ids[name] = symbol_id
+        self._new.append((symbol_id, raw))
+        return symbol_id
+
+    def _key(self, key: Optional[Hashable]) -> Tuple[int, int]:
+        if key is None:
+            return KEY_NONE, 0
+        if type(key) is str and len(key) <= _MAX_SYMBOL_CHARS:
+            return KEY_SYMBOL, self._symbol(key)
+        return KEY_VALUE, 0
+
+    def _pack(self, structs: Dict[int, struct.Struct], generic: struct.Struct, prefix: tuple,
+              data: Any, key: Any, key_tag: int) -> bytes:
+        schema = SCHEMA_BY_CLASS.get(type(data))
+        encoded = None
+        if schema is not None:
+            try:
+                encoded = self._pack_payload(schema, structs[schema.schema_id], prefix, data)
+            except _PACK_ERRORS:
+                encoded = None
+        if encoded is None:
+            out = bytearray(generic.pack(*prefix, 0))
+            self._write_value(out, data)
+            encoded = out
+        if key_tag == KEY_VALUE:
+            if type(encoded) is not bytearray:
+                encoded = bytearray(encoded)
+            self._write_value(encoded, key)
+        return encoded
+
+    def _pack_payload(self, schema: PayloadSchema, packer: struct.Struct, prefix: tuple, data: Any) -> bytes:
+        values = list(schema.values(data))
+        symbol = self._symbol
+        for i in schema.symbols:
+            values[i] = symbol(values[i])
+        if not schema.texts:
+            return packer.pack(*prefix, schema.schema_id, *values)
+        texts = []
+        for i in schema.texts:
+            text = values[i]
+            if text is None:
+                values[i] = NO_SYMBOL
+                continue
+            raw = text.encode("utf-8")
+            if len(raw) >= NO_SYMBOL:
+                raise ValueError("Text field too long")
+            values[i] = len(raw)
+            texts.append(raw)
+        return packer.pack(*prefix, schema.schema_id, *values) + b"".join(texts)
+
+    def _write_value(self, out: bytearray, value: Any) -> None:
+        kind = type(value)
+        if value is None:
+            out.append(V_NONE)
+        elif kind is bool:
+            out.append(V_TRUE if value else V_FALSE)
+        elif kind is float:
+            out += _FLOAT.pack(V_FLOAT, value)
+        elif kind is int:
+            if -(1 << 63) <= value < (1 << 63):
+                out += _INT.pack(V_INT, value)
+            else:
+                raw = str(value).encode("ascii")
+                out += _LEN.pack(V_BIGINT, len(raw))
+                out += raw
+        elif kind is str:
+            raw = value.encode("utf-8")
+            out += _LEN.pack(V_STR, len(raw))
+            out += raw
+        elif kind is dict:
+            out += _LEN.pack(V_DICT, len(value))
+            for name, item in value.items():
+                if type(name) is str and len(name) <= _MAX_SYMBOL_CHARS and len(self._ids) < NO_SYMBOL:
+                    out += _SYMBOL.pack(V_SYMBOL, self._symbol(name))
+                else:
+                    self._write_value(out, name)
+                self._write_value(out, item)
+        elif kind is list or kind is tuple:
+            out += _LEN.pack(V_LIST if kind is list else V_TUPLE, len(value))
+            for item in value:
+                self._write_value(out, item)
+        elif kind is bytes:
+            out += _LEN.pack(V_BYTES, len(value))
+            out += value
+        elif kind in SCHEMA_BY_CLASS:
+            schema = SCHEMA_BY_CLASS[kind]
+            out.append(V_PAYLOAD)
+            out.append(schema.schema_id)
+            for item in schema.values(value):
+                self._write_value(out, item)
+        else:
+            raw = pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+            out += _LEN.pack(V_PICKLE, len(raw))
+            out += raw
+
+    # ==================== Decoding ====================
+
+    def observe(self, buf: bytes) -> None:
+        """Learn the symbol definitions of a buffer that is not decoded"""
+        self._read_head(buf)
+
+    def decode_body(self, buf: bytes) -> Tuple[Optional[str], Optional[Hashable], Any]:
+        """
+        Decode an encode_body() buffer into (source, key, data)
+
+        Raises:
+            ValueError: Unknown version or undefined symbol
+        """
+        offset = self._read_head(buf)
+        try:
+            values, data, offset = self._unpack(_BODY_STRUCTS, BODY_GENERIC, buf, offset, 3)
+            source_id, key_tag, key_id = values
+            return self._name(source_id), self._read_key(buf, offset, key_tag, key_id), data
+        except KeyError as e:
+            raise ValueError(f"Undefined symbol id {e}") from None
+
+    def decode_event(self, buf: bytes) -> Event:
+        """
+        Decode an encode_event() buffer
+
+        Raises:
+            ValueError: Unknown version, event type or undefined symbol
+        """
+        offset = self._read_head(buf)
+        try:
+            values, data, offset = self._unpack(_EVENT_STRUCTS, EVENT_GENERIC, buf, offset, 5)
+            type_id, timestamp_ns, source_id, key_tag, key_id = values
+            event_type = _EVENT_TYPES[self._names[type_id]]
+            key = self._read_key(buf, offset, key_tag, key_id)
+            return Event(event_type, data, timestamp_ns, self._name(source_id), key)
+        except KeyError as e:
+            raise ValueError(f"Undefined symbol or event type {e}") from None
+
+    def _read_head(self, buf: bytes) -> int:
+        version, count = HEAD.unpack_from(buf, 0)
+        if version != VERSION:
+            raise ValueError(f"Unsupported codec version {version}")
+        offset = HEAD.size
+        names = self._names
+        for _ in range(count):
+            symbol_id, length = DEFINITION.unpack_from(buf, offset)
+            offset += DEFINITION.size
+            names[symbol_id] = str(buf[offset:offset + length], "utf-8")
+            offset += length
+        return offset
+
+    def _name(self, symbol_id: int) -> Optional[str]:
+        return None if symbol_id == NO_SYMBOL else self._names[symbol_id]
+
+    def _unpack(self, structs: Dict[int, struct.Struct], generic: struct.Struct, buf: bytes,
+                offset: int, prefix_len: int) -> Tuple[tuple, Any, int]:
+        """(fixed prefix values, payload, offset after the payload)"""
+        schema_id = buf[offset + generic.size - 1]
+        if not schema_id:
+            values = generic.unpack_from(buf, offset)
+            data, offset = self._read_value(buf, offset + generic.size)
+            return values[:prefix_len], data, offset
+        packer = structs[schema_id]
+        schema = SCHEMA_BY_ID[schema_id]
+        values = packer.unpack_from(buf, offset)
+        offset += packer.size
+        fields = list(values[prefix_len + 1:])
+        names = self._names
+        for i in schema.symbols:
+            symbol_id = fields[i]
+            fields[i] = None if symbol_id == NO_SYMBOL else names[symbol_id]
+        for i in schema.texts:
+            length = fields[i]
+            if length == NO_SYMBOL:
+                fields[i] = None
+            else:
+                fields[i] = str(buf[offset:offset + length], "utf-8")
+                offset += length
+        return values[:prefix_len], schema.cls(*fields), offset
+
+    def _read_key(self, buf: bytes, offset: int, key_tag: int, key_id: int) -> Optional[Hashable]:
+        if key_tag == KEY_SYMBOL:
+            return self._names[key_id]
+        if key_tag == KEY_VALUE:
+            return self._read_value(buf, offset)[0]
+        return None
+
+    def _read_value(self, buf: bytes, offset: int) -> Tuple[Any, int]:
+        tag = buf[offset]
+        offset += 1
+        if tag == V_NONE:
+            return None, offset
+        if tag == V_FALSE:
+            return False, offset
+        if tag == V_TRUE:
+            return True, offset
+        if tag == V_FLOAT:
+            return _F64.unpack_from(buf, offset)[0], offset + 8
+        if tag == V_INT:
+            return _I64.unpack_from(buf, offset)[0], offset + 8
+        if tag == V_SYMBOL:
+            return self._names[_U16.unpack_from(buf, offset)[0]], offset + 2
+        if tag == V_DICT:
+            count = _U32.unpack_from(buf, offset)[0]
+            offset += 4
+            result = {}
+            read = self._read_value
+            for _ in range(count):
+                name, offset = read(buf, offset)
+                result[name], offset = read(buf, offset)
+            return result, offset
+        if tag == V_LIST or tag == V_TUPLE:
+            count = _U32.unpack_from(buf, offset)[0]
+            offset += 4
+            items = []
+            for _ in range(count):
+                item, offset = self._read_value(buf, offset)
+                items.append(item)
+            return (items if tag == V_LIST else tuple(items)), offset
+        if tag == V_PAYLOAD:
+            schema = SCHEMA_BY_ID[buf[offset]]
+            offset += 1
+            fields = []
+            for _ in schema.fields:
+                item, offset = self._read_value(buf, offset)
+                fields.append(item)
+            return schema.cls(*fields), offset
+        if tag in (V_STR, V_BYTES, V_BIGINT, V_PICKLE):
+            length = _U32.unpack_from(buf, offset)[0]
+            offset += 4
+            raw = bytes(buf[offset:offset + length])
+            offset += length
+            if tag == V_STR:
+                return raw.decode("utf-8"), offset
+            if tag == V_BYTES:
+                return raw, offset
+            if tag == V_BIGINT:
+                return int(raw), offset
+            return pickle.loads(raw), offset
+        raise ValueError(f"Unknown value tag {tag}")
@@ -0,0 +1,76 @@
+"""
+PROJECT PREDATOR - Payload Schemas
+Fixed binary layouts for the typed event payloads
+"""
+import struct
+from operator import attrgetter
+from typing import Dict, Sequence, Tuple
+
+from backend.core.payloads import ExposureReport, Fill, OrderRequest, Payload, PositionSnapshot, PriceUpdate
+from backend.market.candle import Candle
+
+# Field kinds
+F64 = "f64"     # float64 (ints are stored as floats)
+I64 = "i64"     # int64
+BOOL = "bool"   # one byte
+SYMBOL = "sym"  # interned low-cardinality string (or None)
+TEXT = "str"    # inline UTF-8 string (or None), e.g. order ids
+
+_FORMATS = {F64: "d", I64: "q", BOOL: "?", SYMBOL: "H", TEXT: "H"}
+
+
+class PayloadSchema:
+    """
+    Binary layout of one Payload class
+
+    Numeric and bool fields go into a single struct; SYMBOL fields are
+    stored as symbol ids and TEXT fields as a length in the struct with
+    the UTF-8 bytes appended after it, in field order. The decoded
+    payload is built positionally, so `fields` must follow the class's
+    constructor order (which is its `_fields` order).
+    """
+
+    def __init__(self, schema_id: int, cls: type, layout: Sequence[Tuple[str, str]]):
+        """
+        Initialize schema
+
+        Args:
+            schema_id: Wire id (1-255, never reused)
+            cls: Payload class
+            layout: (field name, kind) for every field of cls, in order
+        """
+        self.schema_id = schema_id
+        self.cls = cls
+        self.fields = tuple(name for name, _ in layout)
+        if self.fields != cls._fields:
+            raise ValueError(f"Schema for {cls.__name__} does not match its fields")
+        kinds = [kind for _, kind in layout]
+        self.format = "".join(_FORMATS[kind] for kind in kinds)
+        self.symbols = tuple(i for i, kind in enumerate(kinds) if kind == SYMBOL)
+        self.texts = tuple(i for i, kind in enumerate(kinds) if kind == TEXT)
+        self.values = attrgetter(*self.fields)
+        self.struct = struct.Struct("<" + self.format)
+
+
+SCHEMAS: Tuple[PayloadSchema, ...] = (
+    PayloadSchema(1, Candle, [("timestamp", F64), ("open", F64), ("high", F64), ("low", F64),
+                              ("close", F64), ("volume", F64)]),
+    PayloadSchema(2, PriceUpdate, [("symbol", SYMBOL), ("price", F64), ("timestamp", F64), ("fake", BOOL)]),
+    PayloadSchema(3, OrderRequest, [("symbol", SYMBOL), ("side", SYMBOL), ("order_type", SYMBOL),
+                                    ("quantity", F64), ("price", F64), ("order_id", TEXT), ("fake", BOOL)]),
+    PayloadSchema(4, Fill, [("order_id", TEXT), ("symbol", SYMBOL), ("side", SYMBOL), ("quantity", F64),
+                            ("price", F64), ("status", SYMBOL), ("fake", BOOL)]),
+    PayloadSchema(5, PositionSnapshot, [("symbol", SYMBOL), ("qty", F64), ("avg_cost", F64),
+                                        ("last_price", F64), ("unrealized", F64), ("realized", F64),
+                                        ("fake", BOOL)]),
+    PayloadSchema(6, ExposureReport, [("shard", I64), ("gross", F64), ("net", F64), ("positions", I64),
+                                      ("realized", F64), ("unrealized", F64)]),
+)
+
+SCHEMA_BY_ID: Dict[int, PayloadSchema] = {schema.schema_id: schema for schema in SCHEMAS}
+SCHEMA_BY_CLASS: Dict[type, PayloadSchema] = {schema.cls: schema for schema in SCHEMAS}
+
+
+def schema_for(payload: Payload) -> PayloadSchema:
+    """Schema of a payload instance (KeyError if its class has none)"""
+    return SCHEMA_BY_CLASS[type(payload)]
@@ -0,0 +1,30 @@
+"""
+PROJECT PREDATOR - Clock
+Nanosecond clocks used to stamp events
+"""
+import time
+from typing import Callable
+
+# A clock is any zero-argument callable returning UTC epoch nanoseconds
+ClockFn = Callable[[], int]
+
+
+class MonotonicWallClock:
+    """
+    Wall-clock anchored monotonic clock (live mode)
+
+    Reads the wall clock once at construction and advances with
+    time.monotonic_ns() afterwards, so timestamps never jump backwards
+    when NTP adjusts the system clock.
+    """
+
+    def __init__(self):
+        self._anchor_wall_ns = time.time_ns()
+        self._anchor_mono_ns = time.monotonic_ns()
+
+    def now_ns(self) -> int:
+        """Current time as UTC epoch nanoseconds"""
+        return self._anchor_wall_ns + (time.monotonic_ns() - self._anchor_mono_ns)
+
+    def __call__(self) -> int:
+        return self.now_ns()
@@ -0,0 +1,50 @@
+"""
+PROJECT PREDATOR - Component Catalog
+Dotted-path registry of component classes, imported on first use
+"""
+import importlib
+from typing import Dict
+
+# Component name -> "module:Class". Nothing here is imported until resolve()
+COMPONENT_PATHS: Dict[str, str] = {
+    # Agents (FAZ 2 - Blueprint order)
+    "MarketScannerAgent": "backend.agents.market_scanner.agent:MarketScannerAgent",
+    "DataEngineeringAgent": "backend.agents.data_engineering.agent:DataEngineeringAgent",
+    "ExecutionAgent": "backend.agents.execution.agent:ExecutionAgent",
+    "PortfolioManagerAgent": "backend.agents.portfolio.agent:PortfolioManagerAgent",
+    "CRORiskAgent": "backend.agents.cro.agent:CRORiskAgent",
+    "PerformanceKPIAgent": "backend.agents.performance.agent:PerformanceKPIAgent",
+    "ASPAAgent": "backend.agents.aspa.agent:ASPAAgent",
+    "RRSAgent": "backend.agents.rrs.agent:RRSAgent",
+    # Simulation (FAZ 3 - Fake Data Flow)
+    "FakeMarket": "backend.simulation.fake_market:FakeMarket",
+    "FakePriceFeed": "backend.simulation.fake_price_feed:FakePriceFeed",
+    "FakeStrategy": "backend.simulation.fake_strategy:FakeStrategy",
+    # Monitoring
+    "HealthMonitor": "backend.monitor.health:HealthMonitor",
+}
+
+_resolved: Dict[str, type] = {}
+
+
+def resolve(name: str) -> type:
+    """
+    Component class by catalog name (imports its module on first call)
+
+    Args:
+        name: Key of COMPONENT_PATHS, or a "module:Class" path
+
+    Returns:
+        The class
+
+    Raises:
+        KeyError: Unknown name
+        ImportError / AttributeError: Bad path
+    """
+    cls = _resolved.get(name)
+    if cls is None:
+        path = COMPONENT_PATHS[name] if ":" not in name else name
+        module_name, _, class_name = path.partition(":")
+        cls = getattr(importlib.import_module(module_name), class_name)
+        _resolved[name] = cls
+    return cls
@@ -4,8 +4,24 @@ Central configuration loader
 """
 import os
 import logging
+import threading
 from typing import Optional
-from dotenv import load_dotenv
+
+
+def _find_dotenv() -> Optional[str]:
+    """Nearest .env from this package upwards (the lookup load_dotenv() does)"""
+    path = os.path.dirname(os.path.abspath(__file__))
+    while True:
+        candidate = os.path.join(path, ".env")
+        if os.path.isfile(candidate):
+            return candidate
+        parent = os.path.dirname(path)
+        if parent == path:
+            return None
+        path = parent
+
+
+_load_lock = threading.Lock()
 
 
 class Config:
@@ -14,33 +30,79 @@ class Config:
     
     Loads from environment variables.
     No secrets in repo.
+    
+    Loading is deferred to the first attribute access, so importing
+    modules that reference `config` costs nothing; python-dotenv is only
+    imported when a .env file exists. Attributes assigned before the
+    load (e.g. by tests) are kept.
     """
     
-    def __init__(self):
+    def __getattr__(self, name: str):
+        # Only called for missing attributes: load once, then retry
+        if name.startswith("__") or self.__dict__.get("_loaded"):
+            raise AttributeError(name)
+        with _load_lock:
+            if not self.__dict__.get("_loaded"):
+                self._load()
+        return getattr(self, name)
+    
+    def _load(self) -> None:
+        # Parse everything first: readers on other threads see either no
+        # values or all of them, and a bad value leaves the config unloaded,
+        # so the next access raises the same error again
+        values = {}
+        
         # Load .env if it exists
-        load_dotenv()
+        dotenv_path = _find_dotenv()
+        if dotenv_path:
+            from dotenv import load_dotenv
+            load_dotenv(dotenv_path)
         
         # System
-        self.ENVIRONMENT = os.getenv("ENVIRONMENT", "development")
-        self.LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+        values["ENVIRONMENT"] = os.getenv("ENVIRONMENT", "development")
+        values["LOG_LEVEL"] = os.getenv("LOG_LEVEL", "INFO")
         
         # Core Engine
-        self.SCHEDULER_TICK_INTERVAL = float(os.getenv("SCHEDULER_TICK_INTERVAL", "1.0"))
-        self.HEARTBEAT_INTERVAL = float(os.getenv("HEARTBEAT_INTERVAL", "5.0"))
+        values["SCHEDULER_TICK_INTERVAL"] = float(os.getenv("SCHEDULER_TICK_INTERVAL", "1.0"))
+        values["HEARTBEAT_INTERVAL"] = float(os.getenv("HEARTBEAT_INTERVAL", "5.0"))
+        # Threads starting/stopping agents concurrently (1 = serial, deterministic order)
+        values["COMPONENT_START_WORKERS"] = int(os.getenv("COMPONENT_START_WORKERS", "1"))
+        # Seconds between scheduler lag METRIC_PUBLISHED events (0 = off)
+        values["SCHEDULER_METRICS_INTERVAL"] = float(os.getenv("SCHEDULER_METRICS_INTERVAL", "10.0"))
+        
+        # EventBus handler budget (empty = no quarantine)
+        budget = os.getenv("HANDLER_BUDGET_MS", "")
+        values["HANDLER_BUDGET_MS"] = float(budget) if budget else None
+        values["HANDLER_QUARANTINE_AFTER"] = int(os.getenv("HANDLER_QUARANTINE_AFTER", "5"))
         
         # Policy Guard
-        self.GLOBAL_KILL_SWITCH = os.getenv("GLOBAL_KILL_SWITCH", "false").lower() == "true"
-        self.MAX_DAILY_LOSS = float(os.getenv("MAX_DAILY_LOSS", "0.0"))
-        self.MAX_POSITION_SIZE = float(os.getenv("MAX_POSITION_SIZE", "0.0"))
+        values["GLOBAL_KILL_SWITCH"] = os.getenv("GLOBAL_KILL_SWITCH", "false").lower() == "true"
+        values["MAX_DAILY_LOSS"] = float(os.getenv("MAX_DAILY_LOSS", "0.0"))
+        values["MAX_POSITION_SIZE"] = float(os.getenv("MAX_POSITION_SIZE", "0.0"))
+        
+        # Event journal (empty = disabled)
+        values["JOURNAL_DIR"] = os.getenv("JOURNAL_DIR", "")
+        values["JOURNAL_SEGMENT_MB"] = int(os.getenv("JOURNAL_SEGMENT_MB", "64"))
+        
+        # Memory-mapped candle cache for backtest data (empty = disabled)
+        values["CANDLE_CACHE_DIR"] = os.getenv("CANDLE_CACHE_DIR", "")
+        
+        # Symbol-sharded engine (0 = single process)
+        values["SHARD_COUNT"] = int(os.getenv("SHARD_COUNT", "0"))
+        values["MAX_GROSS_EXPOSURE"] = float(os.getenv("MAX_GROSS_EXPOSURE", "0.0"))
+        values["EXPOSURE_REPORT_INTERVAL"] = float(os.getenv("EXPOSURE_REPORT_INTERVAL", "0.5"))
         
         # Monitoring
-        self.HEALTH_CHECK_PORT = int(os.getenv("HEALTH_CHECK_PORT", "8000"))
-        self.METRICS_ENABLED = os.getenv("METRICS_ENABLED", "true").lower() == "true"
+        values["HEALTH_CHECK_PORT"] = int(os.getenv("HEALTH_CHECK_PORT", "8000"))
+        values["METRICS_ENABLED"] = os.getenv("METRICS_ENABLED", "true").lower() == "true"
         
         # Phase Control
-        self.CURRENT_PHASE = int(os.getenv("CURRENT_PHASE", "2"))
-        self.ALLOW_REAL_EXCHANGE = os.getenv("ALLOW_REAL_EXCHANGE", "false").lower() == "true"
-        self.ALLOW_REAL_TRADING = os.getenv("ALLOW_REAL_TRADING", "false").lower() == "true"
+        values["CURRENT_PHASE"] = int(os.getenv("CURRENT_PHASE", "2"))
+        values["ALLOW_REAL_EXCHANGE"] = os.getenv("ALLOW_REAL_EXCHANGE", "false").lower() == "true"
+        values["ALLOW_REAL_TRADING"] = os.getenv("ALLOW_REAL_TRADING", "false").lower() == "true"
+        values.update(self.__dict__)
+        self.__dict__.update(values)
+        self._loaded = True
     
     def validate(self) -> bool:
         """
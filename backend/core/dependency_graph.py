@@ -0,0 +1,151 @@
+"""
+PROJECT PREDATOR - DependencyGraph
+Dependency-ordered, concurrent component start/stop
+"""
+import logging
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Sequence, Set
+
+
+def component_dependencies(component: Any) -> Sequence[str]:
+    """Names a component depends on (components without get_dependencies() have none)"""
+    get_dependencies = getattr(component, "get_dependencies", None)
+    return tuple(get_dependencies()) if get_dependencies is not None else ()
+
+
+class DependencyGraph:
+    """
+    DAG of named components
+
+    An edge A -> B means A depends on B: B starts before A and stops after
+    it. Dependencies on names outside the graph are ignored (with a
+    warning), since they may be satisfied by the registry some other way.
+    run() walks the graph on a thread pool, running each component as
+    soon as everything it waits for has finished, so the total time is
+    bounded by the critical path rather than by the sum. With one worker
+    (the default) components run one at a time in self.order.
+    """
+
+    def __init__(self, components: Sequence[Any]):
+        """
+        Build the graph
+
+        Args:
+            components: Objects with get_name() and optionally get_dependencies()
+
+        Raises:
+            ValueError: Duplicate names or a dependency cycle
+        """
+        self.logger = logging.getLogger(__name__)
+        self.components: Dict[str, Any] = {}
+        for component in components:
+            name = component.get_name()
+            if name in self.components:
+                raise ValueError(f"Duplicate component name: {name}")
+            self.components[name] = component
+        self.dependencies: Dict[str, Set[str]] = {}
+        for name, component in self.components.items():
+            deps = set()
+            for dep in component_dependencies(component):
+                if dep in self.components:
+                    deps.add(dep)
+                else:
+                    self.logger.warning(f"{name} depends on {dep}, which is not managed here")
+            self.dependencies[name] = deps
+        self.order = self._topological_order()
+
+    def _topological_order(self) -> List[str]:
+        # Kahn's algorithm; ties keep registration order
+        remaining = {name: set(deps) for name, deps in self.dependencies.items()}
+        order = []
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(f"Dependency cycle among: {sorted(remaining)}")
+            for name in ready:
+                order.append(name)
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+        return order
+
+    def dependents(self) -> Dict[str, Set[str]]:
+        """Reverse edges: name -> components that depend on it"""
+        reverse: Dict[str, Set[str]] = {name: set() for name in self.components}
+        for name, deps in self.dependencies.items():
+            for dep in deps:
+                reverse[dep].add(name)
+        return reverse
+
+    def run(self, action: Callable[[Any], Any], reverse: bool = False,
+            max_workers: int = 1) -> Dict[str, float]:
+        """
+        Apply action to every component in dependency order
+
+        Args:
+            action: Called with each component (e.g. lambda c: c.start())
+            reverse: Dependents first (shutdown order)
+            max_workers: Thread pool size (1 = serial, topological order)
+
+        Returns:
+            Milliseconds spent in action per component name
+
+        Raises:
+            RuntimeError: An action raised; components waiting on it are skipped
+        """
+        waits_for = self.dependents() if reverse else self.dependencies
+        unblocks = self.dependencies if reverse else self.dependents()
+        pending = {name: set(deps) for name, deps in waits_for.items()}
+        rank = {name: i for i, name in enumerate(reversed(self.order) if reverse else self.order)}
+        durations: Dict[str, float] = {}
+        failures: Dict[str, BaseException] = {}
+
+        def timed(name: str) -> float:
+            started = time.perf_counter()
+            action(self.components[name])
+            return (time.perf_counter() - started) * 1000.0
+
+        if not pending:
+            return durations
+        workers = max(1, min(max_workers, len(pending)))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="component") as pool:
+            running = {}
+
+            def submit_ready() -> None:
+                # No more in flight than workers: the next free worker takes the
+                # lowest-ranked ready component, so one worker replays self.order
+                ready = sorted((name for name, deps in pending.items() if not deps), key=rank.__getitem__)
+                for name in ready[:workers - len(running)]:
+                    del pending[name]
+                    running[pool.submit(timed, name)] = name
+
+            submit_ready()
+            while running:
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = running.pop(future)
+                    error = future.exception()
+                    if error is not None:
+                        failures[name] = error
+                        continue
+                    durations[name] = future.result()
+                    for other in unblocks[name]:
+                        if other in pending:
+                            pending[other].discard(name)
+                if not failures:
+                    submit_ready()
+        if failures:
+            skipped = sorted(pending)
+            detail = ", ".join(f"{name}: {error}" for name, error in failures.items())
+            raise RuntimeError(f"{detail}" + (f" (not run: {', '.join(skipped)})" if skipped else ""))
+        return durations
+
+    def critical_path_ms(self, durations: Dict[str, float], reverse: bool = False) -> float:
+        """Longest chain of durations along dependency edges"""
+        waits_for = self.dependents() if reverse else self.dependencies
+        finish: Dict[str, float] = {}
+        for name in (reversed(self.order) if reverse else self.order):
+            before = max((finish[dep] for dep in waits_for[name]), default=0.0)
+            finish[name] = before + durations.get(name, 0.0)
+        return max(finish.values(), default=0.0)
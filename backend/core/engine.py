@@ -3,13 +3,16 @@ PROJECT PREDATOR - CoreEngine
 Central state machine and orchestrator
 """
 import logging
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional
 from backend.interfaces.engine import IEngine, EngineState
 from backend.core.event_bus import EventBus, EventType
 from backend.core.registry import Registry
 from backend.core.scheduler import Scheduler
 from backend.core.policy_guard import PolicyGuard
 from backend.core.config import config
+from backend.core.dependency_graph import DependencyGraph
+from backend.journal.journal import EventJournal
 
 
 class CoreEngine(IEngine):
@@ -24,27 +27,67 @@ class CoreEngine(IEngine):
     - Enforce platform governance
     
     States: INIT -> BOOTING -> IDLE -> RUNNING -> HALTED
+    
+    Agents and simulations form one dependency graph (get_dependencies()
+    names). By default they start one at a time in topological order
+    (ties in registration order) and stop in the reverse order, so the
+    SYNC handlers they subscribe land in the bus routing table in the
+    same order on every run. With start_workers > 1, independent
+    components start and stop concurrently, each as soon as the
+    components it depends on are up (or, on shutdown, once its
+    dependents are down); boot is then bounded by the critical path, but
+    components in the same level subscribe in whatever order their
+    start() calls finish, so same-type handler dispatch order may vary.
     """
     
-    def __init__(self):
-        """Initialize CoreEngine"""
+    def __init__(self, event_bus: Optional[EventBus] = None, journal_dir: Optional[str] = None,
+                 start_workers: Optional[int] = None):
+        """
+        Initialize CoreEngine
+        
+        Args:
+            event_bus: Bus to run on (None = a new EventBus from config)
+            journal_dir: Journal directory (None = config.JOURNAL_DIR, "" = no journal)
+            start_workers: Threads starting/stopping components (None = config, 1 = serial;
+                           >1 makes subscription order between independent components vary)
+        """
         self.logger = logging.getLogger(__name__)
         self._state = EngineState.INIT
         
         # Core components
-        self.event_bus = EventBus()
+        self.event_bus = event_bus or EventBus(
+            handler_budget_ms=config.HANDLER_BUDGET_MS,
+            quarantine_after=config.HANDLER_QUARANTINE_AFTER
+        )
         self.registry = Registry()
         self.policy_guard = PolicyGuard(self.event_bus)
         self.scheduler = Scheduler(
             self.event_bus,
             tick_interval=config.SCHEDULER_TICK_INTERVAL,
-            heartbeat_interval=config.HEARTBEAT_INTERVAL
+            heartbeat_interval=config.HEARTBEAT_INTERVAL,
+            metrics_interval=config.SCHEDULER_METRICS_INTERVAL
         )
         
+        # Optional event journal (started before anything else subscribes)
+        self.journal: Optional[EventJournal] = None
+        journal_dir = config.JOURNAL_DIR if journal_dir is None else journal_dir
+        if journal_dir:
+            self.journal = EventJournal(
+                self.event_bus,
+                journal_dir,
+                segment_size=config.JOURNAL_SEGMENT_MB * 1024 * 1024
+            )
+        
         # Agent registry (FAZ 2)
         self._agents: List = []
         # Simulation components (FAZ 3)
         self._simulations: List = []
+        # Component lifecycle (dependency graph, per-component timings)
+        self.start_workers = config.COMPONENT_START_WORKERS if start_workers is None else start_workers
+        self._graph: Optional[DependencyGraph] = None
+        self._start_ms: Dict[str, float] = {}
+        self._stop_ms: Dict[str, float] = {}
+        self._lifecycle: Dict[str, dict] = {}
         
         # Register core components
         self.registry.register("EventBus", self.event_bus)
@@ -52,6 +95,8 @@ class CoreEngine(IEngine):
         self.registry.register("PolicyGuard", self.policy_guard)
         self.registry.register("Scheduler", self.scheduler)
         self.registry.register("CoreEngine", self)
+        if self.journal:
+            self.registry.register("EventJournal", self.journal)
         
         self.logger.info("CoreEngine initialized")
     
@@ -89,24 +134,21 @@ class CoreEngine(IEngine):
             if not decision.allowed:
                 raise Exception(f"PolicyGuard denied system start: {decision.reason}")
             
-            # Step 3: Publish boot event
+            # Step 3: Publish boot event (journal first, so it records the boot)
             self.logger.info("[3/5] Publishing boot event...")
+            if self.journal:
+                self.journal.start()
             self.event_bus.publish(
                 EventType.SYSTEM_BOOT,
                 {"phase": config.CURRENT_PHASE, "environment": config.ENVIRONMENT},
                 source="CoreEngine"
             )
             
-            # Step 4: Start agents (FAZ 2) and simulations (FAZ 3)
-            self.logger.info(f"[4/5] Starting {len(self._agents)} agents...")
-            for agent in self._agents:
-                agent.start()
-                self.logger.info(f"  [OK] {agent.get_name()} started")
-            if self._simulations:
-                self.logger.info(f"Starting {len(self._simulations)} simulations...")
-                for sim in self._simulations:
-                    sim.start()
-                    self.logger.info(f"  [OK] {sim.get_name()} started")
+            # Step 4: Start agents (FAZ 2) and simulations (FAZ 3) in dependency order
+            self.logger.info(f"[4/5] Starting {len(self._agents)} agents and "
+                             f"{len(self._simulations)} simulations...")
+            self._graph = DependencyGraph(self._agents + self._simulations)
+            self._start_ms = self._run_lifecycle("start", lambda component: component.start())
             
             # Step 5: Start scheduler
             self.logger.info("[5/5] Starting scheduler...")
@@ -153,14 +195,11 @@ class CoreEngine(IEngine):
             self.logger.info("[1/3] Stopping scheduler...")
             self.scheduler.stop()
             
-            # Step 2: Stop simulations then agents
+            # Step 2: Stop simulations and agents, dependents first
             self.logger.info(f"[2/3] Stopping {len(self._simulations)} simulations and {len(self._agents)} agents...")
-            for sim in self._simulations:
-                sim.stop()
-                self.logger.info(f"  [OK] {sim.get_name()} stopped")
-            for agent in self._agents:
-                agent.stop()
-                self.logger.info(f"  [OK] {agent.get_name()} stopped")
+            if self._graph is None:
+                self._graph = DependencyGraph(self._agents + self._simulations)
+            self._stop_ms = self._run_lifecycle("stop", lambda component: component.stop(), reverse=True)
             
             # Step 3: Publish shutdown event
             self.logger.info("[3/3] Publishing shutdown event...")
@@ -169,6 +208,9 @@ class CoreEngine(IEngine):
                 {"reason": "Normal shutdown"},
                 source="CoreEngine"
             )
+            self.event_bus.shutdown()
+            if self.journal:
+                self.journal.stop()
             
             # Transition to HALTED
             self._state = EngineState.HALTED
@@ -181,6 +223,23 @@ class CoreEngine(IEngine):
             self._state = EngineState.ERROR
             return False
     
+    def _run_lifecycle(self, phase: str, action, reverse: bool = False) -> Dict[str, float]:
+        """Start or stop every component on the dependency graph; log and keep timings"""
+        started = time.perf_counter()
+        durations = self._graph.run(action, reverse=reverse, max_workers=self.start_workers)
+        total_ms = (time.perf_counter() - started) * 1000.0
+        done = "started" if phase == "start" else "stopped"
+        for name in (reversed(self._graph.order) if reverse else self._graph.order):
+            self.logger.info(f"  [OK] {name} {done} ({durations[name]:.1f} ms)")
+        critical_ms = self._graph.critical_path_ms(durations, reverse=reverse)
+        self._lifecycle[phase] = {
+            "total_ms": total_ms,
+            "sum_ms": sum(durations.values()),
+            "critical_path_ms": critical_ms
+        }
+        self.logger.info(f"Components {done} in {total_ms:.1f} ms (critical path {critical_ms:.1f} ms)")
+        return durations
+    
     def register_agent(self, agent) -> None:
         """
         Register an agent (FAZ 2)
@@ -218,9 +277,17 @@ class CoreEngine(IEngine):
                 "event_bus": self.event_bus.get_stats(),
                 "registry": self.registry.get_stats(),
                 "policy_guard": self.policy_guard.get_stats(),
-                "scheduler": self.scheduler.get_stats()
+                "scheduler": self.scheduler.get_stats(),
+                "journal": self.journal.get_stats() if self.journal else None
             },
             "agents": [agent.get_name() for agent in self._agents],
             "simulations": [sim.get_name() for sim in self._simulations],
+            "lifecycle": {
+                **self._lifecycle,
+                "components": {
+                    name: {"start_ms": self._start_ms.get(name), "stop_ms": self._stop_ms.get(name)}
+                    for name in (self._graph.order if self._graph else [])
+                }
+            },
             "phase": config.CURRENT_PHASE
         }
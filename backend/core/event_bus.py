@@ -2,11 +2,18 @@
 PROJECT PREDATOR - EventBus
 Central pub/sub event system for component communication
 """
+import itertools
 import logging
-from typing import Callable, Dict, List, Any
-from dataclasses import dataclass
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Any, Hashable, Iterable, List, Optional, Tuple
 from datetime import datetime, timezone
-from enum import Enum
+from enum import Enum, IntEnum
+from backend.core.clock import ClockFn, MonotonicWallClock
+from backend.core.handler_stats import HandlerStats, handler_name
+from backend.core.subscriber_queue import SubscriberQueue, QueuedHandler, BackpressurePolicy
+from backend.monitor.histogram import LatencyHistogram
 
 
 class EventType(Enum):
@@ -27,6 +34,7 @@ class EventType(Enum):
     # Simulation / fake data (Phase 3)
     FAKE_CANDLE = "FAKE_CANDLE"
     MARKET_REGIME = "MARKET_REGIME"
+    REPLAY_START = "REPLAY_START"
     
     # Market data events (stub)
     MARKET_TICK = "MARKET_TICK"
@@ -40,6 +48,7 @@ class EventType(Enum):
     
     # Portfolio events (stub)
     POSITION_UPDATE = "POSITION_UPDATE"
+    EXPOSURE_UPDATE = "EXPOSURE_UPDATE"
     
     # Risk events (stub)
     RISK_CHECK = "RISK_CHECK"
@@ -53,15 +62,105 @@ class EventType(Enum):
     # Infrastructure events (stub)
     HEALTH_CHECK = "HEALTH_CHECK"
     METRIC_PUBLISHED = "METRIC_PUBLISHED"
+    
+    # Members are singletons: identity hashing keeps dict/set lookups on the
+    # publish hot path in C instead of Enum's Python-level __hash__.
+    __hash__ = object.__hash__
+
+
+# Event types that are always logged at WARNING level when published
+CRITICAL_EVENT_TYPES = frozenset({
+    EventType.SYSTEM_ERROR,
+    EventType.RISK_BREACH,
+    EventType.KILL_SWITCH_ACTIVATED,
+})
+
+
+class EventPriority(IntEnum):
+    """Dispatch priority class (lower value = served first)"""
+    CRITICAL = 0     # Kill switch, risk breach, system error
+    CONTROL = 1      # Orders, fills, lifecycle, scheduler
+    MARKET_DATA = 2  # Candles, prices, positions, regimes, metrics
+
+
+_MARKET_DATA_EVENT_TYPES = frozenset({
+    EventType.CANDLE_EVENT,
+    EventType.PRICE_UPDATE,
+    EventType.FAKE_CANDLE,
+    EventType.MARKET_REGIME,
+    EventType.MARKET_TICK,
+    EventType.POSITION_UPDATE,
+    EventType.EXPOSURE_UPDATE,
+    EventType.PERFORMANCE_UPDATE,
+    EventType.BACKTEST_METRIC,
+    EventType.METRIC_PUBLISHED,
+})
+
+# EventType -> EventPriority (every type has an entry)
+EVENT_PRIORITIES: Dict[EventType, EventPriority] = {
+    event_type: (
+        EventPriority.CRITICAL if event_type in CRITICAL_EVENT_TYPES
+        else EventPriority.MARKET_DATA if event_type in _MARKET_DATA_EVENT_TYPES
+        else EventPriority.CONTROL
+    )
+    for event_type in EventType
+}
+
+
+class DispatchMode(Enum):
+    """How a subscription receives events"""
+    SYNC = "SYNC"    # Handler runs on the publisher's thread
+    ASYNC = "ASYNC"  # Handler runs on its own worker behind a bounded queue
 
 
-@dataclass
 class Event:
-    """Event data structure"""
-    event_type: EventType
-    data: Any
-    timestamp: datetime
-    source: str
+    """
+    Event data structure
+    
+    Slotted record stamped with integer UTC epoch nanoseconds. The
+    timezone-aware `timestamp` datetime is derived on access only.
+    `key` is the routing key the event was published with (or None).
+    """
+    __slots__ = ("event_type", "data", "timestamp_ns", "source", "key")
+    
+    def __init__(self, event_type: EventType, data: Any, timestamp_ns: int, source: str,
+                 key: Optional[Hashable] = None):
+        self.event_type = event_type
+        self.data = data
+        self.timestamp_ns = timestamp_ns
+        self.source = source
+        self.key = key
+    
+    @property
+    def timestamp(self) -> datetime:
+        """Event time as a timezone-aware UTC datetime"""
+        return datetime.fromtimestamp(self.timestamp_ns / 1e9, tz=timezone.utc)
+    
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Event):
+            return NotImplemented
+        return (self.event_type is other.event_type and self.data == other.data
+                and self.timestamp_ns == other.timestamp_ns and self.source == other.source
+                and self.key == other.key)
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return (f"Event(event_type={self.event_type}, data={self.data!r}, "
+                f"timestamp_ns={self.timestamp_ns}, source={self.source!r}, key={self.key!r})")
+
+
+class _Cascade:
+    """Per-thread run-to-completion work queue (reused across root events)"""
+    
+    __slots__ = ("active", "urgent", "pending", "queued", "truncated")
+    
+    def __init__(self):
+        self.active = False
+        self.urgent: deque = deque()   # CRITICAL events, drained first
+        self.pending: deque = deque()  # everything else, FIFO
+        self.queued = 0
+        self.truncated = False
 
 
 class EventBus:
@@ -73,78 +172,554 @@ class EventBus:
     - Loose coupling
     - Observability
     - Auditability
+    
+    Subscriptions are synchronous by default. ASYNC subscriptions get a
+    bounded SubscriberQueue with its own worker, so a slow handler does
+    not hold up the publisher. ASYNC subscriptions that name the same
+    `group` (typically the agent name) share one queue and worker.
+    
+    Every EventType has an EventPriority. Queued events sit in one lane
+    per priority and workers always drain CRITICAL first; the CRITICAL
+    lane bypasses backpressure. So a kill switch overtakes any backlog
+    of market data queued for the same subscriber, and its
+    publish-to-handler latency is reported per priority in get_stats().
+    
+    Subscriptions are routed: a wildcard subscription (key=None) sees
+    every event of its type, a keyed subscription (e.g. key="BTC/USD")
+    only sees events published with that routing key. Publishers pass
+    the key explicitly, so dispatch never inspects the payload.
+    
+    The routing table is copy-on-write: subscribe/unsubscribe build a
+    new table under a writer lock and swap it in with a single reference
+    assignment. Publishers read whatever table is current without
+    locking, so publish() is safe from any number of threads.
+    
+    Events are stamped by an injectable nanosecond clock: a monotonic
+    wall clock in live mode, the simulation TimeSource during replay.
+    
+    Every (EventType, handler) pair keeps a latency histogram and call /
+    error counters. With a handler budget configured, a SYNC handler that
+    overruns it `quarantine_after` times in a row is quarantined: it is
+    moved onto its own ASYNC queue so it stops stalling the publisher.
+    
+    In run-to-completion mode, publish() called from inside a handler
+    does not dispatch recursively. The event is appended to a per-thread
+    FIFO work queue that the outermost publish() drains iteratively
+    (CRITICAL events overtake the queue). A cascade such as FAKE_CANDLE -> PRICE_UPDATE ->
+    ... -> POSITION_UPDATE then runs breadth-first at constant stack
+    depth, and max_cascade bounds how many events one root event may
+    trigger (CRITICAL events are never capped).
     """
     
-    def __init__(self):
+    def __init__(self, clock: Optional[ClockFn] = None,
+                 handler_budget_ms: Optional[float] = None,
+                 quarantine_after: int = 5,
+                 run_to_completion: bool = False,
+                 max_cascade: Optional[int] = None):
+        """
+        Initialize EventBus
+        
+        Args:
+            clock: Callable returning UTC epoch nanoseconds
+                   (defaults to MonotonicWallClock)
+            handler_budget_ms: Per-call latency budget for handlers
+                               (None disables quarantine)
+            quarantine_after: Consecutive budget overruns before a SYNC
+                              handler is quarantined
+            run_to_completion: Queue events published from handlers and
+                               drain them iteratively instead of recursing
+            max_cascade: Max events queued per root event in
+                         run-to-completion mode (None = unbounded)
+        """
         self.logger = logging.getLogger(__name__)
-        self._subscribers: Dict[EventType, List[Callable]] = {}
+        self._clock: ClockFn = clock or MonotonicWallClock().now_ns
+        self._handler_budget_ns = int(handler_budget_ms * 1_000_000) if handler_budget_ms is not None else None
+        self._quarantine_after = quarantine_after
+        # Route -> tuple of (entry, HandlerStats or None). Never mutated in place.
+        # Route is the EventType (wildcard) or (EventType, key). SYNC entries
+        # carry their stats; ASYNC entries are timed by their queue worker.
+        self._subscribers: Dict[Any, Tuple[Tuple[Callable, Optional[HandlerStats]], ...]] = {}
+        # (EventType, handler) -> HandlerStats, shared by all routing keys
+        self._handler_stats: Dict[Tuple[EventType, Callable], HandlerStats] = {}
+        # (EventType, handler) -> batch entry point. Copy-on-write as well.
+        self._batch_handlers: Dict[Tuple[EventType, Callable], Callable] = {}
+        # (EventType, key, handler) -> (queue id, entry) for ASYNC subscriptions
+        self._async_entries: Dict[Tuple[EventType, Optional[Hashable], Callable], Tuple[Any, QueuedHandler]] = {}
+        # queue id (group name or subscription tuple) -> queue / reference count
+        self._queues: Dict[Any, SubscriberQueue] = {}
+        self._queue_refs: Dict[Any, int] = {}
+        self._write_lock = threading.Lock()
+        # next() on itertools.count is atomic under the GIL
+        self._event_seq = itertools.count(1)
         self._event_count = 0
+        
+        # Run-to-completion state: the work queue lives on the publishing thread
+        self._run_to_completion = run_to_completion
+        self._max_cascade = max_cascade
+        self._local = threading.local()
+        self._cascades = 0
+        self._max_cascade_seen = 0
+        self._cascade_dropped = 0
         self.logger.info("EventBus initialized")
     
-    def subscribe(self, event_type: EventType, handler: Callable) -> None:
+    @staticmethod
+    def _route(event_type: EventType, key: Optional[Hashable]) -> Any:
+        return event_type if key is None else (event_type, key)
+    
+    def subscribe(self, event_type: EventType, handler: Callable,
+                  mode: DispatchMode = DispatchMode.SYNC,
+                  queue_size: int = 1024,
+                  backpressure: BackpressurePolicy = BackpressurePolicy.BLOCK,
+                  batch_handler: Optional[Callable[[List["Event"]], None]] = None,
+                  key: Optional[Hashable] = None,
+                  conflate: bool = False,
+                  group: Optional[str] = None) -> None:
         """
         Subscribe to an event type
         
         Args:
             event_type: Type of event to subscribe to
             handler: Callback function to handle the event
+            mode: SYNC (publisher thread) or ASYNC (dedicated worker)
+            queue_size: Max pending events for an ASYNC subscription
+            backpressure: Policy applied when the ASYNC queue is full
+            batch_handler: Optional vectorised entry point called once with
+                           the full event list by publish_batch() (SYNC only)
+            key: Routing key (e.g. symbol); None subscribes to all keys
+            conflate: ASYNC only - keep just the latest pending event per
+                      (EventType, key) instead of queueing every update
+            group: ASYNC only - subscriptions with the same group share one
+                   queue/worker (queue_size/backpressure of the first win)
         """
-        if event_type not in self._subscribers:
-            self._subscribers[event_type] = []
-        
-        self._subscribers[event_type].append(handler)
-        self.logger.info(f"Subscribed to {event_type.value}: {handler.__name__}")
+        route = self._route(event_type, key)
+        with self._write_lock:
+            stats = self._handler_stats.get((event_type, handler))
+            if stats is None:
+                stats = HandlerStats(event_type, handler_name(handler),
+                                     budget_ns=self._handler_budget_ns,
+                                     quarantine_after=self._quarantine_after)
+                self._handler_stats[(event_type, handler)] = stats
+            
+            if mode == DispatchMode.ASYNC:
+                queue_id = group if group is not None else (event_type, key, handler)
+                queue = self._queues.get(queue_id)
+                if queue is None:
+                    queue = SubscriberQueue(
+                        name=group or f"{event_type.value}:{handler.__name__}" + (f"[{key}]" if key is not None else ""),
+                        maxsize=queue_size,
+                        policy=backpressure,
+                        lanes=len(EventPriority)
+                    )
+                    queue.start()
+                    self._queues[queue_id] = queue
+                    self._queue_refs[queue_id] = 0
+                self._queue_refs[queue_id] += 1
+                entry = queue.bind(handler, lane=EVENT_PRIORITIES[event_type], conflate=conflate, stats=stats)
+                self._async_entries[(event_type, key, handler)] = (queue_id, entry)
+                pair = (entry, None)
+            else:
+                pair = (handler, stats)
+            
+            if batch_handler is not None and mode == DispatchMode.SYNC:
+                batch_table = dict(self._batch_handlers)
+                batch_table[(event_type, handler)] = batch_handler
+                self._batch_handlers = batch_table
+            
+            table = dict(self._subscribers)
+            table[route] = table.get(route, ()) + (pair,)
+            self._subscribers = table
+        suffix = f" [key={key}]" if key is not None else ""
+        self.logger.info(f"Subscribed to {event_type.value}{suffix}: {handler.__name__} ({mode.value})")
     
-    def unsubscribe(self, event_type: EventType, handler: Callable) -> None:
+    def unsubscribe(self, event_type: EventType, handler: Callable, key: Optional[Hashable] = None) -> None:
         """
         Unsubscribe from an event type
         
         Args:
             event_type: Type of event to unsubscribe from
             handler: Callback function to remove
+            key: Routing key used when subscribing
         """
-        if event_type in self._subscribers:
-            try:
-                self._subscribers[event_type].remove(handler)
-                self.logger.info(f"Unsubscribed from {event_type.value}: {handler.__name__}")
-            except ValueError:
+        route = self._route(event_type, key)
+        with self._write_lock:
+            handlers = self._subscribers.get(route)
+            if handlers is None:
+                return
+            queue_id, entry = self._async_entries.get((event_type, key, handler), (None, handler))
+            index = next((i for i, pair in enumerate(handlers) if pair[0] == entry), None)
+            if index is None:
                 self.logger.warning(f"Handler {handler.__name__} not found for {event_type.value}")
+                return
+            
+            remaining = handlers[:index] + handlers[index + 1:]
+            table = dict(self._subscribers)
+            if remaining:
+                table[route] = remaining
+            else:
+                del table[route]
+            self._subscribers = table
+            
+            queue = None
+            if queue_id is not None:
+                del self._async_entries[(event_type, key, handler)]
+                self._queue_refs[queue_id] -= 1
+                if self._queue_refs[queue_id] == 0:
+                    del self._queue_refs[queue_id]
+                    queue = self._queues.pop(queue_id)
+            if (event_type, handler) in self._batch_handlers:
+                batch_table = dict(self._batch_handlers)
+                del batch_table[(event_type, handler)]
+                self._batch_handlers = batch_table
+            # Last route of this handler gone: forget its stats, so a later
+            # subscribe starts clean (not quarantined, empty histogram)
+            if not self._is_subscribed(event_type, handler):
+                self._handler_stats.pop((event_type, handler), None)
+        
+        # Drain outside the writer lock; the worker may still be delivering
+        if queue is not None:
+            queue.stop()
+        self.logger.info(f"Unsubscribed from {event_type.value}: {handler.__name__}")
+    
+    def _is_subscribed(self, event_type: EventType, handler: Callable) -> bool:
+        """Whether any route of event_type still holds handler (call under _write_lock)"""
+        if any(entry[0] == event_type and entry[2] == handler for entry in self._async_entries):
+            return True
+        for route, handlers in self._subscribers.items():
+            route_type = route if isinstance(route, EventType) else route[0]
+            if route_type == event_type and any(pair[0] == handler for pair in handlers):
+                return True
+        return False
+    
+    def _quarantine(self, event_type: EventType, handler: Callable, stats: HandlerStats) -> Optional[QueuedHandler]:
+        """
+        Move a slow SYNC handler onto its own ASYNC queue
+        
+        Every route of the event type that holds the handler is rewritten,
+        so keyed subscriptions are isolated as well. The handler keeps its
+        HandlerStats (now recorded by the queue worker) and can still be
+        removed with unsubscribe().
+        
+        Returns:
+            The queue entry now standing in for the handler (None if the
+            handler was already quarantined or unsubscribed meanwhile)
+        """
+        with self._write_lock:
+            if stats.quarantined:
+                return None
+            stats.quarantined = True
+            queue_id = ("quarantine", event_type, handler)
+            queue = SubscriberQueue(
+                name=f"quarantine:{stats.name}",
+                maxsize=10000,
+                policy=BackpressurePolicy.BLOCK,
+                lanes=len(EventPriority)
+            )
+            queue.start()
+            entry = queue.bind(handler, lane=EVENT_PRIORITIES[event_type], stats=stats)
+            
+            table = dict(self._subscribers)
+            refs = 0
+            for route, handlers in self._subscribers.items():
+                route_type, key = (route, None) if isinstance(route, EventType) else route
+                if route_type != event_type:
+                    continue
+                if not any(pair[0] == handler for pair in handlers):
+                    continue
+                table[route] = tuple((entry, None) if pair[0] == handler else pair for pair in handlers)
+                self._async_entries[(event_type, key, handler)] = (queue_id, entry)
+                refs += 1
+            if not refs:
+                stats.quarantined = False
+                queue.stop()
+                return None
+            self._queues[queue_id] = queue
+            self._queue_refs[queue_id] = refs
+            self._subscribers = table
+        self.logger.warning(
+            f"Quarantined slow handler {stats.name} on {event_type.value}: "
+            f"{stats.consecutive_overruns} consecutive calls over "
+            f"{stats.budget_ns / 1e6:.3f}ms budget"
+        )
+        return entry
+    
+    def _handlers_for(self, event_type: EventType,
+                      key: Optional[Hashable]) -> Tuple[Tuple[Callable, Optional[HandlerStats]], ...]:
+        """Wildcard handlers followed by handlers for the routing key"""
+        table = self._subscribers
+        handlers = table.get(event_type, ())
+        if key is not None:
+            keyed = table.get((event_type, key))
+            if keyed:
+                handlers = handlers + keyed if handlers else keyed
+        return handlers
     
-    def publish(self, event_type: EventType, data: Any, source: str = "unknown") -> None:
+    def publish(self, event_type: EventType, data: Any, source: str = "unknown",
+                key: Optional[Hashable] = None) -> None:
         """
         Publish an event
         
+        In run-to-completion mode, a publish from inside a handler only
+        queues the event; it is delivered once the current handler returns
+        and the events queued before it have been dispatched.
+        
         Args:
             event_type: Type of event
             data: Event data
             source: Source component name
+            key: Routing key (e.g. symbol) for keyed subscribers
         """
-        event = Event(
-            event_type=event_type,
-            data=data,
-            timestamp=datetime.now(timezone.utc),
-            source=source
-        )
-        
-        self._event_count += 1
+        self._event_count = next(self._event_seq)
         
         # Log critical events
-        if event_type in [EventType.SYSTEM_ERROR, EventType.RISK_BREACH, 
-                          EventType.KILL_SWITCH_ACTIVATED]:
+        if event_type in CRITICAL_EVENT_TYPES:
             self.logger.warning(f"CRITICAL EVENT: {event_type.value} from {source}")
         
-        # Notify all subscribers
-        if event_type in self._subscribers:
-            for handler in self._subscribers[event_type]:
+        # Fast path: nobody listens, so never build the Event or read the clock.
+        # (_handlers_for inlined: this is the hottest path in a backtest.)
+        table = self._subscribers
+        handlers = table.get(event_type, ())
+        if key is not None:
+            keyed = table.get((event_type, key))
+            if keyed:
+                handlers = handlers + keyed if handlers else keyed
+        if not handlers:
+            return
+        
+        event = Event(event_type, data, self._clock(), source, key)
+        if not self._run_to_completion:
+            self._dispatch(event_type, handlers, event)
+            return
+        # Inlined deferral for the common case (uncapped, non-critical)
+        cascade = getattr(self._local, "cascade", None)
+        if (cascade is not None and cascade.active and self._max_cascade is None
+                and event_type not in CRITICAL_EVENT_TYPES):
+            cascade.pending.append((self._dispatch, (event_type, handlers, event)))
+            return
+        self._run(event_type, self._dispatch, (event_type, handlers, event))
+    
+    def publish_event(self, event: Event) -> None:
+        """
+        Publish an already stamped event
+        
+        Same delivery as publish(), but the event keeps its timestamp, so
+        a caller that also hands it elsewhere (e.g. a transport) reads the
+        clock once and both copies agree.
+        
+        Args:
+            event: Event to deliver
+        """
+        event_type = event.event_type
+        self._event_count = next(self._event_seq)
+        
+        if event_type in CRITICAL_EVENT_TYPES:
+            self.logger.warning(f"CRITICAL EVENT: {event_type.value} from {event.source}")
+        
+        handlers = self._handlers_for(event_type, event.key)
+        if not handlers:
+            return
+        if not self._run_to_completion:
+            self._dispatch(event_type, handlers, event)
+            return
+        self._run(event_type, self._dispatch, (event_type, handlers, event))
+    
+    def _dispatch(self, event_type: EventType,
+                  handlers: Tuple[Tuple[Callable, Optional[HandlerStats]], ...],
+                  event: Event) -> None:
+        """Deliver one event to a handler snapshot"""
+        perf_counter_ns = time.perf_counter_ns
+        for handler, stats in handlers:
+            if stats is None:
+                try:
+                    handler(event)
+                except Exception as e:
+                    self.logger.error(f"Error in event handler {handler.__name__}: {e}")
+                continue
+            started = perf_counter_ns()
+            try:
+                handler(event)
+            except Exception as e:
+                stats.errors += 1
+                self.logger.error(f"Error in event handler {handler.__name__}: {e}")
+            if stats.record(perf_counter_ns() - started):
+                self._quarantine(event_type, handler, stats)
+    
+    def publish_batch(self, event_type: EventType, payloads: Iterable[Any], source: str = "unknown",
+                      key: Optional[Hashable] = None) -> int:
+        """
+        Publish many events of one type in a single dispatch
+        
+        The subscriber snapshot is read once and all events share one clock
+        reading. Subscribers registered with a batch_handler receive the
+        whole list in one call; the others receive the events one by one.
+        Each subscriber sees the events in order, but subscribers are
+        served one after another rather than interleaved per event.
+        
+        Args:
+            event_type: Type of every event in the batch
+            payloads: Event data, one item per event
+            source: Source component name
+            key: Routing key shared by every event in the batch
+        
+        Returns:
+            Number of events published
+        """
+        payloads = payloads if isinstance(payloads, (list, tuple)) else list(payloads)
+        count = len(payloads)
+        if not count:
+            return 0
+        # Advance the shared counter by `count` in C
+        self._event_count = next(itertools.islice(self._event_seq, count - 1, None))
+        
+        if event_type in CRITICAL_EVENT_TYPES:
+            self.logger.warning(f"CRITICAL EVENT: {event_type.value} x{count} from {source}")
+        
+        handlers = self._handlers_for(event_type, key)
+        if not handlers:
+            return count
+        
+        timestamp_ns = self._clock()
+        events = [Event(event_type, data, timestamp_ns, source, key) for data in payloads]
+        if self._run_to_completion:
+            self._run(event_type, self._dispatch_batch, (event_type, key, handlers, events))
+        else:
+            self._dispatch_batch(event_type, key, handlers, events)
+        return count
+    
+    def _dispatch_batch(self, event_type: EventType, key: Optional[Hashable],
+                        handlers: Tuple[Tuple[Callable, Optional[HandlerStats]], ...],
+                        events: List[Event]) -> None:
+        """Deliver a batch of events to a handler snapshot"""
+        count = len(events)
+        batch_handlers = self._batch_handlers
+        perf_counter_ns = time.perf_counter_ns
+        for handler, stats in handlers:
+            batch_handler = batch_handlers.get((event_type, handler))
+            if batch_handler is not None:
+                # One sample for the whole batch, spread evenly per event
+                started = perf_counter_ns()
+                try:
+                    batch_handler(events)
+                except Exception as e:
+                    stats.errors += 1
+                    self.logger.error(f"Error in batch event handler {batch_handler.__name__}: {e}")
+                if stats.record((perf_counter_ns() - started) // count):
+                    self._quarantine(event_type, handler, stats)
+                continue
+            for event in events:
+                if stats is None:
+                    try:
+                        handler(event)
+                    except Exception as e:
+                        self.logger.error(f"Error in event handler {handler.__name__}: {e}")
+                    continue
+                started = perf_counter_ns()
                 try:
                     handler(event)
                 except Exception as e:
+                    stats.errors += 1
                     self.logger.error(f"Error in event handler {handler.__name__}: {e}")
+                if stats.record(perf_counter_ns() - started):
+                    entry = self._quarantine(event_type, handler, stats)
+                    if entry is not None:
+                        # Remaining events go through the new quarantine queue
+                        handler, stats = entry, None
+    
+    def _run(self, event_type: EventType, dispatch: Callable, args: tuple) -> None:
+        """
+        Run-to-completion driver
+        
+        Inside a handler (this thread is already draining) the dispatch is
+        deferred to the work queue. Otherwise this is a root event: it is
+        dispatched, then the queue is drained until the cascade is done.
+        CRITICAL events go to a separate queue that is always drained first.
+        """
+        cascade = getattr(self._local, "cascade", None)
+        if cascade is None:
+            cascade = self._local.cascade = _Cascade()
+        
+        if cascade.active:
+            # CRITICAL events neither count against nor are stopped by the cap
+            if event_type in CRITICAL_EVENT_TYPES:
+                cascade.urgent.append((dispatch, args))
+                return
+            if self._max_cascade is not None:
+                if cascade.queued >= self._max_cascade:
+                    self._cascade_dropped += 1
+                    if not cascade.truncated:
+                        cascade.truncated = True
+                        self.logger.warning(
+                            f"Cascade cap of {self._max_cascade} events reached; "
+                            f"dropping {event_type.value} and further events from this root"
+                        )
+                    return
+                cascade.queued += 1
+            cascade.pending.append((dispatch, args))
+            return
+        
+        cascade.active = True
+        cascade.queued = 0
+        cascade.truncated = False
+        urgent = cascade.urgent
+        pending = cascade.pending
+        drained = 0
+        try:
+            dispatch(*args)
+            while urgent or pending:
+                if urgent:
+                    dispatch, args = urgent.popleft()
+                else:
+                    dispatch, args = pending.popleft()
+                    drained += 1
+                dispatch(*args)
+        except BaseException:
+            # A handler escaped with e.g. KeyboardInterrupt: drop the rest
+            urgent.clear()
+            pending.clear()
+            raise
+        finally:
+            cascade.active = False
+            self._cascades += 1
+            if drained > self._max_cascade_seen:
+                self._max_cascade_seen = drained
+    
+    def set_clock(self, clock: ClockFn) -> None:
+        """
+        Replace the clock used to stamp events
+        
+        Args:
+            clock: Callable returning UTC epoch nanoseconds
+        """
+        self._clock = clock
+    
+    def shutdown(self) -> None:
+        """Stop all ASYNC subscriber workers (pending events are drained first)"""
+        for (event_type, key, handler) in list(self._async_entries):
+            self.unsubscribe(event_type, handler, key=key)
     
     def get_stats(self) -> dict:
         """Get EventBus statistics"""
+        queues = list(self._queues.values())
+        queue_stats = [queue.get_stats() for queue in queues]
+        latency = [LatencyHistogram() for _ in EventPriority]
+        for queue in queues:
+            for lane, histogram in enumerate(queue.wait_histograms()):
+                latency[lane].merge(histogram)
         return {
             "total_events_published": self._event_count,
             "subscriber_count": sum(len(handlers) for handlers in self._subscribers.values()),
-            "event_types_subscribed": len(self._subscribers)
+            "event_types_subscribed": len({route if isinstance(route, EventType) else route[0]
+                                           for route in self._subscribers}),
+            "routing_keys": sum(1 for route in self._subscribers if not isinstance(route, EventType)),
+            "events_conflated": sum(q["conflated"] for q in queue_stats),
+            "async_queues": queue_stats,
+            "latency_by_priority": {
+                priority.name: latency[priority].summary() for priority in EventPriority
+            },
+            "handlers": [stats.get_stats() for stats in list(self._handler_stats.values())],
+            "run_to_completion": {
+                "enabled": self._run_to_completion,
+                "cascades": self._cascades,
+                "max_cascade_size": self._max_cascade_seen,
+                "cascade_dropped": self._cascade_dropped
+            }
         }
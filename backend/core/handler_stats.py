@@ -0,0 +1,90 @@
+"""
+PROJECT PREDATOR - HandlerStats
+Per-handler invocation timing for the EventBus
+"""
+from typing import Callable, Optional
+from backend.monitor.histogram import LatencyHistogram
+
+
+def handler_name(handler: Callable) -> str:
+    """Qualified name used to key handler statistics"""
+    return getattr(handler, "__qualname__", None) or getattr(handler, "__name__", None) or repr(handler)
+
+
+class HandlerStats(LatencyHistogram):
+    """
+    Timing and error counters for one (EventType, handler) pair
+
+    A LatencyHistogram of handler run times plus error and budget
+    counters. record() is on the dispatch hot path, so it updates the
+    buckets inline rather than delegating to the base class.
+
+    Updated from the dispatching thread without locking; concurrent
+    publishers may occasionally lose an increment, which is acceptable
+    for monitoring data.
+    """
+
+    __slots__ = ("event_type", "name", "errors", "budget_ns", "overruns",
+                 "consecutive_overruns", "quarantine_after", "quarantined")
+
+    def __init__(self, event_type, name: str, budget_ns: Optional[int] = None, quarantine_after: int = 5):
+        """
+        Initialize handler stats
+
+        Args:
+            event_type: EventType the handler is subscribed to
+            name: Handler qualname
+            budget_ns: Latency budget per call (None = no budget)
+            quarantine_after: Consecutive budget overruns before quarantine
+        """
+        super().__init__()
+        self.event_type = event_type
+        self.name = name
+        self.errors = 0
+        self.budget_ns = budget_ns
+        self.overruns = 0
+        self.consecutive_overruns = 0
+        self.quarantine_after = max(1, quarantine_after)
+        self.quarantined = False
+
+    def record(self, elapsed_ns: int) -> bool:
+        """
+        Record one invocation
+
+        Args:
+            elapsed_ns: Handler run time in nanoseconds
+
+        Returns:
+            True when the handler has just crossed the quarantine threshold
+        """
+        index = (elapsed_ns // 1000).bit_length() if elapsed_ns > 0 else 0
+        self._counts[index if index < self.NUM_BUCKETS else self.NUM_BUCKETS - 1] += 1
+        self._count += 1
+        self._total_ns += elapsed_ns
+        if elapsed_ns > self._max_ns:
+            self._max_ns = elapsed_ns
+        budget = self.budget_ns
+        if budget is None:
+            return False
+        if elapsed_ns <= budget:
+            self.consecutive_overruns = 0
+            return False
+        self.overruns += 1
+        self.consecutive_overruns += 1
+        return not self.quarantined and self.consecutive_overruns >= self.quarantine_after
+
+    def get_stats(self) -> dict:
+        """Counts and latency summary for this handler"""
+        summary = self.summary()
+        return {
+            "event_type": self.event_type.value,
+            "handler": self.name,
+            "calls": summary["count"],
+            "errors": self.errors,
+            "p50_ms": summary["p50_ms"],
+            "p99_ms": summary["p99_ms"],
+            "max_ms": summary["max_ms"],
+            "mean_ms": summary["mean_ms"],
+            "budget_overruns": self.overruns,
+            "quarantined": self.quarantined
+        }
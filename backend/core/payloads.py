@@ -0,0 +1,165 @@
+"""
+PROJECT PREDATOR - Event Payloads
+Typed, slotted payloads for hot-path events
+"""
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+
+class Payload(Mapping):
+    """
+    Base class for slotted event payloads
+
+    Subclasses list their attributes in `_fields` (and `__slots__`).
+    Handlers on the hot path read attributes directly; older code keeps
+    working through the read-only dict view (`payload["price"]`,
+    `payload.get("price")`, `keys()`, `dict(payload)`, `to_dict()`).
+
+    A payload instance is shared by every subscriber of the event, so
+    treat it as immutable once published.
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __getitem__(self, name: str) -> Any:
+        if name in self._fields:
+            return getattr(self, name)
+        raise KeyError(name)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in self._fields:
+            return getattr(self, name)
+        return default
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._fields
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Plain dict copy of the payload"""
+        return {name: getattr(self, name) for name in self._fields}
+
+    def replace(self, **changes: Any) -> "Payload":
+        """Copy of the payload with some fields changed"""
+        values = self.to_dict()
+        values.update(changes)
+        return self.__class__(**values)
+
+    @classmethod
+    def from_mapping(cls, data: Optional[Mapping], defaults: Optional[Mapping] = None):
+        """
+        Build a payload from a dict-like event payload
+
+        Instances of cls are returned as-is, so handlers can accept both
+        typed payloads and legacy dicts for the price of one isinstance().
+
+        Args:
+            data: Event payload (payload instance, dict or None)
+            defaults: Values for keys missing from a dict payload
+                      (otherwise the constructor defaults apply)
+        """
+        if isinstance(data, cls):
+            return data
+        values = dict(defaults) if defaults else {}
+        if data:
+            values.update((name, data[name]) for name in cls._fields if name in data)
+        return cls(**values)
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is type(self):
+            return all(getattr(self, name) == getattr(other, name) for name in self._fields)
+        if isinstance(other, Mapping):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self._fields)
+        return f"{self.__class__.__name__}({fields})"
+
+
+class PriceUpdate(Payload):
+    """PRICE_UPDATE payload"""
+
+    _fields = ("symbol", "price", "timestamp", "fake")
+    __slots__ = _fields
+
+    def __init__(self, symbol: str = "BTC/USD", price: float = 0.0, timestamp: float = 0.0, fake: bool = True):
+        self.symbol = symbol
+        self.price = price
+        self.timestamp = timestamp
+        self.fake = fake
+
+
+class OrderRequest(Payload):
+    """ORDER_REQUEST payload (side / order_type use the OrderSide / OrderType values)"""
+
+    _fields = ("symbol", "side", "order_type", "quantity", "price", "order_id", "fake")
+    __slots__ = _fields
+
+    def __init__(self, symbol: str = "BTC/USD", side: Optional[str] = None, order_type: str = "MARKET",
+                 quantity: float = 0.0, price: float = 0.0, order_id: Optional[str] = None, fake: bool = True):
+        self.symbol = symbol
+        self.side = side
+        self.order_type = order_type
+        self.quantity = quantity
+        self.price = price
+        self.order_id = order_id
+        self.fake = fake
+
+
+class Fill(Payload):
+    """ORDER_FILLED / EXECUTION_RESULT payload"""
+
+    _fields = ("order_id", "symbol", "side", "quantity", "price", "status", "fake")
+    __slots__ = _fields
+
+    def __init__(self, order_id: Optional[str] = None, symbol: str = "BTC/USD", side: Optional[str] = None,
+                 quantity: float = 0.0, price: float = 0.0, status: str = "FILLED", fake: bool = True):
+        self.order_id = order_id
+        self.symbol = symbol
+        self.side = side
+        self.quantity = quantity
+        self.price = price
+        self.status = status
+        self.fake = fake
+
+
+class PositionSnapshot(Payload):
+    """POSITION_UPDATE payload"""
+
+    _fields = ("symbol", "qty", "avg_cost", "last_price", "unrealized", "realized", "fake")
+    __slots__ = _fields
+
+    def __init__(self, symbol: str = "UNKNOWN", qty: float = 0.0, avg_cost: float = 0.0, last_price: float = 0.0,
+                 unrealized: float = 0.0, realized: float = 0.0, fake: bool = True):
+        self.symbol = symbol
+        self.qty = qty
+        self.avg_cost = avg_cost
+        self.last_price = last_price
+        self.unrealized = unrealized
+        self.realized = realized
+        self.fake = fake
+
+
+class ExposureReport(Payload):
+    """EXPOSURE_UPDATE payload: one shard's aggregate exposure"""
+
+    _fields = ("shard", "gross", "net", "positions", "realized", "unrealized")
+    __slots__ = _fields
+
+    def __init__(self, shard: int = 0, gross: float = 0.0, net: float = 0.0, positions: int = 0,
+                 realized: float = 0.0, unrealized: float = 0.0):
+        self.shard = shard
+        self.gross = gross
+        self.net = net
+        self.positions = positions
+        self.realized = realized
+        self.unrealized = unrealized
@@ -1,110 +1,402 @@
 """
 PROJECT PREDATOR - Scheduler
-Generates system heartbeat and tick events
+Deadline-ordered job scheduler; generates system heartbeat and tick events
 """
+import heapq
 import logging
-import time
 import threading
-from typing import Optional
+from enum import Enum
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Tuple
+from backend.core.clock import ClockFn, MonotonicWallClock
 from backend.core.event_bus import EventBus, EventType
+from backend.monitor.histogram import RollingHistogram
+
+if TYPE_CHECKING:
+    from backend.simulation.time_warp import TimeWarp
+
+
+class OverrunPolicy(Enum):
+    """What a periodic job does after missing one or more of its deadlines"""
+    SKIP = "SKIP"          # Drop the missed runs, stay on the original grid
+    CATCH_UP = "CATCH_UP"  # Run every missed deadline back to back
+
+
+class ScheduledJob:
+    """
+    One job in the Scheduler heap
+
+    Periodic jobs keep their deadlines on a fixed grid (first deadline +
+    n * interval), so a late run never shifts the following ones.
+    """
+
+    __slots__ = ("job_id", "name", "callback", "interval", "policy", "deadline", "cancelled",
+                 "runs", "overruns", "skipped", "errors", "last_run_ms", "max_run_ms", "max_lateness_ms")
+
+    def __init__(self, job_id: int, name: str, callback: Callable[[], None], deadline: float,
+                 interval: Optional[float], policy: OverrunPolicy):
+        self.job_id = job_id
+        self.name = name
+        self.callback = callback
+        self.interval = interval
+        self.policy = policy
+        self.deadline = deadline
+        self.cancelled = False
+        self.runs = 0
+        self.overruns = 0
+        self.skipped = 0
+        self.errors = 0
+        self.last_run_ms = 0.0
+        self.max_run_ms = 0.0
+        self.max_lateness_ms = 0.0
+
+    def get_stats(self) -> dict:
+        """Job counters"""
+        return {
+            "job_id": self.job_id,
+            "name": self.name,
+            "interval": self.interval,
+            "policy": self.policy.value,
+            "runs": self.runs,
+            "overruns": self.overruns,
+            "skipped": self.skipped,
+            "errors": self.errors,
+            "last_run_ms": self.last_run_ms,
+            "max_run_ms": self.max_run_ms,
+            "max_lateness_ms": self.max_lateness_ms
+        }
 
 
 class Scheduler:
     """
     System scheduler
-    
-    Generates:
-    - HEARTBEAT: System health signal
+
+    Runs callbacks at deadlines kept in a heap, on one scheduler thread
+    that sleeps on a Condition until the earliest deadline (or until a
+    new, earlier job is added), so wake-ups are not quantised to a poll
+    interval. Periodic jobs are drift-free; a job that falls a whole
+    interval behind counts an overrun and then follows its OverrunPolicy.
+
+    Built-in jobs (while running):
     - TICK: Market tick signal (stub)
-    
-    Drives the system clock.
+    - HEARTBEAT: System health signal
+    - METRICS: METRIC_PUBLISHED with the lag figures below (if metrics_interval > 0)
+
+    Every run records its lag (actual vs scheduled start). TICK runs also
+    record the handler time (the synchronous TICK dispatch) and whether
+    the next tick was missed; all go into rolling histograms reported by
+    get_stats() and metrics().
+
+    Deadlines are epoch seconds on the scheduler clock. With a TimeWarp
+    there is no scheduler thread: due jobs run on the thread advancing
+    the virtual clock, when simulated time reaches them.
     """
-    
-    def __init__(self, event_bus: EventBus, tick_interval: float = 1.0, heartbeat_interval: float = 5.0):
+
+    def __init__(self, event_bus: EventBus, tick_interval: float = 1.0, heartbeat_interval: float = 5.0,
+                 clock: Optional[ClockFn] = None, time_warp: Optional["TimeWarp"] = None,
+                 metrics_interval: float = 0.0, metrics_window: float = 60.0):
         """
         Initialize scheduler
-        
+
         Args:
             event_bus: EventBus instance
             tick_interval: Seconds between ticks
             heartbeat_interval: Seconds between heartbeats
+            clock: Epoch-nanosecond clock (None = MonotonicWallClock)
+            time_warp: Run on this virtual clock instead (overrides clock)
+            metrics_interval: Seconds between METRIC_PUBLISHED events (0 = off)
+            metrics_window: Seconds covered by the rolling lag histograms
         """
         self.logger = logging.getLogger(__name__)
         self.event_bus = event_bus
         self.tick_interval = tick_interval
         self.heartbeat_interval = heartbeat_interval
-        
+        self.metrics_interval = metrics_interval
+        self.time_warp = time_warp
+        self._clock = time_warp.now_ns if time_warp is not None else (clock or MonotonicWallClock())
+        # Earliest deadline with a TimeWarp timer armed for it
+        self._armed: Optional[float] = None
+
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._condition = threading.Condition()
+        self._heap: List[Tuple[float, int, ScheduledJob]] = []
+        self._jobs: Dict[int, ScheduledJob] = {}
+        self._next_job_id = 1
+        self._builtin_jobs: List[int] = []
+        self._tick_job: Optional[int] = None
         self._tick_count = 0
         self._heartbeat_count = 0
-        
+
+        # Lag instrumentation (updated under _condition)
+        self._scheduler_lag = RollingHistogram(6, metrics_window / 6)
+        self._tick_lag = RollingHistogram(6, metrics_window / 6)
+        self._tick_handler = RollingHistogram(6, metrics_window / 6)
+        self._ticks_missed = 0
+        self._tick_overruns = 0
+        self._slow_ticks = 0
+
         self.logger.info(f"Scheduler initialized (tick={tick_interval}s, heartbeat={heartbeat_interval}s)")
-    
+
+    def now(self) -> float:
+        """Current scheduler time (epoch seconds)"""
+        return self._clock() / 1e9
+
     def start(self) -> bool:
         """Start the scheduler"""
         if self._running:
             self.logger.warning("Scheduler already running")
             return False
-        
+
         self._running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        self._tick_job = self.schedule_every(self.tick_interval, self._publish_tick, name="TICK")
+        self._builtin_jobs = [
+            self._tick_job,
+            self.schedule_every(self.heartbeat_interval, self._publish_heartbeat, name="HEARTBEAT")
+        ]
+        if self.metrics_interval > 0:
+            self._builtin_jobs.append(self.schedule_every(self.metrics_interval, self._publish_metrics,
+                                                          name="METRICS"))
+        if self.time_warp is not None:
+            self._arm()
+        else:
+            self._thread = threading.Thread(target=self._run, name="Scheduler", daemon=True)
+            self._thread.start()
         self.logger.info("Scheduler started")
         return True
-    
+
     def stop(self) -> bool:
         """Stop the scheduler"""
         if not self._running:
             self.logger.warning("Scheduler not running")
             return False
-        
-        self._running = False
+
+        with self._condition:
+            self._running = False
+            self._condition.notify()
         if self._thread:
             self._thread.join(timeout=5.0)
-        
+            self._thread = None
+        self._armed = None
+        for job_id in self._builtin_jobs:
+            self.cancel(job_id)
+        self._builtin_jobs = []
+
         self.logger.info("Scheduler stopped")
         return True
-    
+
+    # ==================== Jobs ====================
+
+    def schedule_every(self, interval: float, callback: Callable[[], None], name: Optional[str] = None,
+                       policy: OverrunPolicy = OverrunPolicy.SKIP,
+                       first_at: Optional[float] = None) -> int:
+        """
+        Run a callback periodically
+
+        Args:
+            interval: Seconds between runs (> 0)
+            callback: Zero-argument callable, run on the scheduler thread
+            name: Job name for stats and logs
+            policy: Overrun handling (SKIP or CATCH_UP)
+            first_at: First deadline (epoch seconds; None = now + interval)
+
+        Returns:
+            Job id (for cancel())
+        """
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        deadline = first_at if first_at is not None else self.now() + interval
+        return self._add(name, callback, deadline, interval, policy)
+
+    def schedule_at(self, deadline: float, callback: Callable[[], None], name: Optional[str] = None) -> int:
+        """
+        Run a callback once
+
+        Args:
+            deadline: Epoch seconds (a past deadline runs immediately)
+            callback: Zero-argument callable, run on the scheduler thread
+            name: Job name for stats and logs
+
+        Returns:
+            Job id (for cancel())
+        """
+        return self._add(name, callback, deadline, None, OverrunPolicy.SKIP)
+
+    def cancel(self, job_id: int) -> bool:
+        """Cancel a job (False if unknown or already finished)"""
+        with self._condition:
+            job = self._jobs.pop(job_id, None)
+            if job is None:
+                return False
+            # Lazy deletion: the heap entry is dropped when it surfaces
+            job.cancelled = True
+            return True
+
+    def _add(self, name: Optional[str], callback: Callable[[], None], deadline: float,
+             interval: Optional[float], policy: OverrunPolicy) -> int:
+        with self._condition:
+            job_id = self._next_job_id
+            self._next_job_id += 1
+            job = ScheduledJob(job_id, name or getattr(callback, "__name__", f"job-{job_id}"),
+                               callback, deadline, interval, policy)
+            self._jobs[job_id] = job
+            heapq.heappush(self._heap, (deadline, job_id, job))
+            # Wake the loop if this is now the earliest deadline
+            if self._heap[0][2] is job:
+                self._condition.notify()
+        if self.time_warp is not None and self._running:
+            self._arm()
+        return job_id
+
+    # ==================== Loop ====================
+
     def _run(self) -> None:
-        """Main scheduler loop"""
-        last_tick = time.time()
-        last_heartbeat = time.time()
-        
-        while self._running:
-            now = time.time()
-            
-            # Generate tick
-            if now - last_tick >= self.tick_interval:
-                self._tick_count += 1
-                self.event_bus.publish(
-                    EventType.TICK,
-                    {"tick_number": self._tick_count, "timestamp": now},
-                    source="Scheduler"
-                )
-                last_tick = now
-            
-            # Generate heartbeat
-            if now - last_heartbeat >= self.heartbeat_interval:
-                self._heartbeat_count += 1
-                self.event_bus.publish(
-                    EventType.HEARTBEAT,
-                    {
-                        "heartbeat_number": self._heartbeat_count,
-                        "timestamp": now,
-                        "ticks_generated": self._tick_count
-                    },
-                    source="Scheduler"
-                )
-                last_heartbeat = now
-            
-            # Sleep to avoid busy-waiting
-            time.sleep(0.1)
-    
+        """Main scheduler loop: sleep until the earliest deadline, run due jobs"""
+        condition = self._condition
+        heap = self._heap
+        while True:
+            with condition:
+                while self._running:
+                    while heap and heap[0][2].cancelled:
+                        heapq.heappop(heap)
+                    timeout = heap[0][0] - self.now() if heap else None
+                    if timeout is not None and timeout <= 0:
+                        break
+                    condition.wait(timeout)
+                if not self._running:
+                    return
+                deadline, _, job = heapq.heappop(heap)
+            self._execute(job, deadline)
+
+    def _arm(self) -> None:
+        """Make sure a TimeWarp timer fires at the earliest deadline"""
+        with self._condition:
+            while self._heap and self._heap[0][2].cancelled:
+                heapq.heappop(self._heap)
+            if not self._running or not self._heap:
+                return
+            earliest = self._heap[0][0]
+            if self._armed is not None and self._armed <= earliest:
+                return
+            self._armed = earliest
+        self.time_warp.call_at(earliest, self._run_due)
+
+    def _run_due(self) -> None:
+        """TimeWarp timer: run every job due at the current simulated time"""
+        now = self.now()
+        if self._armed is not None and self._armed <= now:
+            self._armed = None
+        while True:
+            with self._condition:
+                while self._heap and self._heap[0][2].cancelled:
+                    heapq.heappop(self._heap)
+                if not self._running or not self._heap or self._heap[0][0] > now:
+                    break
+                deadline, _, job = heapq.heappop(self._heap)
+            self._execute(job, deadline)
+        self._arm()
+
+    def _execute(self, job: ScheduledJob, deadline: float) -> None:
+        start = self.now()
+        try:
+            job.callback()
+        except Exception as e:
+            job.errors += 1
+            self.logger.error(f"Scheduled job {job.name} failed: {e}")
+        finished = self.now()
+        run_ms = (finished - start) * 1000.0
+        lateness_ms = (start - deadline) * 1000.0
+        job.runs += 1
+        job.last_run_ms = run_ms
+        job.max_run_ms = max(job.max_run_ms, run_ms)
+        job.max_lateness_ms = max(job.max_lateness_ms, lateness_ms)
+
+        with self._condition:
+            lag_ns = int((start - deadline) * 1e9)
+            self._scheduler_lag.record(lag_ns, finished)
+            is_tick = job.job_id == self._tick_job
+            if is_tick:
+                self._tick_lag.record(lag_ns, finished)
+                self._tick_handler.record(int((finished - start) * 1e9), finished)
+                if finished - start > job.interval:
+                    self._slow_ticks += 1
+            if job.cancelled:
+                return
+            if job.interval is None:
+                self._jobs.pop(job.job_id, None)
+                return
+            next_deadline = deadline + job.interval
+            if finished >= next_deadline:
+                # Fell at least one whole interval behind
+                job.overruns += 1
+                missed = int((finished - deadline) // job.interval)
+                if is_tick:
+                    self._tick_overruns += 1
+                    self._ticks_missed += missed
+                if job.policy is OverrunPolicy.SKIP:
+                    job.skipped += missed
+                    next_deadline = deadline + (missed + 1) * job.interval
+            job.deadline = next_deadline
+            heapq.heappush(self._heap, (next_deadline, job.job_id, job))
+
+    # ==================== Built-in jobs ====================
+
+    def _publish_tick(self) -> None:
+        self._tick_count += 1
+        self.event_bus.publish(
+            EventType.TICK,
+            {"tick_number": self._tick_count, "timestamp": self.now()},
+            source="Scheduler"
+        )
+
+    def _publish_heartbeat(self) -> None:
+        self._heartbeat_count += 1
+        self.event_bus.publish(
+            EventType.HEARTBEAT,
+            {
+                "heartbeat_number": self._heartbeat_count,
+                "timestamp": self.now(),
+                "ticks_generated": self._tick_count
+            },
+            source="Scheduler"
+        )
+
+    def _publish_metrics(self) -> None:
+        self.event_bus.publish(
+            EventType.METRIC_PUBLISHED,
+            {"metric": "scheduler", "timestamp": self.now(), **self.metrics()},
+            source="Scheduler"
+        )
+
+    def metrics(self) -> dict:
+        """
+        Tick overrun and lag figures
+
+        Returns:
+            tick_lag / tick_handler / scheduler_lag histogram summaries
+            (ms, rolling window), ticks missed (deadlines passed while a
+            tick was still running), tick overruns (runs that missed at
+            least one) and slow ticks (handler time above the interval)
+        """
+        now = self.now()
+        with self._condition:
+            return {
+                "tick_interval": self.tick_interval,
+                "tick_lag": self._tick_lag.summary(now),
+                "tick_handler": self._tick_handler.summary(now),
+                "scheduler_lag": self._scheduler_lag.summary(now),
+                "ticks_missed": self._ticks_missed,
+                "tick_overruns": self._tick_overruns,
+                "slow_ticks": self._slow_ticks
+            }
+
     def get_stats(self) -> dict:
         """Get scheduler statistics"""
+        with self._condition:
+            jobs = [job.get_stats() for job in self._jobs.values()]
         return {
             "running": self._running,
             "ticks_generated": self._tick_count,
-            "heartbeats_generated": self._heartbeat_count
+            "heartbeats_generated": self._heartbeat_count,
+            "jobs": jobs,
+            **self.metrics()
         }
@@ -0,0 +1,265 @@
+"""
+PROJECT PREDATOR - SubscriberQueue
+Bounded per-subscriber queue + worker thread for asynchronous EventBus dispatch
+"""
+import itertools
+import logging
+import threading
+import time
+from collections import OrderedDict
+from enum import Enum
+from typing import Any, Callable, List, Optional
+from backend.core.handler_stats import HandlerStats
+from backend.monitor.histogram import LatencyHistogram
+
+
+class BackpressurePolicy(Enum):
+    """What to do when a subscriber queue is full"""
+    BLOCK = "BLOCK"              # Publisher waits until there is room (the queue's own
+                                 # worker never waits: it drops the oldest instead)
+    DROP_OLDEST = "DROP_OLDEST"  # Oldest pending event is discarded
+    DROP_NEWEST = "DROP_NEWEST"  # Incoming event is discarded
+
+
+class QueuedHandler:
+    """
+    Callable subscriber entry that enqueues events for one handler
+
+    This is what the EventBus stores in its routing table for an ASYNC
+    subscription; calling it hands the event to the SubscriberQueue.
+    """
+
+    def __init__(self, queue: "SubscriberQueue", handler: Callable, lane: int, conflate: bool = False,
+                 stats: Optional[HandlerStats] = None):
+        self.queue = queue
+        self.handler = handler
+        self.lane = lane
+        self.conflate = conflate
+        self.stats = stats
+        self.__name__ = getattr(handler, "__name__", repr(handler))
+
+    def __call__(self, event: Any) -> bool:
+        return self.queue.submit(event, self, self.lane, self.conflate)
+
+
+class SubscriberQueue:
+    """
+    Bounded queue with a dedicated worker thread for one subscriber.
+
+    The publisher only pays for an enqueue; the handler runs on the
+    worker thread. A slow handler therefore only delays its own queue.
+
+    Pending events sit in priority lanes (lane 0 = highest). The worker
+    always drains the highest non-empty lane first, and lane 0 is exempt
+    from backpressure: it is never blocked, dropped or counted against
+    maxsize. Several subscriptions may share one queue (one worker per
+    agent), in which case a lane-0 event overtakes everything queued in
+    the lower lanes.
+
+    Handler run time is recorded into the entry's HandlerStats, if any.
+
+    Conflating entries key their pending event by (handler, event_type,
+    key): a newer event replaces the pending one in place (keeping its
+    position and enqueue time), so the handler only ever sees the latest
+    value per key.
+    """
+
+    def __init__(self, name: str, maxsize: int = 1024,
+                 policy: BackpressurePolicy = BackpressurePolicy.BLOCK,
+                 lanes: int = 1):
+        """
+        Initialize subscriber queue
+
+        Args:
+            name: Human readable name (used for the thread and stats)
+            maxsize: Maximum number of pending events in lanes 1..n
+            policy: Backpressure policy applied when the queue is full
+            lanes: Number of priority lanes
+        """
+        self.logger = logging.getLogger(__name__)
+        self.name = name
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+
+        # Each lane maps an ordering key -> (enqueued_ns, entry, event).
+        # Plain entries use a sequence number, conflating entries use
+        # (handler, event_type, key) so newer events replace older ones.
+        self._lanes: List[OrderedDict] = [OrderedDict() for _ in range(max(1, lanes))]
+        self._seq = itertools.count()
+        self._bounded_depth = 0  # pending events in lanes 1..n
+        self._cond = threading.Condition()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Stats
+        self._enqueued = 0
+        self._delivered = 0
+        self._dropped = 0
+        self._conflated = 0
+        self._errors = 0
+        self._max_depth = 0
+        self._wait_by_lane = [LatencyHistogram() for _ in self._lanes]
+
+    def bind(self, handler: Callable, lane: int = 0, conflate: bool = False,
+             stats: Optional[HandlerStats] = None) -> QueuedHandler:
+        """
+        Create the subscriber entry for a handler on this queue
+
+        Args:
+            handler: Callback invoked on the worker thread
+            lane: Priority lane for this subscription
+            conflate: Keep only the latest pending event per (event_type, key)
+            stats: Optional HandlerStats to record run time into
+        """
+        lane = min(max(0, lane), len(self._lanes) - 1)
+        return QueuedHandler(self, handler, lane, conflate, stats)
+
+    def start(self) -> None:
+        """Start the worker thread"""
+        with self._cond:
+            if self._running:
+                return
+            self._running = True
+        self._thread = threading.Thread(target=self._run, name=f"EventBus-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """
+        Stop the worker thread
+
+        Pending events are delivered before the worker exits.
+        """
+        with self._cond:
+            if not self._running:
+                return
+            self._running = False
+            self._cond.notify_all()
+        if self._thread and self._thread is not threading.current_thread():
+            self._thread.join(timeout=timeout)
+
+    def submit(self, event: Any, entry: QueuedHandler, lane: int = 0, conflate: bool = False) -> bool:
+        """
+        Enqueue an event for delivery
+
+        Args:
+            event: Event to deliver
+            entry: Subscriber entry whose handler runs with the event
+            lane: Priority lane (0 = highest, exempt from backpressure)
+            conflate: Replace a pending event with the same conflation key
+
+        Returns:
+            True if the event was queued, False if it was dropped
+        """
+        with self._cond:
+            if not self._running:
+                self._dropped += 1
+                return False
+            pending_lane = self._lanes[lane]
+            if conflate:
+                order_key = (entry.handler, event.event_type, event.key)
+                pending = pending_lane.get(order_key)
+                if pending is not None:
+                    pending_lane[order_key] = (pending[0], entry, event)
+                    self._conflated += 1
+                    self._enqueued += 1
+                    return True
+            else:
+                order_key = next(self._seq)
+
+            if lane > 0 and self._bounded_depth >= self.maxsize:
+                if self.policy == BackpressurePolicy.DROP_NEWEST:
+                    self._dropped += 1
+                    return False
+                # The worker publishing into its own full queue must not wait for
+                # space only it can free: BLOCK falls back to DROP_OLDEST there
+                if (self.policy == BackpressurePolicy.DROP_OLDEST
+                        or threading.current_thread() is self._thread):
+                    self._drop_oldest_bounded()
+                    self._dropped += 1
+                else:
+                    while self._running and self._bounded_depth >= self.maxsize:
+                        self._cond.wait()
+                    if not self._running:
+                        self._dropped += 1
+                        return False
+
+            pending_lane[order_key] = (time.monotonic_ns(), entry, event)
+            if lane > 0:
+                self._bounded_depth += 1
+            self._enqueued += 1
+            depth = self.depth()
+            if depth > self._max_depth:
+                self._max_depth = depth
+            self._cond.notify_all()
+            return True
+
+    def _drop_oldest_bounded(self) -> None:
+        """Discard the oldest event from the lowest-priority non-empty lane (lock held)"""
+        for lane in range(len(self._lanes) - 1, 0, -1):
+            if self._lanes[lane]:
+                self._lanes[lane].popitem(last=False)
+                self._bounded_depth -= 1
+                return
+
+    def _run(self) -> None:
+        """Worker loop"""
+        while True:
+            with self._cond:
+                while self._running and not self.depth():
+                    self._cond.wait()
+                for lane, pending_lane in enumerate(self._lanes):
+                    if pending_lane:
+                        break
+                else:
+                    return
+                enqueued_ns, entry, event = pending_lane.popitem(last=False)[1]
+                if lane > 0:
+                    self._bounded_depth -= 1
+                self._wait_by_lane[lane].record(time.monotonic_ns() - enqueued_ns)
+                # Wake publishers blocked on a full queue
+                self._cond.notify_all()
+
+            stats = entry.stats
+            started = time.perf_counter_ns()
+            try:
+                entry.handler(event)
+            except Exception as e:
+                self._errors += 1
+                if stats is not None:
+                    stats.errors += 1
+                self.logger.error(f"Error in async event handler {self.name}: {e}")
+            if stats is not None:
+                stats.record(time.perf_counter_ns() - started)
+            self._delivered += 1
+
+    def depth(self) -> int:
+        """Current number of pending events"""
+        return sum(len(pending_lane) for pending_lane in self._lanes)
+
+    def wait_histograms(self) -> List[LatencyHistogram]:
+        """Per-lane enqueue-to-handler wait histograms (merged into a copy)"""
+        with self._cond:
+            return [LatencyHistogram().merge(h) for h in self._wait_by_lane]
+
+    def get_stats(self) -> dict:
+        """Get queue statistics"""
+        waits = LatencyHistogram()
+        for histogram in self.wait_histograms():
+            waits.merge(histogram)
+        summary = waits.summary()
+        return {
+            "name": self.name,
+            "policy": self.policy.value,
+            "maxsize": self.maxsize,
+            "depth": self.depth(),
+            "lane_depths": [len(pending_lane) for pending_lane in self._lanes],
+            "max_depth": self._max_depth,
+            "enqueued": self._enqueued,
+            "delivered": self._delivered,
+            "dropped": self._dropped,
+            "conflated": self._conflated,
+            "errors": self._errors,
+            "wait_avg_ms": summary["mean_ms"],
+            "wait_p99_ms": summary["p99_ms"],
+            "wait_max_ms": summary["max_ms"]
+        }
@@ -61,7 +61,8 @@ class FakeExecutor(IExecutor):
                 "side": order.side.value,
                 "quantity": order.quantity
             },
-            source="FakeExecutor"
+            source="FakeExecutor",
+            key=order.symbol
         )
         
         # Immediately "fill" the order (fake)
@@ -91,7 +92,8 @@ class FakeExecutor(IExecutor):
                 "price": order.price,
                 "fake": True
             },
-            source="FakeExecutor"
+            source="FakeExecutor",
+            key=order.symbol
         )
     
     def cancel_order(self, order_id: str) -> bool:
@@ -3,7 +3,7 @@ PROJECT PREDATOR - Agent Interface
 Defines the contract for all agents in the system
 """
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Sequence
 
 
 class IAgent(ABC):
@@ -50,3 +50,10 @@ class IAgent(ABC):
         Returns: Dictionary with health status
         """
         pass
+    
+    def get_dependencies(self) -> Sequence[str]:
+        """
+        Names of components that must be started before this one
+        Returns: Component names (default: none)
+        """
+        return ()
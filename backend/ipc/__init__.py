@@ -0,0 +1,4 @@
+"""
+PROJECT PREDATOR - IPC Package
+Shared-memory transport for hosting agents in separate processes
+"""
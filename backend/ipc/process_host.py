@@ -0,0 +1,160 @@
+"""
+PROJECT PREDATOR - ProcessAgentHost
+Runs a BaseAgent subclass in a child process behind the shared-memory transport
+"""
+import json
+import logging
+import multiprocessing
+import threading
+from typing import Collection, Optional
+
+from backend.core.event_bus import EventBus, EventType
+from backend.core.registry import Registry
+from backend.interfaces.agent import IAgent
+from backend.ipc.remote_bus import run_hosted_agent
+from backend.ipc.ring import SharedRing
+from backend.ipc.transport import KIND_READY, KIND_STOPPED, ShmTransport
+
+
+class ProcessAgentHost(IAgent):
+    """
+    Parent-side stand-in for an agent running in its own process
+
+    Registers, starts, stops and health-checks like the agent itself.
+    The child builds the agent on a RemoteEventBus, so the agent code
+    (subscribe / publish) is unchanged; its events reach the parent bus
+    through the transport and vice versa. Hosts given the same
+    ShmTransport share one downlink ring; without one, the host creates
+    and owns a private transport.
+    """
+
+    def __init__(self, event_bus: EventBus, registry: Registry, agent_cls: type,
+                 agent_kwargs: Optional[dict] = None,
+                 transport: Optional[ShmTransport] = None,
+                 name: Optional[str] = None,
+                 uplink_types: Optional[Collection[EventType]] = None,
+                 downlink_types: Optional[Collection[EventType]] = None,
+                 log_level: Optional[int] = None,
+                 uplink_size: int = 1024 * 1024,
+                 start_timeout: float = 30.0,
+                 stop_timeout: float = 10.0):
+        """
+        Initialize ProcessAgentHost
+
+        Args:
+            event_bus: Parent EventBus
+            registry: Parent Registry
+            agent_cls: BaseAgent subclass to run (must be importable)
+            agent_kwargs: Extra agent constructor arguments (picklable)
+            transport: Shared transport (None = private one)
+            name: Component name (defaults to the agent class name)
+            uplink_types: Event types the child sends up (None = all)
+            downlink_types: Event types the child may receive (None = all it subscribes to)
+            log_level: Child log level (defaults to this process's)
+            uplink_size: Child -> parent ring bytes
+            start_timeout: Seconds to wait for the child agent to start
+            stop_timeout: Seconds to wait for the child to exit
+        """
+        self.event_bus = event_bus
+        self.registry = registry
+        self.agent_cls = agent_cls
+        self.agent_kwargs = dict(agent_kwargs or {})
+        self.name = name or agent_cls.__name__
+        self.uplink_types = tuple(uplink_types) if uplink_types is not None else None
+        self.downlink_types = tuple(downlink_types) if downlink_types is not None else None
+        self.log_level = log_level
+        self.logger = logging.getLogger(f"{self.name}@process")
+        self._own_transport = transport is None
+        self.transport = transport or ShmTransport(event_bus)
+        self.uplink_size = uplink_size
+        self.start_timeout = start_timeout
+        self.stop_timeout = stop_timeout
+        self._uplink: Optional[SharedRing] = None
+        self._process = None
+        self._peer: Optional[int] = None
+        self._ready = threading.Event()
+        self._stopped = threading.Event()
+        self._child_health: Optional[dict] = None
+        self._running = False
+
+    def get_name(self) -> str:
+        """Same name as the hosted agent unless one was given"""
+        return self.name
+
+    def start(self) -> bool:
+        """Spawn the child process and wait until its agent has subscribed"""
+        if self._running:
+            self.logger.warning(f"{self.get_name()} already running")
+            return False
+        if self._own_transport:
+            self.transport.start()
+        self._ready.clear()
+        self._stopped.clear()
+        self._uplink = SharedRing.create(self.uplink_size, max_readers=1)
+        self._peer = self.transport.connect(self, self._uplink)
+        context = multiprocessing.get_context("spawn")
+        log_level = self.log_level if self.log_level is not None else logging.getLogger().getEffectiveLevel()
+        self._process = context.Process(
+            target=run_hosted_agent,
+            args=(self.agent_cls, self.agent_kwargs, self.transport.downlink.name, self._uplink.name,
+                  self._peer, log_level, self.uplink_types, self.downlink_types),
+            name=f"{self.get_name()}-process",
+            daemon=True
+        )
+        self._process.start()
+        if not self._ready.wait(self.start_timeout):
+            self.logger.error(f"{self.get_name()} did not start within {self.start_timeout}s")
+            self._teardown()
+            return False
+        self._running = True
+        self.logger.info(f"{self.get_name()} started in process {self._process.pid}")
+        return True
+
+    def stop(self) -> bool:
+        """Stop the child agent and release its rings"""
+        if not self._running:
+            self.logger.warning(f"{self.get_name()} not running")
+            return False
+        self._running = False
+        try:
+            self.transport.send_stop(self._peer)
+        except TimeoutError:
+            self.logger.error(f"{self.get_name()}: downlink full, terminating child")
+        self._stopped.wait(self.stop_timeout)
+        self._teardown()
+        self.logger.info(f"{self.get_name()} stopped")
+        return True
+
+    def _teardown(self) -> None:
+        process = self._process
+        if process is not None:
+            process.join(self.stop_timeout)
+            if process.is_alive():
+                process.terminate()
+                process.join()
+        self.transport.disconnect(self._peer)
+        if self._uplink is not None:
+            self._uplink.close()
+            self._uplink.unlink()
+            self._uplink = None
+        if self._own_transport:
+            self.transport.stop()
+
+    def on_control(self, kind: int, payload: bytes) -> None:
+        """Control record from the child (called by the transport bridge)"""
+        if kind == KIND_READY:
+            self._ready.set()
+        elif kind == KIND_STOPPED:
+            self._child_health = json.loads(payload.decode("utf-8"))
+            self._stopped.set()
+
+    def health_check(self) -> dict:
+        """Host health plus the last health report of the child agent"""
+        process = self._process
+        return {
+            "name": self.get_name(),
+            "running": self._running,
+            "pid": process.pid if process is not None else None,
+            "alive": process.is_alive() if process is not None else False,
+            "agent": self._child_health
+        }
@@ -0,0 +1,170 @@
+"""
+PROJECT PREDATOR - RemoteEventBus
+Child-process side of the shared-memory transport
+"""
+import json
+import logging
+import os
+import threading
+from typing import Any, Callable, Collection, Hashable, Iterable, Optional
+
+from backend.codec.binary import BinaryCodec
+from backend.core.event_bus import Event, EventBus, EventType
+from backend.core.registry import Registry
+from backend.ipc.ring import SharedRing
+from backend.ipc.transport import KIND_EVENT, KIND_READY, KIND_STOP, KIND_STOPPED, KIND_SUBSCRIBE
+
+
+class RemoteEventBus(EventBus):
+    """
+    EventBus of a hosted agent process
+
+    Subscriptions and dispatch are local, exactly as in-process. In
+    addition, the first subscription to an event type asks the parent to
+    forward that type, and every publish() also sends the event up to the
+    parent bus. Events forwarded by the parent are delivered locally
+    only, so nothing loops back. An event goes up before it is
+    dispatched locally, so the parent sees causes before the events
+    local handlers publish in response.
+
+    A process that does most of its work locally (e.g. a shard engine)
+    restricts what crosses the rings with uplink_types / downlink_types.
+    """
+
+    def __init__(self, uplink: SharedRing, write_timeout: Optional[float] = 5.0,
+                 uplink_types: Optional[Collection[EventType]] = None,
+                 downlink_types: Optional[Collection[EventType]] = None, **kwargs):
+        """
+        Initialize RemoteEventBus
+
+        Args:
+            uplink: Ring to the parent (this process is its only writer)
+            write_timeout: Seconds to wait for uplink space
+            uplink_types: Event types sent to the parent (None = all)
+            downlink_types: Event types requested from the parent (None = all subscribed)
+            **kwargs: EventBus options
+        """
+        super().__init__(**kwargs)
+        self.uplink = uplink
+        self.write_timeout = write_timeout
+        self.uplink_types = frozenset(uplink_types) if uplink_types is not None else None
+        self.downlink_types = frozenset(downlink_types) if downlink_types is not None else None
+        self._codec = BinaryCodec()
+        self._uplink_lock = threading.Lock()
+        self._requested = set()
+
+    def send(self, kind: int, payload: bytes = b"") -> None:
+        """Write one control record to the parent"""
+        with self._uplink_lock:
+            self.uplink.write(payload, kind, timeout=self.write_timeout)
+
+    def subscribe(self, event_type: EventType, handler: Callable, *args, **kwargs) -> None:
+        super().subscribe(event_type, handler, *args, **kwargs)
+        if event_type not in self._requested and (self.downlink_types is None or event_type in self.downlink_types):
+            self._requested.add(event_type)
+            self.send(KIND_SUBSCRIBE, event_type.value.encode("utf-8"))
+
+    def publish(self, event_type: EventType, data: Any, source: str = "unknown",
+                key: Optional[Hashable] = None) -> None:
+        if self.uplink_types is not None and event_type not in self.uplink_types:
+            super().publish(event_type, data, source, key)
+            return
+        # One stamp for the local and the uplinked copy. Uplink first: events
+        # local handlers publish in response must reach the parent after it
+        event = Event(event_type, data, self._clock(), source, key)
+        try:
+            self._send_event(event)
+        finally:
+            self.publish_event(event)
+
+    def publish_batch(self, event_type: EventType, payloads: Iterable[Any], source: str = "unknown",
+                      key: Optional[Hashable] = None) -> int:
+        payloads = payloads if isinstance(payloads, (list, tuple)) else list(payloads)
+        if self.uplink_types is not None and event_type not in self.uplink_types:
+            return super().publish_batch(event_type, payloads, source, key)
+        # Uplink before local dispatch, as in publish()
+        try:
+            timestamp_ns = self._clock()
+            for data in payloads:
+                self._send_event(Event(event_type, data, timestamp_ns, source, key))
+        finally:
+            count = super().publish_batch(event_type, payloads, source, key)
+        return count
+
+    def deliver(self, event: Event) -> None:
+        """Dispatch an event forwarded by the parent to local subscribers only"""
+        EventBus.publish(self, event.event_type, event.data, event.source, event.key)
+
+    def _send_event(self, event: Event) -> None:
+        with self._uplink_lock:
+            try:
+                self.uplink.write(self._codec.encode_event(event), KIND_EVENT, timeout=self.write_timeout)
+            except TimeoutError:
+                # encode_event() already marked this record's new symbols as sent
+                self._codec.reset()
+                raise
+
+
+def run_hosted_agent(agent_cls: type, agent_kwargs: dict, downlink_name: str, uplink_name: str,
+                     peer: int, log_level: int = logging.INFO,
+                     uplink_types: Optional[Collection[EventType]] = None,
+                     downlink_types: Optional[Collection[EventType]] = None) -> None:
+    """
+    Child process entry point: run one agent until the parent stops it
+
+    Args:
+        agent_cls: BaseAgent subclass (importable, so spawn can pickle it)
+        agent_kwargs: Extra constructor arguments
+        downlink_name: Shared memory name of the parent's downlink ring
+        uplink_name: Shared memory name of this child's uplink ring
+        peer: Peer id assigned by ShmTransport.connect()
+        log_level: Root log level in the child
+        uplink_types: Event types sent to the parent (None = all)
+        downlink_types: Event types requested from the parent (None = all subscribed)
+    """
+    logging.basicConfig(level=log_level, format=f"%(asctime)s [{agent_cls.__name__}@{os.getpid()}] "
+                                                 "%(name)s %(levelname)s %(message)s")
+    logger = logging.getLogger(__name__)
+    downlink = SharedRing.attach(downlink_name)
+    uplink = SharedRing.attach(uplink_name)
+    reader = downlink.reader(peer - 1)
+    bus = RemoteEventBus(uplink, uplink_types=uplink_types, downlink_types=downlink_types)
+    registry = Registry()
+    agent = agent_cls(bus, registry, **(agent_kwargs or {}))
+    registry.register(agent.get_name(), agent)
+    agent.start()
+    bus.send(KIND_READY)
+
+    codec = BinaryCodec()
+    parent = os.getppid()
+    running = True
+    try:
+        while running:
+            if not reader.wait(0.5):
+                if os.getppid() != parent:
+                    logger.error("Parent process exited; stopping")
+                    break
+                continue
+            for _, kind, target, payload in reader.read():
+                if kind == KIND_EVENT:
+                    if target == peer:
+                        # Our own event coming back: only learn its symbols
+                        codec.observe(payload)
+                        continue
+                    try:
+                        bus.deliver(codec.decode_event(payload))
+                    except ValueError as e:
+                        logger.error(f"Undecodable downlink event: {e}")
+                elif kind == KIND_STOP and target == peer:
+                    running = False
+                    break
+    finally:
+        agent.stop()
+        bus.shutdown()
+        health = agent.health_check()
+        try:
+            bus.send(KIND_STOPPED, json.dumps(health, default=str).encode("utf-8"))
+        except TimeoutError:
+            pass
+        downlink.close()
+        uplink.close()
@@ -0,0 +1,305 @@
+"""
+PROJECT PREDATOR - Shared-Memory Ring
+Single-producer / multi-consumer record ring in multiprocessing.shared_memory
+"""
+import struct
+import time
+from multiprocessing import shared_memory
+from typing import List, Optional, Tuple
+
+# Segment layout:
+#   0    magic, data capacity, reader slots
+#   64   write position (bytes written since creation, never wraps)
+#   128  one 64-byte slot per reader: read position, active flag
+#   ...  data (capacity bytes)
+RING_MAGIC = b"PRING001"
+HEADER = struct.Struct("<8sQI")
+_U64 = struct.Struct("<Q")
+WRITE_POS_OFFSET = 64
+SLOTS_OFFSET = 128
+SLOT_SIZE = 64
+
+# Record: payload length, kind, peer, sequence number, payload. Records
+# start on 16-byte boundaries, so a padding record always fits in front
+# of the wrap point.
+RECORD = struct.Struct("<IHBxQ")
+ALIGN = 16
+KIND_PADDING = 0xFFFF
+
+Record = Tuple[int, int, int, bytes]
+
+
+def _aligned(size: int) -> int:
+    return (size + ALIGN - 1) & ~(ALIGN - 1)
+
+
+def backoff(attempt: int) -> None:
+    """Wait step for polling loops: yield first, then sleep up to 1ms"""
+    if attempt < 16:
+        time.sleep(0)
+    else:
+        time.sleep(min(0.001, 0.00005 * (attempt - 15)))
+
+
+class SharedRing:
+    """
+    Ring buffer of variable-length records in a shared memory segment
+
+    One process writes; up to `max_readers` RingReaders (in any process)
+    each see every record in order. Every record carries a sequence
+    number, a kind (message type) and a peer byte for the layer above.
+
+    The writer never overwrites a record an active reader has not
+    consumed: when the ring is full, write() waits for the slowest
+    reader (or raises TimeoutError). Positions are 8-byte aligned words
+    published after the bytes they cover, which is sufficient ordering
+    on x86/TSO hosts.
+
+    The creating process owns the segment and unlinks it on unlink();
+    other processes attach() by name and only close().
+    """
+
+    def __init__(self, shm: shared_memory.SharedMemory, owner: bool):
+        self._shm = shm
+        self._buf = shm.buf
+        self.owner = owner
+        magic, capacity, max_readers = HEADER.unpack_from(self._buf, 0)
+        if magic != RING_MAGIC:
+            raise ValueError(f"Not a ring buffer: {shm.name}")
+        self.capacity = capacity
+        self.max_readers = max_readers
+        self._data = SLOTS_OFFSET + max_readers * SLOT_SIZE
+        # Writer state (only meaningful in the writing process)
+        self._write_pos = _U64.unpack_from(self._buf, WRITE_POS_OFFSET)[0]
+        self._seq = 0
+        self._reserved_until = 0
+
+    @classmethod
+    def create(cls, capacity: int = 4 * 1024 * 1024, max_readers: int = 8,
+               name: Optional[str] = None) -> "SharedRing":
+        """
+        Create a new ring (owned by this process)
+
+        Args:
+            capacity: Data bytes (rounded up to a multiple of 16)
+            max_readers: Reader slots
+            name: Shared memory name (random if None)
+        """
+        capacity = _aligned(capacity)
+        shm = shared_memory.SharedMemory(name=name, create=True,
+                                         size=SLOTS_OFFSET + max_readers * SLOT_SIZE + capacity)
+        shm.buf[:SLOTS_OFFSET + max_readers * SLOT_SIZE] = bytes(SLOTS_OFFSET + max_readers * SLOT_SIZE)
+        HEADER.pack_into(shm.buf, 0, RING_MAGIC, capacity, max_readers)
+        return cls(shm, owner=True)
+
+    @classmethod
+    def attach(cls, name: str) -> "SharedRing":
+        """Attach to a ring created by another process"""
+        # Spawned / forked children share the creator's resource tracker,
+        # so attaching must not unregister: only the creator's unlink() does
+        return cls(shared_memory.SharedMemory(name=name), owner=False)
+
+    @property
+    def name(self) -> str:
+        return self._shm.name
+
+    def close(self) -> None:
+        """Detach from the segment"""
+        self._buf = None
+        self._shm.close()
+
+    def unlink(self) -> None:
+        """Destroy the segment (owner only)"""
+        if self.owner:
+            self._shm.unlink()
+
+    # ==================== Readers ====================
+
+    def _slot(self, index: int) -> int:
+        if not 0 <= index < self.max_readers:
+            raise ValueError(f"Reader slot {index} out of range")
+        return SLOTS_OFFSET + index * SLOT_SIZE
+
+    def add_reader(self) -> int:
+        """
+        Activate a free reader slot at the current write position
+
+        Call from the writing process, between writes: the reader then
+        sees exactly the records written after this call.
+
+        Returns:
+            Slot index (pass to RingReader)
+
+        Raises:
+            RuntimeError: All slots in use
+        """
+        for index in range(self.max_readers):
+            slot = self._slot(index)
+            if not _U64.unpack_from(self._buf, slot + 8)[0]:
+                _U64.pack_into(self._buf, slot, self._write_pos)
+                _U64.pack_into(self._buf, slot + 8, 1)
+                return index
+        raise RuntimeError("No free reader slot")
+
+    def remove_reader(self, index: int) -> None:
+        """Release a reader slot; the writer stops waiting for it"""
+        _U64.pack_into(self._buf, self._slot(index) + 8, 0)
+
+    def reader(self, index: int) -> "RingReader":
+        """Reader for an activated slot"""
+        return RingReader(self, index)
+
+    def _min_reader_pos(self) -> Optional[int]:
+        buf = self._buf
+        positions = [_U64.unpack_from(buf, self._slot(i))[0] for i in range(self.max_readers)
+                     if _U64.unpack_from(buf, self._slot(i) + 8)[0]]
+        return min(positions) if positions else None
+
+    # ==================== Writer ====================
+
+    def write(self, payload: bytes, kind: int = 0, peer: int = 0, timeout: Optional[float] = None) -> int:
+        """
+        Append one record (single writer; callers serialize threads)
+
+        Args:
+            payload: Record bytes
+            kind: Message type for the layer above (0-65534)
+            peer: Free byte for the layer above (e.g. origin / target id)
+            timeout: Max seconds to wait for space (None = forever)
+
+        Returns:
+            Sequence number of the record
+
+        Raises:
+            ValueError: Record larger than the ring
+            TimeoutError: Readers did not free enough space in time
+        """
+        size = _aligned(RECORD.size + len(payload))
+        capacity = self.capacity
+        if size > capacity:
+            raise ValueError(f"Record of {len(payload)} bytes does not fit a {capacity} byte ring")
+        pos = self._write_pos
+        offset = pos % capacity
+        room = capacity - offset
+        end = pos + size + (room if room < size else 0)
+        if end > self._reserved_until:
+            self._wait_for_space(end, timeout)
+
+        buf = self._buf
+        if room < size:
+            RECORD.pack_into(buf, self._data + offset, 0, KIND_PADDING, 0, 0)
+            pos += room
+            offset = 0
+        start = self._data + offset
+        seq = self._seq
+        buf[start + RECORD.size:start + RECORD.size + len(payload)] = payload
+        RECORD.pack_into(buf, start, len(payload), kind, peer, seq)
+        self._seq = seq + 1
+        self._write_pos = pos + size
+        _U64.pack_into(buf, WRITE_POS_OFFSET, self._write_pos)
+        return seq
+
+    def _wait_for_space(self, end: int, timeout: Optional[float]) -> None:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        attempt = 0
+        while True:
+            slowest = self._min_reader_pos()
+            if slowest is None:
+                # Nobody reading: the whole ring is free
+                self._reserved_until = end + self.capacity
+                return
+            if end - slowest <= self.capacity:
+                self._reserved_until = slowest + self.capacity
+                return
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Ring {self.name} full for {timeout}s")
+            backoff(attempt)
+            attempt += 1
+
+    def get_stats(self) -> dict:
+        """Ring statistics (reader lag in bytes)"""
+        write_pos = _U64.unpack_from(self._buf, WRITE_POS_OFFSET)[0]
+        readers = {}
+        for index in range(self.max_readers):
+            slot = self._slot(index)
+            if _U64.unpack_from(self._buf, slot + 8)[0]:
+                readers[index] = write_pos - _U64.unpack_from(self._buf, slot)[0]
+        return {
+            "name": self.name,
+            "capacity": self.capacity,
+            "bytes_written": write_pos,
+            "records_written": self._seq,
+            "reader_lag_bytes": readers
+        }
+
+
+class RingReader:
+    """
+    One reader of a SharedRing
+
+    read() copies records out and then publishes the new read position,
+    so the writer may reuse their space as soon as read() returns.
+    """
+
+    def __init__(self, ring: SharedRing, index: int):
+        self.ring = ring
+        self.index = index
+        self._slot = ring._slot(index)
+        self.position = _U64.unpack_from(ring._buf, self._slot)[0]
+        self.next_seq: Optional[int] = None
+        self.records_read = 0
+        self.gaps = 0
+
+    def available(self) -> bool:
+        """Whether unread records exist"""
+        return _U64.unpack_from(self.ring._buf, WRITE_POS_OFFSET)[0] > self.position
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Poll until records are available (False on timeout)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        attempt = 0
+        while not self.available():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+            backoff(attempt)
+            attempt += 1
+        return True
+
+    def read(self, max_records: int = 1024) -> List[Record]:
+        """
+        Take up to max_records unread records
+
+        Returns:
+            (sequence number, kind, peer, payload) tuples in order
+        """
+        ring = self.ring
+        buf = ring._buf
+        end = _U64.unpack_from(buf, WRITE_POS_OFFSET)[0]
+        pos = self.position
+        if pos >= end:
+            return []
+        capacity = ring.capacity
+        data = ring._data
+        unpack_from = RECORD.unpack_from
+        header = RECORD.size
+        records = []
+        while pos < end and len(records) < max_records:
+            offset = pos % capacity
+            length, kind, peer, seq = unpack_from(buf, data + offset)
+            if kind == KIND_PADDING:
+                pos += capacity - offset
+                continue
+            start = data + offset + header
+            records.append((seq, kind, peer, bytes(buf[start:start + length])))
+            pos += _aligned(header + length)
+            if self.next_seq is not None and seq != self.next_seq:
+                self.gaps += 1
+            self.next_seq = seq + 1
+        self.position = pos
+        _U64.pack_into(buf, self._slot, pos)
+        self.records_read += len(records)
+        return records
+
+    def close(self) -> None:
+        """Release the slot"""
+        self.ring.remove_reader(self.index)
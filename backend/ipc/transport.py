@@ -0,0 +1,213 @@
+"""
+PROJECT PREDATOR - Shared-Memory Transport
+Parent-side bridge between an EventBus and agents hosted in child processes
+"""
+import logging
+import threading
+from typing import Any, Dict, Optional, Set
+
+from backend.codec.binary import BinaryCodec
+from backend.core.event_bus import Event, EventBus, EventType
+from backend.ipc.ring import RingReader, SharedRing, backoff
+
+# Record kinds. Downlink (parent -> children): EVENT (peer = origin
+# child, which skips it), STOP (peer = target child). Uplink (child ->
+# parent): EVENT, SUBSCRIBE (payload = EventType value), READY, STOPPED
+# (payload = JSON health of the hosted agent).
+KIND_EVENT = 1
+KIND_SUBSCRIBE = 2
+KIND_READY = 3
+KIND_STOP = 4
+KIND_STOPPED = 5
+
+PARENT_PEER = 0
+
+
+class ShmTransport:
+    """
+    Shared-memory EventBus transport for hosted agent processes
+
+    One downlink SharedRing carries parent events to every hosted agent
+    (single producer, one reader slot per child). Each child has its own
+    uplink ring back to the parent. Events are BinaryCodec-encoded; the
+    downlink encoder is reset whenever a child joins, so every reader
+    can decode from its first record.
+
+    Children ask for event types with SUBSCRIBE; the transport then
+    subscribes one forwarder per type on the parent bus. A bridge thread
+    republishes uplink events on the parent bus with their original
+    source and key; the forwarder tags such an event with its origin so
+    the child that sent it does not receive it back.
+    """
+
+    def __init__(self, event_bus: EventBus, ring_size: int = 4 * 1024 * 1024,
+                 max_children: int = 8, write_timeout: float = 5.0):
+        """
+        Initialize transport
+
+        Args:
+            event_bus: Parent EventBus
+            ring_size: Downlink ring bytes
+            max_children: Max hosted agents (downlink reader slots)
+            write_timeout: Seconds a publisher may wait for downlink space
+                           before the event is dropped
+        """
+        self.logger = logging.getLogger(__name__)
+        self.event_bus = event_bus
+        self.ring_size = ring_size
+        self.max_children = max_children
+        self.write_timeout = write_timeout
+        self.downlink: Optional[SharedRing] = None
+        self._codec = BinaryCodec()
+        self._write_lock = threading.Lock()
+        self._forwarded: Set[EventType] = set()
+        # peer id -> (host, uplink reader, uplink decoder)
+        self._children: Dict[int, tuple] = {}
+        self._bridging = threading.local()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+
+        # Stats
+        self._events_down = 0
+        self._events_up = 0
+        self._dropped = 0
+
+    def start(self) -> bool:
+        """Create the downlink ring and start the bridge thread"""
+        if self._running:
+            return False
+        self.downlink = SharedRing.create(self.ring_size, self.max_children)
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="ShmTransport-bridge", daemon=True)
+        self._thread.start()
+        self.logger.info(f"ShmTransport started (downlink {self.downlink.name})")
+        return True
+
+    def stop(self) -> bool:
+        """Stop bridging and destroy the downlink ring (stop hosted agents first)"""
+        if not self._running:
+            return False
+        self._running = False
+        if self._thread:
+            self._thread.join()
+        with self._write_lock:
+            forwarded = list(self._forwarded)
+            self._forwarded.clear()
+        for event_type in forwarded:
+            self.event_bus.unsubscribe(event_type, self._forward)
+        self.downlink.close()
+        self.downlink.unlink()
+        self.downlink = None
+        self.logger.info("ShmTransport stopped")
+        return True
+
+    # ==================== Children ====================
+
+    def connect(self, host: Any, uplink: SharedRing) -> int:
+        """
+        Register a hosted agent before its process starts
+
+        Returns:
+            Peer id of the child (its downlink reader slot + 1)
+        """
+        with self._write_lock:
+            peer = self.downlink.add_reader() + 1
+            # The new reader starts here: re-define every symbol for it
+            self._codec.reset()
+        reader = uplink.reader(uplink.add_reader())
+        self._children[peer] = (host, reader, BinaryCodec())
+        return peer
+
+    def disconnect(self, peer: int) -> None:
+        """Forget a child and free its downlink slot"""
+        child = self._children.pop(peer, None)
+        if child is not None:
+            child[1].close()
+        if self.downlink is not None:
+            self.downlink.remove_reader(peer - 1)
+
+    def send_stop(self, peer: int) -> None:
+        """Ask one child to stop its agent and exit"""
+        with self._write_lock:
+            self.downlink.write(b"", KIND_STOP, peer, timeout=self.write_timeout)
+
+    # ==================== Parent -> children ====================
+
+    def _request(self, event_type: EventType) -> None:
+        # Bridge thread: guard the set against stop() / get_stats() on other threads
+        with self._write_lock:
+            if event_type in self._forwarded:
+                return
+            self._forwarded.add(event_type)
+        self.event_bus.subscribe(event_type, self._forward)
+
+    def _forward(self, event: Event) -> None:
+        """Parent bus handler: copy the event onto the downlink"""
+        bridged = getattr(self._bridging, "event", None)
+        origin = PARENT_PEER
+        if bridged is not None and event.data is bridged[1] and event.event_type is bridged[0]:
+            origin = bridged[2]
+        with self._write_lock:
+            try:
+                self.downlink.write(self._codec.encode_event(event), KIND_EVENT, origin,
+                                    timeout=self.write_timeout)
+            except TimeoutError:
+                # encode_event() already marked this record's new symbols as sent;
+                # start over so the next record defines them again
+                self._codec.reset()
+                self._dropped += 1
+                self.logger.warning(f"Downlink full for {self.write_timeout}s; "
+                                    f"dropped {event.event_type.value} from {event.source}")
+                return
+            self._events_down += 1
+
+    # ==================== Children -> parent ====================
+
+    def _run(self) -> None:
+        """Bridge loop: drain every uplink"""
+        attempt = 0
+        while self._running:
+            handled = 0
+            for peer, child in list(self._children.items()):
+                try:
+                    handled += self._drain(peer, *child)
+                except Exception as e:
+                    self.logger.error(f"ShmTransport uplink {peer} failed: {e}")
+            if handled:
+                attempt = 0
+            else:
+                backoff(attempt)
+                attempt += 1
+
+    def _drain(self, peer: int, host: Any, reader: RingReader, codec: BinaryCodec) -> int:
+        records = reader.read()
+        publish = self.event_bus.publish
+        bridging = self._bridging
+        for _, kind, _, payload in records:
+            if kind == KIND_EVENT:
+                event = codec.decode_event(payload)
+                bridging.event = (event.event_type, event.data, peer)
+                try:
+                    publish(event.event_type, event.data, source=event.source, key=event.key)
+                finally:
+                    bridging.event = None
+                self._events_up += 1
+            elif kind == KIND_SUBSCRIBE:
+                self._request(EventType(payload.decode("utf-8")))
+            else:
+                host.on_control(kind, payload)
+        return len(records)
+
+    def get_stats(self) -> dict:
+        """Transport statistics"""
+        with self._write_lock:
+            forwarded = sorted(event_type.value for event_type in self._forwarded)
+        return {
+            "running": self._running,
+            "children": len(self._children),
+            "forwarded_types": forwarded,
+            "events_down": self._events_down,
+            "events_up": self._events_up,
+            "dropped": self._dropped,
+            "downlink": self.downlink.get_stats() if self.downlink is not None else None
+        }
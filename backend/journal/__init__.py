@@ -0,0 +1,4 @@
+"""
+PROJECT PREDATOR - Journal Package
+Append-only event journal (recording and indexed replay)
+"""
@@ -0,0 +1,100 @@
+"""
+PROJECT PREDATOR - Journal Codecs
+Encode the variable part of a journal record (source, key, payload)
+"""
+import pickle
+from typing import Any, Dict, Hashable, Optional, Tuple
+
+from backend.codec.binary import BinaryCodec
+
+
+class JournalCodec:
+    """
+    Record body codec
+
+    The segment layer stores timestamp and event type in a fixed record
+    header; the codec only handles (source, key, data). Each codec has a
+    one-byte id written into every segment header, so a reader always
+    decodes a segment with the codec that wrote it.
+
+    A stateful codec (one whose records refer to earlier records) must
+    make every index block decodable on its own: the writer calls
+    new_block() before the first record of each block, and the reader
+    passes records it skips inside a block to observe().
+    """
+
+    codec_id = 0
+    name = "abstract"
+    stateful = False
+
+    def encode(self, source: str, key: Optional[Hashable], data: Any) -> bytes:
+        """Encode one record body"""
+        raise NotImplementedError
+
+    def decode(self, body: bytes) -> Tuple[str, Optional[Hashable], Any]:
+        """Decode one record body into (source, key, data)"""
+        raise NotImplementedError
+
+    def new_block(self) -> None:
+        """The next record starts an index block"""
+
+    def observe(self, body: bytes) -> None:
+        """A record of the current block is skipped instead of decoded"""
+
+
+class PickleCodec(JournalCodec):
+    """
+    Pickle (highest protocol) of the (source, key, data) tuple
+
+    Handles any picklable payload, including the slotted payload classes.
+    """
+
+    codec_id = 1
+    name = "pickle"
+
+    def encode(self, source: str, key: Optional[Hashable], data: Any) -> bytes:
+        return pickle.dumps((source, key, data), pickle.HIGHEST_PROTOCOL)
+
+    def decode(self, body: bytes) -> Tuple[str, Optional[Hashable], Any]:
+        return pickle.loads(body)
+
+
+class BinaryJournalCodec(JournalCodec):
+    """
+    BinaryCodec bodies (fixed-layout payloads, interned strings)
+
+    Symbols are re-defined in every index block, so the reader can
+    start at any block the index selects.
+    """
+
+    codec_id = 2
+    name = "binary"
+    stateful = True
+
+    def __init__(self):
+        self._codec = BinaryCodec()
+        self.encode = self._codec.encode_body
+        self.decode = self._codec.decode_body
+        self.observe = self._codec.observe
+
+    def new_block(self) -> None:
+        self._codec.reset()
+
+
+CODECS: Dict[int, type] = {
+    PickleCodec.codec_id: PickleCodec,
+    BinaryJournalCodec.codec_id: BinaryJournalCodec,
+}
+
+
+def codec_for(codec_id: int) -> JournalCodec:
+    """
+    Instantiate the codec that wrote a segment
+
+    Raises:
+        ValueError: Unknown codec id
+    """
+    try:
+        return CODECS[codec_id]()
+    except KeyError:
+        raise ValueError(f"Unknown journal codec id {codec_id}") from None
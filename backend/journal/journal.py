@@ -0,0 +1,185 @@
+"""
+PROJECT PREDATOR - EventJournal
+Records every EventBus event into append-only journal segments
+"""
+import logging
+import os
+import threading
+from collections import deque
+from typing import Optional
+
+from backend.core.event_bus import EventBus, EventType, Event
+from backend.journal.codec import BinaryJournalCodec, JournalCodec
+from backend.journal.segment import SegmentWriter, list_segments, segment_path
+
+
+class EventJournal:
+    """
+    Append-only event journal
+
+    Subscribes to every EventType (all routing keys). The handler only
+    appends the Event to an in-memory deque; a writer thread drains the
+    deque every `flush_interval` seconds, encodes the records and copies
+    them into memory-mapped segment files. Segments roll over at
+    `segment_size` bytes and each gets a sparse block index, so
+    JournalReader can replay any time range without a full scan.
+
+    Events are journaled in the order the journal's handler sees them,
+    which is what a replay reproduces. Start the journal before the
+    other components subscribe: its handler then runs first for every
+    event, so an event is always journaled before anything its
+    handlers publish.
+    """
+
+    def __init__(self, event_bus: EventBus, directory: str,
+                 segment_size: int = 64 * 1024 * 1024,
+                 index_interval: int = 256,
+                 flush_interval: float = 0.05,
+                 codec: Optional[JournalCodec] = None,
+                 sync: bool = False):
+        """
+        Initialize EventJournal
+
+        Args:
+            event_bus: Bus to record
+            directory: Journal directory (created if missing)
+            segment_size: Preallocated bytes per segment file
+            index_interval: Records per sparse index block
+            flush_interval: Seconds between writer passes
+            codec: Record body codec (defaults to BinaryJournalCodec)
+            sync: msync segments after every writer pass
+        """
+        self.logger = logging.getLogger(__name__)
+        self.event_bus = event_bus
+        self.directory = directory
+        self.segment_size = segment_size
+        self.index_interval = index_interval
+        self.flush_interval = flush_interval
+        self.codec = codec or BinaryJournalCodec()
+        self.sync = sync
+        self._type_names = [event_type.value for event_type in EventType]
+        self._ordinals = {event_type: i for i, event_type in enumerate(EventType)}
+
+        self._pending: deque = deque()
+        self._wakeup = threading.Event()
+        self._running = False
+        self._thread: Optional[threading.Thread] = None
+        self._segment: Optional[SegmentWriter] = None
+        self._next_segment = 0
+
+        # Stats
+        self._events_written = 0
+        self._bytes_written = 0
+        self._segments_written = 0
+        self._encode_errors = 0
+        self.logger.info(f"EventJournal initialized (directory={directory})")
+
+    def get_name(self) -> str:
+        return self.__class__.__name__
+
+    def start(self) -> bool:
+        """Start recording"""
+        if self._running:
+            self.logger.warning("EventJournal already running")
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        existing = list_segments(self.directory)
+        self._next_segment = existing[-1][0] + 1 if existing else 0
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name="EventJournal-writer", daemon=True)
+        self._thread.start()
+        for event_type in EventType:
+            self.event_bus.subscribe(event_type, self._on_event)
+        self.logger.info(f"EventJournal started (first segment {self._next_segment})")
+        return True
+
+    def stop(self) -> bool:
+        """Stop recording, write everything still pending and seal the segment"""
+        if not self._running:
+            self.logger.warning("EventJournal not running")
+            return False
+        for event_type in EventType:
+            self.event_bus.unsubscribe(event_type, self._on_event)
+        self._running = False
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join()
+        self._drain()
+        if self._segment is not None:
+            self._segment.seal()
+            self._segment = None
+        self.logger.info(f"EventJournal stopped ({self._events_written} events journaled)")
+        return True
+
+    def _on_event(self, event: Event) -> None:
+        # Hot path: deque.append is atomic, everything else is on the writer
+        self._pending.append(event)
+
+    def _run(self) -> None:
+        """Writer loop"""
+        while self._running:
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self._drain()
+            except Exception as e:
+                self.logger.error(f"EventJournal write failed: {e}")
+
+    def _drain(self) -> None:
+        """Encode and write every pending event (writer thread only)"""
+        pending = self._pending
+        if not pending:
+            return
+        codec = self.codec
+        encode = codec.encode
+        ordinals = self._ordinals
+        written = 0
+        while pending:
+            event = pending.popleft()
+            segment = self._segment
+            try:
+                if segment is None or segment.at_block_start:
+                    codec.new_block()
+                body = encode(event.source, event.key, event.data)
+                roll = segment is None or not segment.fits(len(body))
+                if roll:
+                    # First record of the next segment: encode it as a block start
+                    codec.new_block()
+                    body = encode(event.source, event.key, event.data)
+            except Exception as e:
+                self._encode_errors += 1
+                self.logger.error(f"Cannot journal {event.event_type.value} from {event.source}: {e}")
+                continue
+            if roll:
+                segment = self._roll(len(body))
+            segment.append(event.timestamp_ns, ordinals[event.event_type], body)
+            written += 1
+            self._bytes_written += len(body)
+        self._events_written += written
+        if self._segment is not None:
+            self._segment.flush(self.sync)
+
+    def _roll(self, body_len: int) -> SegmentWriter:
+        """Seal the current segment and open the next one"""
+        if self._segment is not None:
+            self._segment.seal()
+        path = segment_path(self.directory, self._next_segment)
+        self._next_segment += 1
+        self._segment = SegmentWriter(path, self.segment_size, self.codec, self._type_names,
+                                      self.index_interval, min_body=body_len)
+        self._segments_written += 1
+        self.logger.debug(f"EventJournal rolled to {path}")
+        return self._segment
+
+    def get_stats(self) -> dict:
+        """Get journal statistics"""
+        return {
+            "directory": self.directory,
+            "codec": self.codec.name,
+            "running": self._running,
+            "pending": len(self._pending),
+            "events_written": self._events_written,
+            "bytes_written": self._bytes_written,
+            "segments_written": self._segments_written,
+            "encode_errors": self._encode_errors
+        }
@@ -0,0 +1,299 @@
+"""
+PROJECT PREDATOR - Journal Segments
+Memory-mapped, append-only segment files with a sparse block index
+"""
+import json
+import mmap
+import os
+import struct
+from typing import Callable, Iterator, List, Optional, Sequence, Tuple
+
+from backend.journal.codec import JournalCodec, codec_for
+
+# Segment file: header, then records until a zero length (or end of file).
+#   header: magic, codec id, length of the JSON event type table, table
+#   record: body length, timestamp_ns, event type ordinal, body
+SEGMENT_MAGIC = b"PJRNL001"
+HEADER = struct.Struct("<8sBH")
+RECORD = struct.Struct("<IqB")
+
+# Index file (<segment>.idx): magic, then one entry per block of records:
+#   first record offset, end offset, min/max timestamp_ns, event type
+#   bitmask, record count
+INDEX_MAGIC = b"PJIDX001"
+INDEX_ENTRY = struct.Struct("<QQqqQI")
+
+SEGMENT_SUFFIX = ".seg"
+INDEX_SUFFIX = ".idx"
+
+# Ordinals >= 63 share the top bit of the type mask
+_MASK_BITS = 63
+
+
+def type_bit(ordinal: int) -> int:
+    """Bit for an event type ordinal in a block's type mask"""
+    return 1 << min(ordinal, _MASK_BITS)
+
+
+def segment_path(directory: str, number: int) -> str:
+    """Path of segment `number` in a journal directory"""
+    return os.path.join(directory, f"{number:08d}{SEGMENT_SUFFIX}")
+
+
+def index_path(path: str) -> str:
+    """Index file belonging to a segment file"""
+    return path[:-len(SEGMENT_SUFFIX)] + INDEX_SUFFIX
+
+
+def list_segments(directory: str) -> List[Tuple[int, str]]:
+    """(number, path) of every segment in a journal directory, oldest first"""
+    if not os.path.isdir(directory):
+        return []
+    segments = []
+    for name in os.listdir(directory):
+        stem, suffix = os.path.splitext(name)
+        if suffix == SEGMENT_SUFFIX and stem.isdigit():
+            segments.append((int(stem), os.path.join(directory, name)))
+    return sorted(segments)
+
+
+class SegmentWriter:
+    """
+    Writes one preallocated, memory-mapped segment
+
+    Records are copied straight into the mapping; the file is truncated
+    to its used length when the segment is sealed. A record's length is
+    written after its body, so a reader of a live or crashed segment
+    never sees a length without the bytes behind it.
+
+    Every `index_interval` records a block entry is appended to the
+    index file, covering the block's offsets, timestamp range and the
+    set of event types it contains.
+    """
+
+    def __init__(self, path: str, size: int, codec: JournalCodec, type_names: Sequence[str],
+                 index_interval: int = 256, min_body: int = 0):
+        """
+        Initialize segment writer
+
+        Args:
+            path: Segment file path
+            size: Bytes to preallocate (the mapping never grows)
+            codec: Body codec (its id goes into the header)
+            type_names: Event type table; records store indexes into it
+            index_interval: Records per index block
+            min_body: Grow `size` so a record with this body length fits
+        """
+        self.path = path
+        self.index_interval = max(1, index_interval)
+        types = json.dumps(list(type_names)).encode("utf-8")
+        header = HEADER.pack(SEGMENT_MAGIC, codec.codec_id, len(types)) + types
+        self.size = max(size, len(header) + RECORD.size + min_body)
+        self._file = open(path, "w+b")
+        self._file.truncate(self.size)
+        self._mm = mmap.mmap(self._file.fileno(), self.size)
+        self._mm[:len(header)] = header
+        self.data_offset = len(header)
+        self.offset = self.data_offset
+        self.count = 0
+        self.min_ts: Optional[int] = None
+        self.max_ts: Optional[int] = None
+        self._index = open(index_path(path), "wb")
+        self._index.write(INDEX_MAGIC)
+        self._reset_block()
+
+    def _reset_block(self) -> None:
+        self._block_offset = self.offset
+        self._block_min = None
+        self._block_max = None
+        self._block_mask = 0
+        self._block_count = 0
+
+    @property
+    def at_block_start(self) -> bool:
+        """Whether the next record starts a new index block"""
+        return self._block_count == 0
+
+    def fits(self, body_len: int) -> bool:
+        """Whether a record with this body length still fits"""
+        return self.offset + RECORD.size + body_len <= self.size
+
+    def append(self, timestamp_ns: int, type_ordinal: int, body: bytes) -> bool:
+        """
+        Append one record
+
+        Returns:
+            False if the segment is full (nothing was written)
+        """
+        end = self.offset + RECORD.size + len(body)
+        if end > self.size:
+            return False
+        mm = self._mm
+        mm[self.offset + RECORD.size:end] = body
+        RECORD.pack_into(mm, self.offset, len(body), timestamp_ns, type_ordinal)
+        self.offset = end
+        self.count += 1
+
+        if self._block_count == 0:
+            self._block_min = self._block_max = timestamp_ns
+        elif timestamp_ns < self._block_min:
+            self._block_min = timestamp_ns
+        elif timestamp_ns > self._block_max:
+            self._block_max = timestamp_ns
+        self._block_mask |= type_bit(type_ordinal)
+        self._block_count += 1
+        if self._block_count >= self.index_interval:
+            self._close_block()
+        return True
+
+    def _close_block(self) -> None:
+        if not self._block_count:
+            return
+        self._index.write(INDEX_ENTRY.pack(self._block_offset, self.offset, self._block_min,
+                                           self._block_max, self._block_mask, self._block_count))
+        if self.min_ts is None or self._block_min < self.min_ts:
+            self.min_ts = self._block_min
+        if self.max_ts is None or self._block_max > self.max_ts:
+            self.max_ts = self._block_max
+        self._reset_block()
+
+    def flush(self, sync: bool = False) -> None:
+        """
+        Push the index to the OS; with sync=True also msync the mapping
+        """
+        self._index.flush()
+        if sync:
+            self._mm.flush()
+
+    def seal(self) -> None:
+        """Close the last block, unmap and truncate the file to its used length"""
+        self._close_block()
+        self._index.close()
+        self._mm.flush()
+        self._mm.close()
+        self._file.truncate(self.offset)
+        self._file.close()
+
+
+class IndexBlock:
+    """One index entry: a contiguous run of records"""
+
+    __slots__ = ("offset", "end", "min_ts", "max_ts", "mask", "count")
+
+    def __init__(self, offset: int, end: int, min_ts: int, max_ts: int, mask: int, count: int):
+        self.offset = offset
+        self.end = end
+        self.min_ts = min_ts
+        self.max_ts = max_ts
+        self.mask = mask
+        self.count = count
+
+
+class SegmentReader:
+    """
+    Read-only view of one segment (sealed, live or left behind by a crash)
+
+    Indexed blocks outside the requested time range, or without any of
+    the requested event types, are skipped without touching their
+    records. Records after the last indexed block are scanned.
+    """
+
+    def __init__(self, path: str):
+        """
+        Open a segment
+
+        Raises:
+            ValueError: Not a journal segment
+        """
+        self.path = path
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            self._mm = mmap.mmap(f.fileno(), size, access=mmap.ACCESS_READ) if size else b""
+        if len(self._mm) < HEADER.size:
+            raise ValueError(f"Truncated journal segment {path}")
+        magic, codec_id, types_len = HEADER.unpack_from(self._mm, 0)
+        if magic != SEGMENT_MAGIC:
+            raise ValueError(f"Not a journal segment: {path}")
+        self.codec = codec_for(codec_id)
+        types_start = HEADER.size
+        self.type_names: List[str] = json.loads(bytes(self._mm[types_start:types_start + types_len]))
+        self.data_offset = types_start + types_len
+        self.blocks = self._read_index()
+
+    def _read_index(self) -> List[IndexBlock]:
+        try:
+            with open(index_path(self.path), "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return []
+        if raw[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            return []
+        blocks = []
+        size = len(self._mm)
+        for pos in range(len(INDEX_MAGIC), len(raw) - INDEX_ENTRY.size + 1, INDEX_ENTRY.size):
+            block = IndexBlock(*INDEX_ENTRY.unpack_from(raw, pos))
+            if block.end > size:
+                break
+            blocks.append(block)
+        return blocks
+
+    def close(self) -> None:
+        """Unmap the segment"""
+        if isinstance(self._mm, mmap.mmap):
+            self._mm.close()
+
+    def _scan(self, offset: int, end: Optional[int]) -> Iterator[Tuple[int, int, int, int]]:
+        """(timestamp_ns, type ordinal, body start, body end) from offset up to end (or the last record)"""
+        mm = self._mm
+        limit = len(mm) if end is None else end
+        unpack_from = RECORD.unpack_from
+        header_size = RECORD.size
+        while offset + header_size <= limit:
+            body_len, timestamp_ns, ordinal = unpack_from(mm, offset)
+            if body_len == 0:
+                return
+            start = offset + header_size
+            offset = start + body_len
+            if offset > limit:
+                return
+            yield timestamp_ns, ordinal, start, offset
+
+    def records(self, start_ns: Optional[int] = None, end_ns: Optional[int] = None,
+                ordinals: Optional[set] = None,
+                skipped: Optional[Callable[[bytes], None]] = None) -> Iterator[Tuple[int, int, bytes]]:
+        """
+        (timestamp_ns, type ordinal, body) in file order
+
+        Args:
+            start_ns: Inclusive lower timestamp bound
+            end_ns: Exclusive upper timestamp bound
+            ordinals: Event type ordinals to keep (None = all)
+            skipped: Called with the body of every filtered-out record
+                     inside the blocks that are scanned
+        """
+        mask = None
+        if ordinals is not None:
+            mask = 0
+            for ordinal in ordinals:
+                mask |= type_bit(ordinal)
+        mm = self._mm
+        spans = []
+        for block in self.blocks:
+            if start_ns is not None and block.max_ts < start_ns:
+                continue
+            if end_ns is not None and block.min_ts >= end_ns:
+                continue
+            if mask is not None and not block.mask & mask:
+                continue
+            spans.append((block.offset, block.end))
+        spans.append((self.blocks[-1].end if self.blocks else self.data_offset, None))
+
+        for offset, end in spans:
+            for timestamp_ns, ordinal, body_start, body_end in self._scan(offset, end):
+                if ((start_ns is not None and timestamp_ns < start_ns)
+                        or (end_ns is not None and timestamp_ns >= end_ns)
+                        or (ordinals is not None and ordinal not in ordinals)):
+                    if skipped is not None:
+                        skipped(mm[body_start:body_end])
+                    continue
+                yield timestamp_ns, ordinal, mm[body_start:body_end]
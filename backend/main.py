@@ -2,35 +2,40 @@
 PROJECT PREDATOR - Main Entry Point
 Bootstraps and runs the Trading OS
 """
+import argparse
 import signal
 import sys
 import time
-import uvicorn
 from threading import Thread
 
 # Setup logging first
 from backend.monitor.logging import setup_logging
 logger = setup_logging()
 
-# Import core components
+# Import core components (agents, simulations and the health server are
+# resolved from the component catalog when first used)
 from backend.core.engine import CoreEngine
 from backend.core.config import config
-from backend.monitor.health import HealthMonitor
-
-# Import all agents (FAZ 2 - Blueprint structure)
-from backend.agents.market_scanner.agent import MarketScannerAgent
-from backend.agents.data_engineering.agent import DataEngineeringAgent
-from backend.agents.execution.agent import ExecutionAgent
-from backend.agents.portfolio.agent import PortfolioManagerAgent
-from backend.agents.cro.agent import CRORiskAgent
-from backend.agents.performance.agent import PerformanceKPIAgent
-from backend.agents.aspa.agent import ASPAAgent
-from backend.agents.rrs.agent import RRSAgent
+from backend.core.components import resolve
+
+# Agents (FAZ 2 - Blueprint structure, exact Blueprint order)
+AGENTS = (
+    "MarketScannerAgent",
+    "DataEngineeringAgent",
+    "ExecutionAgent",
+    "PortfolioManagerAgent",
+    "CRORiskAgent",
+    "PerformanceKPIAgent",
+    "ASPAAgent",
+    "RRSAgent",
+)
 
 # Simulation components (FAZ 3 - Fake Data Flow)
-from backend.simulation.fake_market import FakeMarket
-from backend.simulation.fake_price_feed import FakePriceFeed
-from backend.simulation.fake_strategy import FakeStrategy
+SIMULATIONS = (
+    "FakeMarket",
+    "FakePriceFeed",
+    "FakeStrategy",
+)
 
 
 class PredatorPlatform:
@@ -51,8 +56,8 @@ class PredatorPlatform:
         # Initialize core engine (FAZ 1)
         self.core_engine = CoreEngine()
         
-        # Initialize health monitor
-        self.health_monitor = HealthMonitor(self.core_engine)
+        # Health monitor (FastAPI) is built when the health server starts
+        self._health_monitor = None
         
         # Initialize agents (FAZ 2)
         self._initialize_agents()
@@ -85,16 +90,7 @@ class PredatorPlatform:
         registry = self.core_engine.registry
         
         # Create agents (exact Blueprint order)
-        agents = [
-            MarketScannerAgent(event_bus, registry),
-            DataEngineeringAgent(event_bus, registry),
-            ExecutionAgent(event_bus, registry),
-            PortfolioManagerAgent(event_bus, registry),
-            CRORiskAgent(event_bus, registry),
-            PerformanceKPIAgent(event_bus, registry),
-            ASPAAgent(event_bus, registry),
-            RRSAgent(event_bus, registry)
-        ]
+        agents = [resolve(name)(event_bus, registry) for name in AGENTS]
         
         # Register agents with CoreEngine
         for agent in agents:
@@ -115,11 +111,7 @@ class PredatorPlatform:
         event_bus = self.core_engine.event_bus
         registry = self.core_engine.registry
 
-        simulations = [
-            FakeMarket(event_bus, registry),
-            FakePriceFeed(event_bus, registry),
-            FakeStrategy(event_bus, registry),
-        ]
+        simulations = [resolve(name)(event_bus, registry) for name in SIMULATIONS]
 
         for sim in simulations:
             self.core_engine.register_simulation(sim)
@@ -191,11 +183,21 @@ class PredatorPlatform:
         finally:
             self.stop()
     
+    @property
+    def health_monitor(self):
+        """HealthMonitor for the core engine (imports FastAPI on first use)"""
+        if self._health_monitor is None:
+            self._health_monitor = resolve("HealthMonitor")(self.core_engine)
+        return self._health_monitor
+    
     def _start_health_server(self) -> None:
         """Start the health check HTTP server"""
+        import uvicorn
+        app = self.health_monitor.get_app()
+        
         def run_server():
             uvicorn.run(
-                self.health_monitor.get_app(),
+                app,
                 host="0.0.0.0",
                 port=config.HEALTH_CHECK_PORT,
                 log_level="warning"
@@ -212,8 +214,46 @@ class PredatorPlatform:
         sys.exit(0)
 
 
+def run_sharded(shards: int, symbols: int, steps: int) -> None:
+    """
+    Run a symbol-sharded replay and report throughput
+    
+    Each shard is a worker process with its own CoreEngine (scanner,
+    strategy, execution, portfolio) for its slice of the symbols; the
+    coordinator aggregates exposure and owns the global kill switch.
+    """
+    from backend.sharding.coordinator import ShardCoordinator
+    from backend.sharding.partition import symbol_universe
+    
+    coordinator = ShardCoordinator(symbol_universe(symbols), shards, steps=steps)
+    if not coordinator.start():
+        logger.error("Failed to start sharded engine")
+        sys.exit(1)
+    try:
+        coordinator.wait_for_completion()
+    except KeyboardInterrupt:
+        logger.info("Keyboard interrupt received")
+    finally:
+        coordinator.stop()
+    summary = coordinator.summary()
+    exposure = summary["exposure"]
+    logger.info(f"[OK] {summary['events']:,} events over {shards} shards in {summary['elapsed_s']:.2f}s "
+                f"({summary['events_per_second']:,.0f} events/s)")
+    logger.info(f"Exposure: gross {exposure['gross']:.2f}, net {exposure['net']:.2f}, "
+                f"{exposure['positions']} positions, halted={summary['halted']}")
+
+
 def main():
     """Main entry point"""
+    parser = argparse.ArgumentParser(description="PROJECT PREDATOR Trading OS")
+    parser.add_argument("--shards", type=int, default=config.SHARD_COUNT,
+                        help="Run a symbol-sharded replay on N worker processes (0 = platform)")
+    parser.add_argument("--symbols", type=int, default=1000, help="Symbols in the sharded replay")
+    parser.add_argument("--steps", type=int, default=100, help="Price updates per symbol in the sharded replay")
+    args = parser.parse_args()
+    if args.shards > 0:
+        run_sharded(args.shards, args.symbols, args.steps)
+        return
     platform = PredatorPlatform()
     platform.run()
 
@@ -2,9 +2,9 @@
 PROJECT PREDATOR - Candle
 Simple OHLCV structure.
 """
-from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any, Dict, Union
+from typing import Union
+from backend.core.payloads import Payload
 
 
 def _parse_timestamp(value: Union[str, float, int]) -> float:
@@ -18,25 +18,26 @@ def _parse_timestamp(value: Union[str, float, int]) -> float:
         return float(value)
 
 
-@dataclass
-class Candle:
-    timestamp: float
-    open: float
-    high: float
-    low: float
-    close: float
-    volume: float = 0.0
+class Candle(Payload):
+    """
+    OHLCV candle
+
+    Published as-is as the FAKE_CANDLE / CANDLE_EVENT payload; the dict
+    view keeps `candle.get("close")` style consumers working.
+    """
+
+    _fields = ("timestamp", "open", "high", "low", "close", "volume")
+    __slots__ = _fields
+
+    def __init__(self, timestamp: float = 0.0, open: float = 0.0, high: float = 0.0, low: float = 0.0,
+                 close: float = 0.0, volume: float = 0.0):
+        self.timestamp = timestamp
+        self.open = open
+        self.high = high
+        self.low = low
+        self.close = close
+        self.volume = volume
 
     @staticmethod
     def from_row(ts_value: Union[str, float, int], o: float, h: float, l: float, c: float, v: float) -> "Candle":
         return Candle(_parse_timestamp(ts_value), o, h, l, c, v)
-
-    def to_dict(self) -> Dict[str, Any]:
-        return {
-            "timestamp": self.timestamp,
-            "open": self.open,
-            "high": self.high,
-            "low": self.low,
-            "close": self.close,
-            "volume": self.volume,
-        }
@@ -0,0 +1,128 @@
+"""
+PROJECT PREDATOR - CandleStore
+Columnar OHLCV storage (one contiguous NumPy array per field).
+"""
+from collections.abc import Sequence as SequenceABC
+from typing import Iterable, Iterator, List, Optional, Sequence, Union
+
+import numpy as np
+
+from backend.market.candle import Candle
+
+# Rows converted to Python floats at a time while iterating
+_ITER_CHUNK = 4096
+
+
+class CandleStore:
+    """
+    Candles as six float64 columns
+
+    A list of Candle objects costs ~200 bytes per bar (object header,
+    slots and six boxed floats); a CandleStore costs 48. It reads like a
+    sequence of candles: len(), iteration and store[i] yield Candle
+    objects built on demand, so replayers and strategies take either.
+    Slicing (store[a:b], between()) returns a CandleStore whose columns
+    are views into the same buffers, so no rows are copied.
+
+    Timestamps are UTC epoch seconds, expected in ascending order.
+    """
+
+    FIELDS = Candle._fields
+
+    __slots__ = FIELDS
+
+    def __init__(self, timestamp: Sequence[float], open: Sequence[float], high: Sequence[float],
+                 low: Sequence[float], close: Sequence[float], volume: Optional[Sequence[float]] = None):
+        """
+        Initialize CandleStore
+
+        Args:
+            timestamp, open, high, low, close: Column values (arrays are used without copying
+                when already 1-D float64)
+            volume: Volume column (None = zeros)
+
+        Raises:
+            ValueError: Columns of different lengths or not one-dimensional
+        """
+        columns = [np.asarray(col, dtype=np.float64) for col in (timestamp, open, high, low, close)]
+        columns.append(np.zeros(len(columns[0])) if volume is None else np.asarray(volume, dtype=np.float64))
+        length = len(columns[0])
+        for name, col in zip(self.FIELDS, columns):
+            if col.ndim != 1 or len(col) != length:
+                raise ValueError(f"Column {name} must be 1-D with {length} rows")
+            setattr(self, name, col)
+
+    @classmethod
+    def from_candles(cls, candles: Iterable[Candle]) -> "CandleStore":
+        """Pack Candle objects (or candle dicts) into columns"""
+        rows = [(c["timestamp"], c["open"], c["high"], c["low"], c["close"], c.get("volume", 0.0))
+                for c in candles]
+        if not rows:
+            return cls.empty()
+        return cls(*np.array(rows, dtype=np.float64).T)
+
+    @classmethod
+    def empty(cls) -> "CandleStore":
+        return cls(*([np.empty(0)] * 6))
+
+    @classmethod
+    def concat(cls, stores: Sequence["CandleStore"]) -> "CandleStore":
+        """One store holding the rows of several (copies)"""
+        if not stores:
+            return cls.empty()
+        return cls(*(np.concatenate([getattr(s, name) for s in stores]) for name in cls.FIELDS))
+
+    # ==================== Sequence ====================
+
+    def __len__(self) -> int:
+        return len(self.timestamp)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[Candle, "CandleStore"]:
+        if isinstance(index, slice):
+            return CandleStore(*(getattr(self, name)[index] for name in self.FIELDS))
+        return Candle(float(self.timestamp[index]), float(self.open[index]), float(self.high[index]),
+                      float(self.low[index]), float(self.close[index]), float(self.volume[index]))
+
+    def __iter__(self) -> Iterator[Candle]:
+        for start in range(0, len(self), _ITER_CHUNK):
+            stop = start + _ITER_CHUNK
+            yield from map(Candle, *(getattr(self, name)[start:stop].tolist() for name in self.FIELDS))
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+    def __repr__(self) -> str:
+        if not len(self):
+            return "CandleStore(rows=0)"
+        return f"CandleStore(rows={len(self)}, start={self.timestamp[0]}, end={self.timestamp[-1]})"
+
+    # ==================== Columnar access ====================
+
+    def columns(self) -> List[np.ndarray]:
+        """The six column arrays, in Candle field order"""
+        return [getattr(self, name) for name in self.FIELDS]
+
+    def between(self, start: Optional[float] = None, end: Optional[float] = None) -> "CandleStore":
+        """
+        Zero-copy view of the rows with start <= timestamp < end
+
+        Args:
+            start: Epoch seconds (None = from the first row)
+            end: Epoch seconds, exclusive (None = to the last row)
+        """
+        lo = 0 if start is None else int(np.searchsorted(self.timestamp, start, side="left"))
+        hi = len(self) if end is None else int(np.searchsorted(self.timestamp, end, side="left"))
+        return self[lo:hi]
+
+    def copy(self) -> "CandleStore":
+        """Store with its own buffers (e.g. to release a larger parent)"""
+        return CandleStore(*(col.copy() for col in self.columns()))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the column buffers"""
+        return sum(col.nbytes for col in self.columns())
+
+
+# Reads as a sequence of Candle (len / index / slice / iter)
+SequenceABC.register(CandleStore)
@@ -5,9 +5,10 @@ Owns FakePriceFeed for price updates.
 """
 import logging
 import uuid
-from typing import Optional, Dict
+from typing import Optional, Mapping
 
 from backend.core.event_bus import EventBus, EventType, Event
+from backend.core.payloads import OrderRequest
 from backend.market.orderbook_stub import OrderBookStub
 from backend.market.fake_price_feed import FakePriceFeed
 from backend.market.candle import Candle
@@ -50,25 +51,20 @@ class FakeMarket:
         self.logger.info("FakeMarket stopped")
         return True
 
-    def process_order(self, order: Dict) -> None:
+    def process_order(self, order: Mapping) -> None:
         """
         Process order and emit ORDER_FILLED + EXECUTION_RESULT.
         """
-        order = dict(order or {})
-        if "order_id" not in order:
-            order["order_id"] = str(uuid.uuid4())
-        candle_data = {"close": order.get("price", 0.0)}
-        if self.price_feed._last_candle:
-            candle_data = self.price_feed._last_candle.to_dict()
-        candle = Candle(
-            timestamp=candle_data.get("timestamp", 0.0),
-            open=candle_data.get("open", candle_data.get("close", 0.0)),
-            high=candle_data.get("high", candle_data.get("close", 0.0)),
-            low=candle_data.get("low", candle_data.get("close", 0.0)),
-            close=candle_data.get("close", 0.0),
-            volume=candle_data.get("volume", 0.0),
-        )
+        order = OrderRequest.from_mapping(order)
+        if order.order_id is None:
+            # The request payload is shared with other subscribers; copy it
+            order = order.replace(order_id=str(uuid.uuid4()))
+        candle = self.price_feed._last_candle
+        if candle is None:
+            price = order.price
+            candle = Candle(0.0, price, price, price, price, 0.0)
         fill = self.orderbook.fill_order(order, candle)
-        self.event_bus.publish(EventType.ORDER_FILLED, fill, source=self.get_name())
-        self.event_bus.publish(EventType.EXECUTION_RESULT, fill, source=self.get_name())
-        self.logger.info(f"Filled fake order {order.get('order_id')} at {fill['price']}")
+        symbol = fill.symbol
+        self.event_bus.publish(EventType.ORDER_FILLED, fill, source=self.get_name(), key=symbol)
+        self.event_bus.publish(EventType.EXECUTION_RESULT, fill, source=self.get_name(), key=symbol)
+        self.logger.info(f"Filled fake order {order.order_id} at {fill.price}")
@@ -5,6 +5,7 @@ Transforms Candle into PRICE_UPDATE and FAKE_CANDLE events.
 import logging
 from typing import Optional
 from backend.core.event_bus import EventBus, EventType, Event
+from backend.core.payloads import PriceUpdate
 from backend.market.candle import Candle
 
 
@@ -26,6 +27,8 @@ class FakePriceFeed:
             return False
         self._running = True
         self._candle_handler = self._on_candle
+        # No batch_handler: downstream fills price off _last_candle, so every
+        # candle must run its whole chain before the next one is applied
         self.event_bus.subscribe(EventType.FAKE_CANDLE, self._candle_handler)
         self.logger.info("FakePriceFeed started (listening to FAKE_CANDLE)")
         return True
@@ -41,25 +44,13 @@ class FakePriceFeed:
         return True
 
     def _on_candle(self, event: Event) -> None:
-        data = event.data or {}
-        candle = Candle(
-            timestamp=data.get("timestamp", 0.0),
-            open=data.get("open", 0.0),
-            high=data.get("high", 0.0),
-            low=data.get("low", 0.0),
-            close=data.get("close", 0.0),
-            volume=data.get("volume", 0.0),
-        )
+        # The replayer publishes Candle objects; other producers may still send dicts
+        candle = Candle.from_mapping(event.data)
         self._last_candle = candle
 
         # Publish price update
-        price_update = {
-            "symbol": "BTC/USD",
-            "price": candle.close,
-            "timestamp": candle.timestamp,
-            "fake": True,
-        }
-        self.event_bus.publish(EventType.PRICE_UPDATE, price_update, source=self.get_name())
+        price_update = PriceUpdate("BTC/USD", candle.close, candle.timestamp, True)
+        self.event_bus.publish(EventType.PRICE_UPDATE, price_update, source=self.get_name(), key=price_update.symbol)
         # Also publish canonical candle event
-        self.event_bus.publish(EventType.CANDLE_EVENT, data, source=self.get_name())
-        self.logger.debug(f"Published PRICE_UPDATE {price_update}")
+        self.event_bus.publish(EventType.CANDLE_EVENT, candle, source=self.get_name())
+        self.logger.debug("Published PRICE_UPDATE %s", price_update)
@@ -2,7 +2,8 @@
 PROJECT PREDATOR - OrderBookStub
 Simple fill logic for fake execution.
 """
-from typing import Dict
+from typing import Mapping
+from backend.core.payloads import Fill, OrderRequest
 from backend.market.candle import Candle
 
 
@@ -15,19 +16,12 @@ class OrderBookStub:
     def __init__(self, slippage_percent: float = 0.0):
         self.slippage_percent = max(slippage_percent, 0.0)
 
-    def fill_order(self, order: Dict, last_candle: Candle) -> Dict:
-        price = order.get("price") or last_candle.close
+    def fill_order(self, order: Mapping, last_candle: Candle) -> Fill:
+        order = OrderRequest.from_mapping(order)
+        price = order.price or last_candle.close
         slip = price * self.slippage_percent / 100.0
-        if order.get("side") == "BUY":
+        if order.side == "BUY":
             price = price + slip
-        elif order.get("side") == "SELL":
+        elif order.side == "SELL":
             price = price - slip
-        return {
-            "order_id": order.get("order_id"),
-            "symbol": order.get("symbol", "BTC/USD"),
-            "side": order.get("side"),
-            "quantity": order.get("quantity", 0.0),
-            "price": price,
-            "status": "FILLED",
-            "fake": True,
-        }
+        return Fill(order.order_id, order.symbol, order.side, order.quantity, price, "FILLED", True)
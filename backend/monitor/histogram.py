@@ -0,0 +1,159 @@
+"""
+PROJECT PREDATOR - LatencyHistogram
+Compact fixed-bucket latency histogram
+"""
+from typing import List, Optional
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram (power-of-two microsecond buckets)
+
+    Bucket i counts samples below 2**i microseconds; the last bucket
+    collects everything above the range (~16.7s). Recording is a
+    bit_length() and a list increment, so it is cheap enough for the
+    dispatch hot path. Percentiles are reported as bucket upper bounds.
+
+    Not thread-safe: keep one histogram per writer and merge() for stats.
+    """
+
+    NUM_BUCKETS = 26
+
+    __slots__ = ("_counts", "_count", "_total_ns", "_max_ns")
+
+    def __init__(self):
+        self._counts: List[int] = [0] * self.NUM_BUCKETS
+        self._count = 0
+        self._total_ns = 0
+        self._max_ns = 0
+
+    def record(self, ns: int) -> None:
+        """
+        Record one sample
+
+        Args:
+            ns: Latency in nanoseconds
+        """
+        if ns < 0:
+            ns = 0
+        index = (ns // 1000).bit_length()
+        if index >= self.NUM_BUCKETS:
+            index = self.NUM_BUCKETS - 1
+        self._counts[index] += 1
+        self._count += 1
+        self._total_ns += ns
+        if ns > self._max_ns:
+            self._max_ns = ns
+
+    def merge(self, other: "LatencyHistogram") -> "LatencyHistogram":
+        """Add another histogram's samples into this one (returns self)"""
+        for i, c in enumerate(other._counts):
+            self._counts[i] += c
+        self._count += other._count
+        self._total_ns += other._total_ns
+        if other._max_ns > self._max_ns:
+            self._max_ns = other._max_ns
+        return self
+
+    @property
+    def count(self) -> int:
+        """Number of samples"""
+        return self._count
+
+    @property
+    def max_ns(self) -> int:
+        """Largest sample in nanoseconds"""
+        return self._max_ns
+
+    def percentile_ns(self, pct: float) -> int:
+        """
+        Upper bound (ns) of the bucket holding the pct-th percentile
+
+        Args:
+            pct: Percentile in [0, 100]
+        """
+        if not self._count:
+            return 0
+        target = max(1, int(self._count * pct / 100.0 + 0.999999))
+        seen = 0
+        for i, c in enumerate(self._counts):
+            seen += c
+            if seen >= target:
+                if i == self.NUM_BUCKETS - 1:
+                    return self._max_ns
+                # Never report a bound above the observed maximum
+                return min((1 << i) * 1000, self._max_ns)
+        return self._max_ns
+
+    def summary(self) -> dict:
+        """Count, mean, p50, p99 and max in milliseconds"""
+        return {
+            "count": self._count,
+            "mean_ms": (self._total_ns / self._count / 1e6) if self._count else 0.0,
+            "p50_ms": self.percentile_ns(50) / 1e6,
+            "p99_ms": self.percentile_ns(99) / 1e6,
+            "max_ms": self._max_ns / 1e6
+        }
+
+
+class RollingHistogram:
+    """
+    LatencyHistogram over a sliding time window
+
+    Samples go into the current of `windows` sub-histograms; each covers
+    `window_seconds` and the oldest is dropped as time moves on, so the
+    snapshot reflects roughly the last windows * window_seconds. Time is
+    passed in by the caller (wall or simulated seconds).
+
+    Not thread-safe, like LatencyHistogram.
+    """
+
+    __slots__ = ("window_seconds", "_histograms", "_index", "_window_start")
+
+    def __init__(self, windows: int = 6, window_seconds: float = 10.0):
+        """
+        Initialize RollingHistogram
+
+        Args:
+            windows: Number of sub-histograms kept
+            window_seconds: Time covered by each sub-histogram
+        """
+        self.window_seconds = window_seconds
+        self._histograms: List[LatencyHistogram] = [LatencyHistogram() for _ in range(max(1, windows))]
+        self._index = 0
+        self._window_start: Optional[float] = None
+
+    def _rotate(self, now: float) -> None:
+        if self._window_start is None:
+            self._window_start = now
+            return
+        elapsed = int((now - self._window_start) // self.window_seconds)
+        if elapsed <= 0:
+            return
+        for _ in range(min(elapsed, len(self._histograms))):
+            self._index = (self._index + 1) % len(self._histograms)
+            self._histograms[self._index] = LatencyHistogram()
+        self._window_start += elapsed * self.window_seconds
+
+    def record(self, ns: int, now: float) -> None:
+        """
+        Record one sample
+
+        Args:
+            ns: Latency in nanoseconds
+            now: Current time in seconds
+        """
+        self._rotate(now)
+        self._histograms[self._index].record(ns)
+
+    def snapshot(self, now: float) -> LatencyHistogram:
+        """Merged histogram of the live windows"""
+        self._rotate(now)
+        merged = LatencyHistogram()
+        for histogram in self._histograms:
+            merged.merge(histogram)
+        return merged
+
+    def summary(self, now: float) -> dict:
+        """LatencyHistogram.summary() of the live windows"""
+        return self.snapshot(now).summary()
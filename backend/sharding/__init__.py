@@ -0,0 +1,4 @@
+"""
+PROJECT PREDATOR - Sharding Package
+Symbol-partitioned engines in worker processes under one coordinator
+"""
@@ -0,0 +1,211 @@
+"""
+PROJECT PREDATOR - ShardCoordinator
+Runs symbol shards in worker processes and holds the global risk view
+"""
+import logging
+import os
+import threading
+from typing import Dict, List, Optional, Sequence
+
+from backend.core.config import config
+from backend.core.engine import CoreEngine
+from backend.core.event_bus import Event, EventBus, EventType
+from backend.core.payloads import ExposureReport
+from backend.core.policy_guard import PolicyGuard
+from backend.ipc.process_host import ProcessAgentHost
+from backend.ipc.transport import ShmTransport
+from backend.sharding.partition import partition
+from backend.sharding.worker import DOWNLINK_TYPES, REPLAY_METRIC, UPLINK_TYPES, ShardWorker
+
+
+class ExposureMonitor:
+    """
+    Global exposure across shards
+
+    Keeps the latest ExposureReport of every shard and the totals. When
+    total gross exposure exceeds max_gross_exposure, or a shard reports
+    its own kill switch, the coordinator's PolicyGuard is activated; its
+    KILL_SWITCH_ACTIVATED is then forwarded to every shard.
+    """
+
+    def __init__(self, event_bus: EventBus, policy_guard: PolicyGuard, max_gross_exposure: float = 0.0):
+        """
+        Initialize ExposureMonitor
+
+        Args:
+            event_bus: Coordinator EventBus
+            policy_guard: Global PolicyGuard
+            max_gross_exposure: Kill-switch limit on total gross exposure (0 = no limit)
+        """
+        self.event_bus = event_bus
+        self.policy_guard = policy_guard
+        self.max_gross_exposure = max_gross_exposure
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._lock = threading.Lock()
+        self._reports: Dict[int, ExposureReport] = {}
+        self._running = False
+
+    def get_name(self) -> str:
+        return self.__class__.__name__
+
+    def start(self) -> bool:
+        if self._running:
+            self.logger.warning("ExposureMonitor already running")
+            return False
+        self._running = True
+        self.event_bus.subscribe(EventType.EXPOSURE_UPDATE, self._on_exposure)
+        self.event_bus.subscribe(EventType.KILL_SWITCH_ACTIVATED, self._on_kill_switch)
+        return True
+
+    def stop(self) -> bool:
+        if not self._running:
+            self.logger.warning("ExposureMonitor not running")
+            return False
+        self._running = False
+        self.event_bus.unsubscribe(EventType.EXPOSURE_UPDATE, self._on_exposure)
+        self.event_bus.unsubscribe(EventType.KILL_SWITCH_ACTIVATED, self._on_kill_switch)
+        return True
+
+    def _on_exposure(self, event: Event) -> None:
+        report = ExposureReport.from_mapping(event.data)
+        with self._lock:
+            self._reports[report.shard] = report
+        totals = self.totals()
+        if (self.max_gross_exposure > 0 and totals["gross"] > self.max_gross_exposure
+                and not self.policy_guard.is_system_halted()):
+            self.policy_guard.activate_kill_switch(
+                f"Gross exposure {totals['gross']:.2f} above limit {self.max_gross_exposure:.2f}")
+
+    def _on_kill_switch(self, event: Event) -> None:
+        # A shard halted itself: halt everything (our own activation is already halted)
+        if not self.policy_guard.is_system_halted():
+            reason = (event.data or {}).get("reason", "shard kill switch")
+            self.policy_guard.activate_kill_switch(f"{event.source}: {reason}")
+
+    def totals(self) -> dict:
+        """Sum of the latest report of every shard"""
+        with self._lock:
+            reports = list(self._reports.values())
+        return {
+            "shards_reporting": len(reports),
+            "gross": sum(r.gross for r in reports),
+            "net": sum(r.net for r in reports),
+            "positions": sum(r.positions for r in reports),
+            "realized": sum(r.realized for r in reports),
+            "unrealized": sum(r.unrealized for r in reports)
+        }
+
+    def health_check(self) -> dict:
+        return {"name": self.get_name(), "running": self._running, **self.totals()}
+
+
+class ShardCoordinator:
+    """
+    Symbol-sharded engine
+
+    Hash-partitions the symbol universe across `shards` ShardWorker
+    processes, each hosted by a ProcessAgentHost on one shared
+    ShmTransport and registered as an agent of the coordinator's own
+    CoreEngine. Per-symbol traffic stays inside the shards; the
+    coordinator only sees exposure reports, kill switches and replay
+    metrics.
+    """
+
+    def __init__(self, symbols: Sequence[str], shards: int, steps: int = 100,
+                 max_gross_exposure: Optional[float] = None,
+                 report_interval: Optional[float] = None,
+                 shard_log_level: int = logging.WARNING,
+                 seed: int = 1337):
+        """
+        Initialize ShardCoordinator
+
+        Args:
+            symbols: Symbol universe
+            shards: Number of worker processes
+            steps: Price updates each shard replays per symbol
+            max_gross_exposure: Global gross exposure limit (None = config, 0 = no limit)
+            report_interval: Seconds between shard exposure reports (None = config)
+            shard_log_level: Log level inside the workers (per-event INFO logs cost throughput)
+            seed: Replay seed
+        """
+        if shards < 1:
+            raise ValueError("shards must be >= 1")
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.shards = shards
+        self.symbols = list(symbols)
+        self.partitions = partition(self.symbols, shards)
+        journal_dir = os.path.join(config.JOURNAL_DIR, "coordinator") if config.JOURNAL_DIR else ""
+        self.engine = CoreEngine(journal_dir=journal_dir)
+        self.transport = ShmTransport(self.engine.event_bus, max_children=shards)
+        self.exposure = ExposureMonitor(
+            self.engine.event_bus,
+            self.engine.policy_guard,
+            config.MAX_GROSS_EXPOSURE if max_gross_exposure is None else max_gross_exposure
+        )
+        self.engine.register_simulation(self.exposure)
+        self.hosts: List[ProcessAgentHost] = []
+        for shard_id, shard_symbols in enumerate(self.partitions):
+            host = ProcessAgentHost(
+                self.engine.event_bus,
+                self.engine.registry,
+                ShardWorker,
+                {"shard_id": shard_id, "symbols": shard_symbols, "steps": steps,
+                 "report_interval": report_interval, "seed": seed},
+                transport=self.transport,
+                name=f"ShardWorker-{shard_id}",
+                uplink_types=UPLINK_TYPES,
+                downlink_types=DOWNLINK_TYPES,
+                log_level=shard_log_level
+            )
+            self.hosts.append(host)
+            self.engine.register_agent(host)
+
+        self._results: Dict[int, dict] = {}
+        self._done = threading.Condition()
+        self.engine.event_bus.subscribe(EventType.METRIC_PUBLISHED, self._on_metric)
+
+    def start(self) -> bool:
+        """Spawn every shard, then start the replay in all of them at once"""
+        self.transport.start()
+        if not self.engine.start():
+            self.transport.stop()
+            return False
+        self.engine.event_bus.publish(EventType.REPLAY_START, {"shards": self.shards}, source="ShardCoordinator")
+        self.logger.info(f"{self.shards} shards replaying {len(self.symbols)} symbols")
+        return True
+
+    def stop(self) -> bool:
+        """Stop the shards and the coordinator engine"""
+        result = self.engine.stop()
+        self.transport.stop()
+        return result
+
+    def _on_metric(self, event: Event) -> None:
+        data = event.data or {}
+        if data.get("metric") != REPLAY_METRIC:
+            return
+        with self._done:
+            self._results[data["shard"]] = dict(data)
+            self._done.notify_all()
+
+    def wait_for_completion(self, timeout: Optional[float] = None) -> bool:
+        """Block until every shard has finished (or halted) its replay"""
+        with self._done:
+            return self._done.wait_for(lambda: len(self._results) >= self.shards, timeout)
+
+    def summary(self) -> dict:
+        """Replay throughput across shards plus the global exposure"""
+        with self._done:
+            results = [self._results[shard] for shard in sorted(self._results)]
+        events = sum(r["events"] for r in results)
+        elapsed = (max(r["finished"] for r in results) - min(r["started"] for r in results)) if results else 0.0
+        return {
+            "shards": self.shards,
+            "symbols": len(self.symbols),
+            "events": events,
+            "elapsed_s": elapsed,
+            "events_per_second": events / elapsed if elapsed > 0 else 0.0,
+            "halted": self.engine.policy_guard.is_system_halted(),
+            "exposure": self.exposure.totals(),
+            "per_shard": results
+        }
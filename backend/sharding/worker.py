@@ -0,0 +1,226 @@
+"""
+PROJECT PREDATOR - ShardWorker
+One symbol shard: a full CoreEngine pipeline running in a worker process
+"""
+import logging
+import os
+import random
+import threading
+import time
+from typing import Dict, Iterable, Optional
+
+from backend.agents.execution.agent import ExecutionAgent
+from backend.agents.market_scanner.agent import MarketScannerAgent
+from backend.agents.portfolio.agent import PortfolioManagerAgent
+from backend.core.config import config
+from backend.core.engine import CoreEngine
+from backend.core.event_bus import Event, EventBus, EventType
+from backend.core.payloads import ExposureReport, PositionSnapshot, PriceUpdate
+from backend.core.registry import Registry
+from backend.interfaces.agent import IAgent
+from backend.market.fake_market import FakeMarket
+from backend.simulation.fake_strategy import FakeStrategy
+
+# What crosses the shard's rings; everything else stays in the shard
+UPLINK_TYPES = frozenset({
+    EventType.EXPOSURE_UPDATE,
+    EventType.KILL_SWITCH_ACTIVATED,
+    EventType.METRIC_PUBLISHED,
+    EventType.SYSTEM_ERROR,
+})
+DOWNLINK_TYPES = frozenset({
+    EventType.KILL_SWITCH_ACTIVATED,
+    EventType.REPLAY_START,
+})
+
+REPLAY_METRIC = "shard_replay"
+
+
+class ShardWorker(IAgent):
+    """
+    Engine for one partition of the symbol universe
+
+    Meant to be hosted by ProcessAgentHost: event_bus is then the child's
+    RemoteEventBus, and the worker builds its own CoreEngine on it with
+    market scanner, strategy, execution and portfolio limited to its
+    symbols. Market data, orders and fills never leave the process; the
+    shard only reports ExposureReport aggregates (EXPOSURE_UPDATE) and a
+    final METRIC_PUBLISHED to the coordinator.
+
+    The replay (a random walk per symbol) begins on REPLAY_START, so all
+    shards start together, and stops early once the local PolicyGuard is
+    halted. A KILL_SWITCH_ACTIVATED from the coordinator halts the local
+    guard.
+    """
+
+    def __init__(self, event_bus: EventBus, registry: Registry, shard_id: int = 0,
+                 symbols: Iterable[str] = (), steps: int = 100,
+                 report_interval: Optional[float] = None, seed: int = 1337,
+                 journal_dir: Optional[str] = None):
+        """
+        Initialize ShardWorker
+
+        Args:
+            event_bus: Bus of the hosting process
+            registry: Registry of the hosting process
+            shard_id: Shard index
+            symbols: Symbols owned by this shard
+            steps: Price updates to replay per symbol
+            report_interval: Seconds between exposure reports (None = config)
+            seed: Random walk seed (the shard id is added)
+            journal_dir: Shard journal directory (None = JOURNAL_DIR/shard-N if set)
+        """
+        self.event_bus = event_bus
+        self.registry = registry
+        self.shard_id = shard_id
+        self.symbols = tuple(symbols)
+        self.steps = steps
+        self.report_interval = (config.EXPOSURE_REPORT_INTERVAL if report_interval is None
+                                else report_interval)
+        self.seed = seed
+        self.logger = logging.getLogger(f"{self.__class__.__name__}-{shard_id}")
+        if journal_dir is None:
+            journal_dir = os.path.join(config.JOURNAL_DIR, f"shard-{shard_id}") if config.JOURNAL_DIR else ""
+        self.engine = CoreEngine(event_bus=event_bus, journal_dir=journal_dir)
+
+        bus = self.engine.event_bus
+        engine_registry = self.engine.registry
+        # ExecutionAgent depends on FakeMarket, so the engine starts the market first
+        self.engine.register_simulation(FakeMarket(bus))
+        self.engine.register_agent(MarketScannerAgent(bus, engine_registry, self.symbols))
+        self.engine.register_agent(ExecutionAgent(bus, engine_registry))
+        self.engine.register_agent(PortfolioManagerAgent(bus, engine_registry, self.symbols))
+        self.engine.register_simulation(FakeStrategy(bus, engine_registry))
+
+        self._lock = threading.Lock()
+        self._positions: Dict[str, PositionSnapshot] = {}
+        self._realized = 0.0
+        self._replay_thread: Optional[threading.Thread] = None
+        self._stop_replay = threading.Event()
+        self._events = 0
+        self._started: Optional[float] = None
+        self._finished: Optional[float] = None
+        self._running = False
+
+    def get_name(self) -> str:
+        return f"{self.__class__.__name__}-{self.shard_id}"
+
+    def start(self) -> bool:
+        """Start the shard engine and wait for REPLAY_START"""
+        if self._running:
+            self.logger.warning(f"{self.get_name()} already running")
+            return False
+        bus = self.engine.event_bus
+        bus.subscribe(EventType.POSITION_UPDATE, self._on_position)
+        bus.subscribe(EventType.KILL_SWITCH_ACTIVATED, self._on_kill_switch)
+        bus.subscribe(EventType.REPLAY_START, self._on_replay_start)
+        if not self.engine.start():
+            return False
+        self._running = True
+        self.logger.info(f"{self.get_name()} started with {len(self.symbols)} symbols")
+        return True
+
+    def stop(self) -> bool:
+        """Stop the replay (if still running) and the shard engine"""
+        if not self._running:
+            self.logger.warning(f"{self.get_name()} not running")
+            return False
+        self._running = False
+        self._stop_replay.set()
+        if self._replay_thread is not None:
+            self._replay_thread.join()
+        bus = self.engine.event_bus
+        bus.unsubscribe(EventType.POSITION_UPDATE, self._on_position)
+        bus.unsubscribe(EventType.KILL_SWITCH_ACTIVATED, self._on_kill_switch)
+        bus.unsubscribe(EventType.REPLAY_START, self._on_replay_start)
+        self.engine.stop()
+        self.logger.info(f"{self.get_name()} stopped")
+        return True
+
+    # ==================== Handlers ====================
+
+    def _on_replay_start(self, event: Event) -> None:
+        if self._replay_thread is None:
+            self._replay_thread = threading.Thread(target=self._replay, name=f"{self.get_name()}-replay",
+                                                   daemon=True)
+            self._replay_thread.start()
+
+    def _on_kill_switch(self, event: Event) -> None:
+        guard = self.engine.policy_guard
+        if not guard.is_system_halted():
+            reason = (event.data or {}).get("reason", "coordinator")
+            guard.activate_kill_switch(f"global: {reason}")
+
+    def _on_position(self, event: Event) -> None:
+        snapshot = event.data
+        with self._lock:
+            self._positions[snapshot.symbol] = snapshot
+            # realized is the portfolio-wide running total on every snapshot
+            self._realized = snapshot.realized
+
+    # ==================== Replay ====================
+
+    def _replay(self) -> None:
+        rng = random.Random(self.seed + self.shard_id)
+        prices = {symbol: 100.0 * (1.0 + rng.random()) for symbol in self.symbols}
+        publish = self.engine.event_bus.publish
+        guard = self.engine.policy_guard
+        source = self.get_name()
+        self._started = time.time()
+        next_report = self._started + self.report_interval
+        base_ts = 1.7e9
+        for step in range(self.steps):
+            if self._stop_replay.is_set() or guard.is_system_halted():
+                break
+            timestamp = base_ts + step
+            for symbol in self.symbols:
+                price = prices[symbol] * (1.0 + rng.gauss(0.0, 0.001))
+                prices[symbol] = price
+                publish(EventType.PRICE_UPDATE, PriceUpdate(symbol, price, timestamp), source=source, key=symbol)
+            self._events += len(self.symbols)
+            now = time.time()
+            if now >= next_report:
+                self._report_exposure()
+                next_report = now + self.report_interval
+        self._finished = time.time()
+        self._report_exposure()
+        publish(EventType.METRIC_PUBLISHED, {
+            "metric": REPLAY_METRIC,
+            "shard": self.shard_id,
+            "events": self._events,
+            "started": self._started,
+            "finished": self._finished,
+            "halted": guard.is_system_halted()
+        }, source=source)
+
+    def exposure(self) -> ExposureReport:
+        """Aggregate of the latest position snapshot per symbol"""
+        with self._lock:
+            snapshots = list(self._positions.values())
+            realized = self._realized
+        gross = net = unrealized = 0.0
+        positions = 0
+        for snapshot in snapshots:
+            notional = snapshot.qty * snapshot.last_price
+            gross += abs(notional)
+            net += notional
+            unrealized += snapshot.unrealized
+            if snapshot.qty:
+                positions += 1
+        return ExposureReport(self.shard_id, gross, net, positions, realized, unrealized)
+
+    def _report_exposure(self) -> None:
+        self.engine.event_bus.publish(EventType.EXPOSURE_UPDATE, self.exposure(), source=self.get_name(),
+                                      key=self.shard_id)
+
+    def health_check(self) -> dict:
+        """Shard health: replay progress, halt state and current exposure"""
+        return {
+            "name": self.get_name(),
+            "running": self._running,
+            "symbols": len(self.symbols),
+            "events_replayed": self._events,
+            "replay_finished": self._finished is not None,
+            "halted": self.engine.policy_guard.is_system_halted(),
+            "exposure": dict(self.exposure())
+        }
@@ -0,0 +1,327 @@
+"""
+PROJECT PREDATOR - CandleCache
+Memory-mapped .npy candle cache, converted once from CSV / Parquet.
+
+Usage:
+    python -m backend.simulation.candle_cache build data/*.csv
+    python -m backend.simulation.candle_cache list
+    python -m backend.simulation.candle_cache prune [--max-age-days N] [--max-mb N]
+"""
+import argparse
+import hashlib
+import json
+import logging
+import os
+import shutil
+import time
+from typing import List, Optional
+
+import numpy as np
+
+from backend.market.candle_store import CandleStore
+from backend.simulation.historical_data_loader import HistoricalDataLoader
+
+# Cache entry: <cache_dir>/<key>/ with one <field>.npy per Candle field and
+# meta.json (source path, size, mtime_ns, content hash, rows). meta.json's
+# mtime is bumped on every load and drives LRU pruning.
+META_FILE = "meta.json"
+CACHE_VERSION = 1
+_HASH_BLOCK = 1 << 20
+
+
+def content_hash(path: str) -> str:
+    """BLAKE2b digest of a file's bytes"""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class CandleCache:
+    """
+    Source file -> memory-mapped CandleStore
+
+    Each dataset is written once as per-column .npy files; later loads
+    are np.load(mmap_mode="r") opens, so they cost a stat() and six
+    mmaps, and concurrent backtests share the pages through the OS page
+    cache. An entry is valid while the source's path, size and mtime
+    match; if only size/mtime changed (touched or copied file), the
+    content hash decides between reusing and rebuilding. Entries are
+    published with a directory rename, so readers never see a partial
+    one, and a build that finds an equal entry already published keeps
+    that one, so concurrent converters never pull files from under each
+    other's readers.
+    """
+
+    def __init__(self, cache_dir: str, loader: Optional[HistoricalDataLoader] = None):
+        """
+        Initialize CandleCache
+
+        Args:
+            cache_dir: Cache directory (created on first build)
+            loader: Loader used for conversion (None = default HistoricalDataLoader)
+        """
+        self.cache_dir = cache_dir
+        self.loader = loader or HistoricalDataLoader()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(path: str) -> str:
+        """Cache entry name of a source path"""
+        return hashlib.blake2b(os.path.abspath(path).encode(), digest_size=12).hexdigest()
+
+    def entry_dir(self, path: str) -> str:
+        return os.path.join(self.cache_dir, self.key(path))
+
+    # ==================== Lookup / load ====================
+
+    def lookup(self, path: str) -> Optional[dict]:
+        """
+        Metadata of a valid cache entry for path, or None
+
+        Size and mtime are checked first; on a mismatch the source is
+        hashed and a content match re-validates the entry in place.
+        """
+        meta = self._read_meta(self.entry_dir(path))
+        if meta is None or meta.get("version") != CACHE_VERSION:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if meta["size"] == stat.st_size and meta["mtime_ns"] == stat.st_mtime_ns:
+            return meta
+        if meta["size"] != stat.st_size or content_hash(path) != meta["content_hash"]:
+            return None
+        meta["mtime_ns"] = stat.st_mtime_ns
+        self._write_meta(self.entry_dir(path), meta)
+        return meta
+
+    def load(self, path: str) -> CandleStore:
+        """
+        Memory-mapped CandleStore of path (converting it on a cache miss)
+
+        Raises:
+            ImportError: Parquet source without pyarrow
+        """
+        try:
+            return self._open(path)
+        except FileNotFoundError:
+            # Entry replaced by another process between lookup and open
+            return self._open(path)
+
+    def _open(self, path: str) -> CandleStore:
+        entry = self.entry_dir(path)
+        if self.lookup(path) is None:
+            self.misses += 1
+            self.build(path, force=True)
+        else:
+            self.hits += 1
+        os.utime(os.path.join(entry, META_FILE))
+        return CandleStore(*(np.load(os.path.join(entry, f"{name}.npy"), mmap_mode="r")
+                             for name in CandleStore.FIELDS))
+
+    # ==================== Build ====================
+
+    def build(self, path: str, force: bool = False) -> dict:
+        """
+        Convert path into the cache (no-op while a valid entry exists)
+
+        Args:
+            path: CSV or .parquet source
+            force: Rebuild even if the entry is valid
+
+        Returns:
+            Entry metadata
+        """
+        if not force:
+            meta = self.lookup(path)
+            if meta is not None:
+                return meta
+        started = time.perf_counter()
+        stat = os.stat(path)
+        digest = content_hash(path)
+        if path.endswith(".parquet"):
+            store = self.loader.load_parquet(path)
+            if store is None:
+                raise ImportError("Parquet sources require pyarrow")
+        else:
+            store = self.loader.load_csv(path)
+
+        os.makedirs(self.cache_dir, exist_ok=True)
+        entry = self.entry_dir(path)
+        staging = f"{entry}.tmp-{os.getpid()}"
+        shutil.rmtree(staging, ignore_errors=True)
+        os.makedirs(staging)
+        for name, column in zip(CandleStore.FIELDS, store.columns()):
+            np.save(os.path.join(staging, f"{name}.npy"), np.ascontiguousarray(column, dtype=np.float64))
+        meta = {
+            "version": CACHE_VERSION,
+            "source": os.path.abspath(path),
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "content_hash": digest,
+            "rows": len(store),
+            "bytes": store.nbytes,
+            "created": time.time()
+        }
+        self._write_meta(staging, meta)
+        meta = self._publish(staging, entry, meta)
+        self.logger.info(f"Cached {meta['rows']} rows of {path} in {time.perf_counter() - started:.2f}s")
+        return meta
+
+    def _publish(self, staging: str, entry: str, meta: dict) -> dict:
+        # Another process converted the same content meanwhile: keep its entry, which
+        # readers may already be mapping
+        current = self._read_meta(entry)
+        if (current is not None and current.get("version") == CACHE_VERSION
+                and current.get("content_hash") == meta["content_hash"]):
+            shutil.rmtree(staging, ignore_errors=True)
+            return current
+        # Move any old entry aside first: a directory rename cannot replace a non-empty one.
+        # Processes still mapping the old files keep reading them until they close.
+        if os.path.exists(entry):
+            retired = f"{entry}.old-{os.getpid()}"
+            try:
+                os.replace(entry, retired)
+                shutil.rmtree(retired, ignore_errors=True)
+            except OSError:
+                pass
+        try:
+            os.replace(staging, entry)
+        except OSError:
+            # Another process published the same source first
+            shutil.rmtree(staging, ignore_errors=True)
+        return meta
+
+    # ==================== Maintenance ====================
+
+    def entries(self) -> List[dict]:
+        """Metadata of every entry, with its key and last_used time"""
+        if not os.path.isdir(self.cache_dir):
+            return []
+        result = []
+        for name in sorted(os.listdir(self.cache_dir)):
+            entry = os.path.join(self.cache_dir, name)
+            meta = self._read_meta(entry) if "." not in name else None
+            if meta is not None:
+                meta["key"] = name
+                meta["last_used"] = os.path.getmtime(os.path.join(entry, META_FILE))
+                result.append(meta)
+        return result
+
+    def prune(self, max_age_days: Optional[float] = None, max_bytes: Optional[int] = None,
+              keep_missing: bool = False) -> List[dict]:
+        """
+        Remove entries
+
+        Args:
+            max_age_days: Remove entries not loaded for this long
+            max_bytes: Then remove least recently used entries until the cache fits
+            keep_missing: Keep entries whose source file is gone or whose content changed
+                since the build (a touched file with the same content is not stale)
+
+        Returns:
+            Metadata of the removed entries
+        """
+        now = time.time()
+        entries = sorted(self.entries(), key=lambda meta: meta["last_used"])
+        removed = []
+        kept = []
+        for meta in entries:
+            stale = not keep_missing and self._source_changed(meta)
+            expired = max_age_days is not None and now - meta["last_used"] > max_age_days * 86400
+            (removed if stale or expired else kept).append(meta)
+        if max_bytes is not None:
+            total = sum(meta["bytes"] for meta in kept)
+            while kept and total > max_bytes:
+                meta = kept.pop(0)
+                total -= meta["bytes"]
+                removed.append(meta)
+        for meta in removed:
+            shutil.rmtree(os.path.join(self.cache_dir, meta["key"]), ignore_errors=True)
+        # Leftovers of interrupted builds
+        for name in os.listdir(self.cache_dir) if os.path.isdir(self.cache_dir) else ():
+            if ".tmp-" in name or ".old-" in name:
+                shutil.rmtree(os.path.join(self.cache_dir, name), ignore_errors=True)
+        return removed
+
+    @staticmethod
+    def _source_changed(meta: dict) -> bool:
+        try:
+            stat = os.stat(meta["source"])
+        except OSError:
+            return True
+        if stat.st_size != meta["size"]:
+            return True
+        # Same rule as lookup(): a new mtime alone is settled by the content hash
+        return stat.st_mtime_ns != meta["mtime_ns"] and content_hash(meta["source"]) != meta["content_hash"]
+
+    @staticmethod
+    def _read_meta(entry: str) -> Optional[dict]:
+        try:
+            with open(os.path.join(entry, META_FILE)) as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_meta(entry: str, meta: dict) -> None:
+        partial = os.path.join(entry, META_FILE + ".tmp")
+        with open(partial, "w") as f:
+            json.dump(meta, f)
+        os.replace(partial, os.path.join(entry, META_FILE))
+
+    def get_stats(self) -> dict:
+        """Cache statistics"""
+        entries = self.entries()
+        return {
+            "cache_dir": self.cache_dir,
+            "entries": len(entries),
+            "bytes": sum(meta["bytes"] for meta in entries),
+            "hits": self.hits,
+            "misses": self.misses
+        }
+
+
+def main():
+    from backend.core.config import config
+
+    parser = argparse.ArgumentParser(description="PROJECT PREDATOR candle cache")
+    parser.add_argument("--cache-dir", default=config.CANDLE_CACHE_DIR or None,
+                        help="Cache directory (default: CANDLE_CACHE_DIR)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    build = commands.add_parser("build", help="Convert CSV / Parquet files into the cache")
+    build.add_argument("paths", nargs="+")
+    build.add_argument("--force", action="store_true", help="Rebuild valid entries too")
+    commands.add_parser("list", help="Show cache entries")
+    prune = commands.add_parser("prune", help="Remove stale, old or least recently used entries")
+    prune.add_argument("--max-age-days", type=float, default=None, help="Remove entries unused for N days")
+    prune.add_argument("--max-mb", type=float, default=None, help="Shrink the cache to N MB (LRU)")
+    prune.add_argument("--keep-missing", action="store_true", help="Keep entries whose source is gone or changed")
+    args = parser.parse_args()
+    if not args.cache_dir:
+        parser.error("--cache-dir is required when CANDLE_CACHE_DIR is not set")
+
+    cache = CandleCache(args.cache_dir)
+    if args.command == "build":
+        for path in args.paths:
+            meta = cache.build(path, force=args.force)
+            print(f"{path}: {meta['rows']} rows, {meta['bytes'] / 1e6:.1f} MB")
+    elif args.command == "list":
+        for meta in cache.entries():
+            print(f"{meta['key']}  {meta['rows']:>12} rows  {meta['bytes'] / 1e6:>9.1f} MB  {meta['source']}")
+    else:
+        max_bytes = int(args.max_mb * 1e6) if args.max_mb is not None else None
+        removed = cache.prune(args.max_age_days, max_bytes, args.keep_missing)
+        for meta in removed:
+            print(f"removed {meta['key']}  {meta['source']}")
+        stats = cache.get_stats()
+        print(f"{stats['entries']} entries, {stats['bytes'] / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
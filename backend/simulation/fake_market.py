@@ -61,5 +61,5 @@ class FakeMarket:
             "tick_number": event.data.get("tick_number", 0),
             "fake": True,
         }
-        self.event_bus.publish(EventType.FAKE_CANDLE, candle, source=self.get_name())
+        self.event_bus.publish(EventType.FAKE_CANDLE, candle, source=self.get_name(), key=candle["symbol"])
         self.logger.debug(f"Published FAKE_CANDLE: {candle}")
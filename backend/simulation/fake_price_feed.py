@@ -53,5 +53,5 @@ class FakePriceFeed:
             "source": "FakePriceFeed",
             "fake": True
         }
-        self.event_bus.publish(EventType.PRICE_UPDATE, price_update, source=self.get_name())
+        self.event_bus.publish(EventType.PRICE_UPDATE, price_update, source=self.get_name(), key=price_update["symbol"])
         self.logger.debug(f"Published PRICE_UPDATE: {price_update}")
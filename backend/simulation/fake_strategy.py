@@ -69,5 +69,5 @@ class FakeStrategy:
             "price": data.get("source_price", 0.0),
             "fake": True
         }
-        self.event_bus.publish(EventType.ORDER_REQUEST, order, source=self.get_name())
+        self.event_bus.publish(EventType.ORDER_REQUEST, order, source=self.get_name(), key=order["symbol"])
         self.logger.info("Emitted fake ORDER_REQUEST (stub)")
@@ -3,9 +3,20 @@ PROJECT PREDATOR - HistoricalDataLoader
 Loads OHLCV candles from CSV or Parquet (UTC-aware timestamps).
 """
 import csv
-from typing import List, Optional
+import logging
+import time
+import warnings
+from itertools import islice
+from typing import Iterator, List, Optional, Sequence, Tuple
 from datetime import datetime, timezone
+
+import numpy as np
+
 from backend.market.candle import Candle
+from backend.market.candle_store import CandleStore
+
+# (timestamp column, [open, high, low, close] columns, volume column or None)
+_Layout = Tuple[int, Tuple[int, ...], Optional[int]]
 
 
 class HistoricalDataLoader:
@@ -13,7 +24,27 @@ class HistoricalDataLoader:
     Loads historical candles from CSV.
     CSV columns: timestamp,open,high,low,close,volume
     Timestamp expected as ISO8601 or epoch seconds.
+
+    CSVs are parsed chunk_rows lines at a time straight into NumPy
+    columns (np.loadtxt). The timestamp format is detected once per file
+    from the first row; a chunk that does not parse in that format (e.g.
+    mixed ISO/epoch rows) falls back to row-by-row parsing. Parse memory
+    is bounded by the chunk; the result is written into columns sized
+    up front from the file's line count.
     """
+    TIMESTAMP_COLUMNS = ("timestamp", "time", "t")
+
+    def __init__(self, chunk_rows: int = 100_000):
+        """
+        Initialize HistoricalDataLoader
+
+        Args:
+            chunk_rows: CSV lines parsed per chunk
+        """
+        self.chunk_rows = max(1, chunk_rows)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._stats: dict = {}
+
     def _parse_timestamp(self, ts_raw: str) -> float:
         """
         Parse timestamp to UTC epoch seconds.
@@ -31,58 +62,321 @@ class HistoricalDataLoader:
                 return float(ts_raw)
             except ValueError:
                 raise ValueError(f"Cannot parse timestamp: {ts_raw}")
-    
-    def load_csv(self, path: str) -> List[Candle]:
+
+    def _detect_timestamp_format(self, ts_raw: str) -> str:
+        """'epoch' or 'iso' for a sample timestamp"""
+        try:
+            float(ts_raw)
+            return "epoch"
+        except ValueError:
+            self._parse_timestamp(ts_raw)
+            return "iso"
+
+    def _layout(self, header: Sequence[str]) -> _Layout:
+        names = [name.strip() for name in header]
+        ts_index = next((names.index(n) for n in self.TIMESTAMP_COLUMNS if n in names), None)
+        if ts_index is None:
+            raise ValueError(f"No timestamp column in CSV header: {names}")
+        missing = [n for n in ("open", "high", "low", "close") if n not in names]
+        if missing:
+            raise ValueError(f"Missing CSV columns: {missing}")
+        values = tuple(names.index(n) for n in ("open", "high", "low", "close"))
+        volume = names.index("volume") if "volume" in names else None
+        return ts_index, values, volume
+
+    # ==================== Chunk parsing ====================
+
+    def _parse_iso(self, stamps: np.ndarray) -> np.ndarray:
+        """ISO8601 strings -> epoch seconds (UTC suffixes vectorised, other offsets per row)"""
+        stamps = np.char.replace(np.char.rstrip(np.char.strip(stamps), "Z"), "+00:00", "")
+        # numpy would read a bare number as a year: only YYYY-... strings go vectorised
+        if not np.all(np.char.find(stamps, "-") == 4):
+            return np.array([self._parse_timestamp(ts) for ts in stamps.tolist()], dtype=np.float64)
+        try:
+            with warnings.catch_warnings():
+                # numpy only warns about (and silently applies) explicit offsets
+                warnings.simplefilter("error")
+                return stamps.astype("datetime64[us]").astype(np.int64) / 1e6
+        except (ValueError, UserWarning, DeprecationWarning):
+            return np.array([self._parse_timestamp(ts) for ts in stamps.tolist()], dtype=np.float64)
+
+    def _parse_chunk(self, lines: List[str], layout: _Layout, ts_format: str) -> CandleStore:
+        ts_index, values, volume = layout
+        usecols = values + ((volume,) if volume is not None else ())
+        if ts_format == "epoch":
+            usecols = (ts_index,) + usecols
+        # Plain numeric CSV only: quoted fields raise ValueError and take the per-row path
+        data = np.loadtxt(lines, delimiter=",", usecols=usecols, dtype=np.float64, ndmin=2,
+                          comments=None, quotechar=None).T
+        if ts_format == "epoch":
+            ts, data = data[0], data[1:]
+        else:
+            ts = self._parse_iso(np.loadtxt(lines, delimiter=",", usecols=(ts_index,), dtype=str,
+                                            ndmin=1, comments=None, quotechar=None))
+        # Strided column views of one buffer (load_csv copies them into its columns)
+        return CandleStore(ts, *data[:4], data[4] if volume is not None else None)
+
+    def _parse_rows(self, lines: List[str], layout: _Layout) -> CandleStore:
+        """Row-by-row fallback (per-row timestamp detection, as for mixed files)"""
+        ts_index, values, volume = layout
+        columns: List[List[float]] = [[], [], [], [], [], []]
+        ts_col, open_col, high_col, low_col, close_col, volume_col = columns
+        for row in csv.reader(lines):
+            if not row:
+                continue
+            ts_col.append(self._parse_timestamp(row[ts_index].strip()))
+            open_col.append(float(row[values[0]]))
+            high_col.append(float(row[values[1]]))
+            low_col.append(float(row[values[2]]))
+            close_col.append(float(row[values[3]]))
+            volume_col.append(float(row[volume]) if volume is not None else 0.0)
+        return CandleStore(*columns)
+
+    # ==================== CSV ====================
+
+    def iter_csv_chunks(self, path: str, chunk_rows: Optional[int] = None) -> Iterator[CandleStore]:
+        """
+        Parse a CSV chunk by chunk.
+        Yields one CandleStore per chunk_rows lines (stats are recorded once exhausted).
         """
-        Load candles from CSV.
+        chunk_rows = chunk_rows or self.chunk_rows
+        started = time.perf_counter()
+        rows = chunks = fallbacks = 0
+        ts_format = None
+        with open(path, "r", newline="") as f:
+            header = next(csv.reader([f.readline()]), None)
+            if not header:
+                return
+            layout = self._layout(header)
+            while True:
+                lines = list(islice(f, chunk_rows))
+                if not lines:
+                    break
+                if not lines[0].strip() and not any(map(str.strip, lines)):
+                    continue  # blank lines only
+                if ts_format is None:
+                    first = next(line for line in lines if line.strip())
+                    ts_format = self._detect_timestamp_format(next(csv.reader([first]))[layout[0]].strip())
+                try:
+                    chunk = self._parse_chunk(lines, layout, ts_format)
+                except ValueError:
+                    fallbacks += 1
+                    chunk = self._parse_rows(lines, layout)
+                rows += len(chunk)
+                chunks += 1
+                yield chunk
+        self._record(path, rows, time.perf_counter() - started, timestamp_format=ts_format,
+                     chunks=chunks, fallback_chunks=fallbacks)
+
+    def load_csv(self, path: str) -> CandleStore:
+        """
+        Load candles from CSV into a columnar CandleStore.
         Columns: timestamp,open,high,low,close,volume
         Timestamps are parsed as UTC-aware.
         """
-        candles: List[Candle] = []
-        with open(path, "r", newline="") as f:
-            reader = csv.DictReader(f)
-            for row in reader:
-                ts_raw = row.get("timestamp") or row.get("time") or row.get("t")
-                ts = self._parse_timestamp(ts_raw)
-                candle = Candle.from_row(
-                    ts,
-                    float(row["open"]),
-                    float(row["high"]),
-                    float(row["low"]),
-                    float(row["close"]),
-                    float(row.get("volume", 0.0)),
-                )
-                candles.append(candle)
-        return candles
-    
-    def load_parquet(self, path: str) -> Optional[List[Candle]]:
+        started = time.perf_counter()
+        capacity = self._count_lines(path)
+        columns = [np.empty(capacity) for _ in CandleStore.FIELDS]
+        filled = 0
+        for chunk in self.iter_csv_chunks(path):
+            end = filled + len(chunk)
+            if end > capacity:
+                # Quoted newlines made the line count low: grow
+                capacity = max(end, capacity * 2)
+                columns = [np.resize(col, capacity) for col in columns]
+            for col, values in zip(columns, chunk.columns()):
+                col[filled:end] = values
+            filled = end
+        details = {key: self._stats.get(key) for key in ("timestamp_format", "chunks", "fallback_chunks")}
+        stats = self._record(path, filled, time.perf_counter() - started, **details)
+        self.logger.info(f"Loaded {filled} rows from {path} in {stats['seconds']:.2f}s "
+                         f"({stats['rows_per_second']:,.0f} rows/s, {stats['timestamp_format']} timestamps)")
+        return CandleStore(*(col[:filled] for col in columns))
+
+    def stream(self, path: str, start: Optional[float] = None, end: Optional[float] = None,
+               chunk_rows: Optional[int] = None) -> Iterator[Candle]:
+        """
+        Candles of a CSV or .parquet file, parsed one chunk at a time.
+        Memory is bounded by the chunk and the first candle is yielded
+        as soon as the first chunk is parsed, whatever the file size.
+
+        Args:
+            path: CSV or .parquet (needs pyarrow) file
+            start: Epoch seconds, inclusive (None = from the first row)
+            end: Epoch seconds, exclusive (None = to the last row)
+            chunk_rows: Rows per chunk (None = self.chunk_rows)
+        """
+        if path.endswith(".parquet"):
+            for batch in self.iter_parquet_batches(path, start, end, batch_rows=chunk_rows):
+                yield from batch
+            return
+        for chunk in self.iter_csv_chunks(path, chunk_rows):
+            if end is not None and len(chunk) and chunk.timestamp[0] >= end:
+                break  # rows are in time order: the rest of the file is past end
+            yield from chunk.between(start, end)
+
+    @staticmethod
+    def _count_lines(path: str) -> int:
+        """Data lines in a CSV (upper bound: blank lines count too)"""
+        count = 0
+        last = b"\n"
+        with open(path, "rb") as f:
+            while True:
+                block = f.read(1 << 20)
+                if not block:
+                    break
+                count += block.count(b"\n")
+                last = block[-1:]
+        if last != b"\n":
+            count += 1
+        return max(0, count - 1)
+
+    def _record(self, path: str, rows: int, seconds: float, **details) -> dict:
+        self._stats = {
+            "path": path,
+            "rows": rows,
+            "seconds": seconds,
+            "rows_per_second": rows / seconds if seconds > 0 else 0.0,
+            **details
+        }
+        return self._stats
+
+    def get_stats(self) -> dict:
+        """Statistics of the last load (rows, seconds, rows_per_second, ...)"""
+        return dict(self._stats)
+
+    # ==================== Parquet ====================
+
+    def load_parquet(self, path: str, start: Optional[float] = None,
+                     end: Optional[float] = None) -> Optional[CandleStore]:
         """
-        Load candles from Parquet (optional - requires pyarrow or fastparquet).
+        Load candles from Parquet (optional - requires pyarrow).
         Returns None if library not available.
+
+        Only the timestamp and OHLCV columns are read, and only the row
+        groups whose timestamp statistics overlap [start, end); columns
+        come straight from the Arrow buffers.
+
+        Args:
+            path: Parquet file
+            start: Epoch seconds, inclusive (None = from the first row)
+            end: Epoch seconds, exclusive (None = to the last row)
         """
         try:
             import pyarrow.parquet as pq
-            table = pq.read_table(path)
-            df = table.to_pandas()
-            candles: List[Candle] = []
-            for _, row in df.iterrows():
-                # Parse timestamp (assume UTC if timezone-naive)
-                ts = row.get("timestamp") or row.get("time")
-                if isinstance(ts, str):
-                    ts = self._parse_timestamp(ts)
-                elif hasattr(ts, "timestamp"):
-                    ts = ts.timestamp()
-                else:
-                    ts = float(ts)
-                candle = Candle.from_row(
-                    ts,
-                    float(row["open"]),
-                    float(row["high"]),
-                    float(row["low"]),
-                    float(row["close"]),
-                    float(row.get("volume", 0.0)),
-                )
-                candles.append(candle)
-            return candles
         except ImportError:
             return None  # Parquet library not available
+        started = time.perf_counter()
+        pf = pq.ParquetFile(path)
+        names, groups = self._parquet_plan(pf, start, end)
+        table = pf.read_row_groups(groups, columns=list(filter(None, names)))
+        store = self._arrow_to_store(table, names, start, end)
+        stats = self._record(path, len(store), time.perf_counter() - started,
+                             row_groups=pf.metadata.num_row_groups, row_groups_read=len(groups))
+        self.logger.info(f"Loaded {stats['rows']} rows from {path} in {stats['seconds']:.2f}s "
+                         f"({stats['rows_per_second']:,.0f} rows/s, {len(groups)}/{stats['row_groups']} row groups)")
+        return store
+
+    def iter_parquet_batches(self, path: str, start: Optional[float] = None, end: Optional[float] = None,
+                             batch_rows: Optional[int] = None) -> Iterator[CandleStore]:
+        """
+        Stream a Parquet file as CandleStores of up to batch_rows rows
+        (same projection and pushdown as load_parquet; memory is bounded
+        by the batch, so files larger than RAM can be replayed).
+
+        Raises:
+            ImportError: pyarrow not installed
+        """
+        import pyarrow.parquet as pq
+        started = time.perf_counter()
+        pf = pq.ParquetFile(path)
+        names, groups = self._parquet_plan(pf, start, end)
+        rows = 0
+        if groups:
+            for batch in pf.iter_batches(batch_size=batch_rows or self.chunk_rows, row_groups=groups,
+                                         columns=list(filter(None, names))):
+                store = self._arrow_to_store(batch, names, start, end)
+                if len(store):
+                    rows += len(store)
+                    yield store
+        self._record(path, rows, time.perf_counter() - started,
+                     row_groups=pf.metadata.num_row_groups, row_groups_read=len(groups))
+
+    def _parquet_plan(self, pf, start: Optional[float], end: Optional[float]) -> Tuple[List[Optional[str]], List[int]]:
+        """(column names in Candle field order, None for a missing volume; row groups to read)"""
+        schema = pf.schema_arrow
+        ts_name = next((n for n in self.TIMESTAMP_COLUMNS if schema.get_field_index(n) >= 0), None)
+        if ts_name is None:
+            raise ValueError(f"No timestamp column in Parquet schema: {schema.names}")
+        missing = [n for n in ("open", "high", "low", "close") if schema.get_field_index(n) < 0]
+        if missing:
+            raise ValueError(f"Missing Parquet columns: {missing}")
+        names = [ts_name, "open", "high", "low", "close",
+                 "volume" if schema.get_field_index("volume") >= 0 else None]
+
+        metadata = pf.metadata
+        groups = list(range(metadata.num_row_groups))
+        if start is None and end is None:
+            return names, groups
+        ts_column = schema.get_field_index(ts_name)
+        selected = []
+        for group in groups:
+            bounds = self._row_group_bounds(metadata.row_group(group).column(ts_column).statistics)
+            if bounds is not None:
+                low, high = bounds
+                if (start is not None and high < start) or (end is not None and low >= end):
+                    continue
+            selected.append(group)
+        return names, selected
+
+    @staticmethod
+    def _row_group_bounds(statistics) -> Optional[Tuple[float, float]]:
+        """Timestamp (min, max) of a row group in epoch seconds, or None when unknown (e.g. ISO strings)"""
+        if statistics is None or not statistics.has_min_max:
+            return None
+        bounds = []
+        for value in (statistics.min, statistics.max):
+            if isinstance(value, datetime):
+                # Timestamp logical type; naive values are UTC
+                if value.tzinfo is None:
+                    value = value.replace(tzinfo=timezone.utc)
+                bounds.append(value.timestamp())
+            elif isinstance(value, (int, float)):
+                bounds.append(float(value))
+            else:
+                return None
+        return bounds[0], bounds[1]
+
+    def _arrow_to_store(self, data, names: Sequence[Optional[str]], start: Optional[float],
+                        end: Optional[float]) -> CandleStore:
+        """Table / RecordBatch -> CandleStore (float64 columns are used without copying)"""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        ts = data.column(names[0])
+        if pa.types.is_timestamp(ts.type):
+            per_second = {"s": 1.0, "ms": 1e3, "us": 1e6, "ns": 1e9}[ts.type.unit]
+            ts = pc.cast(ts, pa.int64()).to_numpy() / per_second
+        elif pa.types.is_string(ts.type) or pa.types.is_large_string(ts.type):
+            ts = self._parse_iso(np.asarray(ts.to_numpy(zero_copy_only=False), dtype=str))
+        else:
+            ts = ts.to_numpy().astype(np.float64, copy=False)
+        columns = [ts]
+        for name in names[1:]:
+            if name is None:
+                columns.append(None)
+                continue
+            column = data.column(name)
+            if column.type != pa.float64():
+                column = pc.cast(column, pa.float64())
+            columns.append(column.to_numpy(zero_copy_only=False))
+        store = CandleStore(*columns)
+        if start is None and end is None:
+            return store
+        mask = np.ones(len(store), dtype=bool)
+        if start is not None:
+            mask &= store.timestamp >= start
+        if end is not None:
+            mask &= store.timestamp < end
+        if mask.all():
+            return store
+        return CandleStore(*(col[mask] for col in store.columns()))
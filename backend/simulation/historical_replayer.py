@@ -1,34 +1,93 @@
 """
 PROJECT PREDATOR - HistoricalReplayer
-Replays a list of candles using a TimeSource.
+Replays candles (a list, a CandleStore or any iterator) using a TimeSource (or TimeWarp virtual time).
 """
 import logging
-from typing import Iterable, List
+from collections.abc import Sequence
+from itertools import chain, islice
+from typing import Iterable, List, Optional, Tuple
 from backend.core.event_bus import EventBus, EventType
 from backend.market.candle import Candle
 from backend.simulation.time_source import TimeSource
+from backend.simulation.time_warp import TimeWarp
+
+
+def peek_candles(candles: Iterable[Candle]) -> Tuple[Optional[Candle], Iterable[Candle]]:
+    """
+    First candle without losing it
+
+    Returns:
+        (first candle or None if empty, iterable still yielding every candle)
+    """
+    if isinstance(candles, Sequence):
+        return (candles[0] if len(candles) else None), candles
+    it = iter(candles)
+    first = next(it, None)
+    return first, (chain((first,), it) if first is not None else ())
 
 
 class HistoricalReplayer:
     """
     Simple candle replayer.
     Publishes FAKE_CANDLE (and PRICE_UPDATE via feed downstream) respecting speed.
+    
+    With batch_size set, candles are published through EventBus.publish_batch
+    in groups of batch_size (one dispatch and one pause per group). With
+    emit_ticks this changes the event order: every FAKE_CANDLE of a group
+    is published before that group's TICKs, instead of each candle being
+    followed by its own TICK.
+    
+    On a TimeWarp there is no pause at all: simulated time is advanced to
+    each candle's timestamp (running any timers due before it), so replay
+    speed is bound by CPU only and event stamps equal candle times.
+    
+    Candles may be a list, a columnar CandleStore (rows become Candle
+    payloads as they are published) or any iterator, e.g.
+    HistoricalDataLoader.stream(): nothing is materialised, so replay
+    memory is constant and the first event goes out after the first
+    chunk is parsed.
     """
-    def __init__(self, event_bus: EventBus, time_source: TimeSource, emit_ticks: bool = False, deterministic: bool = False):
+    def __init__(self, event_bus: EventBus, time_source: TimeSource, emit_ticks: bool = False, deterministic: bool = False,
+                 batch_size: Optional[int] = None):
         self.event_bus = event_bus
         self.time_source = time_source
         self.emit_ticks = emit_ticks
         self.deterministic = deterministic
+        self.batch_size = batch_size if batch_size and batch_size > 1 else None
+        self._warp = time_source if isinstance(time_source, TimeWarp) else None
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.logger.info(f"HistoricalReplayer initialized (emit_ticks={emit_ticks}, deterministic={deterministic})")
+        self.logger.info(f"HistoricalReplayer initialized (emit_ticks={emit_ticks}, deterministic={deterministic}, batch_size={self.batch_size})")
+
+    def _publish_batch(self, batch: List[Candle]) -> None:
+        # Two dispatches per group: all candles, then all their ticks (see class docstring)
+        source = self.__class__.__name__
+        self.event_bus.publish_batch(EventType.FAKE_CANDLE, batch, source=source)
+        if self.emit_ticks:
+            self.event_bus.publish_batch(EventType.TICK, [{"tick_number": c.timestamp} for c in batch], source=source)
+
+    def _iter_batches(self, candles: Iterable[Candle]) -> Iterable[List[Candle]]:
+        it = iter(candles)
+        while True:
+            batch = list(islice(it, self.batch_size))
+            if not batch:
+                return
+            yield batch
 
     def replay(self, candles: Iterable[Candle]) -> None:
         """
         Replay candles sequentially (blocking) - fast mode (minimal spacing).
         """
+        if self._warp:
+            self._replay_virtual(candles)
+            return
+        if self.batch_size:
+            for batch in self._iter_batches(candles):
+                self._publish_batch(batch)
+                self.time_source.sleep(0.001 if self.deterministic else 0.01)
+            return
         for candle in candles:
-            # Emit candle
-            self.event_bus.publish(EventType.FAKE_CANDLE, candle.to_dict(), source=self.__class__.__name__)
+            # Emit candle (the Candle itself is the payload)
+            self.event_bus.publish(EventType.FAKE_CANDLE, candle, source=self.__class__.__name__)
             # Optionally emit tick
             if self.emit_ticks:
                 self.event_bus.publish(EventType.TICK, {"tick_number": candle.timestamp}, source=self.__class__.__name__)
@@ -38,13 +97,27 @@ class HistoricalReplayer:
             else:
                 self.time_source.sleep(0.01)  # Accelerated minimal pause
 
-    def replay_with_spacing(self, candles: List[Candle]) -> None:
+    def replay_with_spacing(self, candles: Iterable[Candle]) -> None:
         """
         Replay respecting original timestamp spacing (scaled by speed).
         """
-        if not candles:
+        first, candles = peek_candles(candles)
+        if first is None:
+            return
+        if self._warp:
+            self._replay_virtual(candles)
+            return
+        prev_ts = first.timestamp
+        if self.batch_size:
+            for batch in self._iter_batches(candles):
+                # Sleep the batch's accumulated spacing once, then publish it
+                delta = max(0.0, batch[-1].timestamp - prev_ts)
+                scaled_delta = delta / self.time_source.speed if self.time_source.speed > 0 else 0.0
+                if scaled_delta > 0:
+                    self.time_source.sleep(scaled_delta)
+                self._publish_batch(batch)
+                prev_ts = batch[-1].timestamp
             return
-        prev_ts = candles[0].timestamp
         for candle in candles:
             # Calculate time delta (in seconds)
             delta = max(0.0, candle.timestamp - prev_ts)
@@ -53,9 +126,25 @@ class HistoricalReplayer:
             # Sleep scaled time
             if scaled_delta > 0:
                 self.time_source.sleep(scaled_delta)
-            # Emit candle
-            self.event_bus.publish(EventType.FAKE_CANDLE, candle.to_dict(), source=self.__class__.__name__)
+            # Emit candle (the Candle itself is the payload)
+            self.event_bus.publish(EventType.FAKE_CANDLE, candle, source=self.__class__.__name__)
             # Optionally emit tick
             if self.emit_ticks:
                 self.event_bus.publish(EventType.TICK, {"tick_number": candle.timestamp}, source=self.__class__.__name__)
             prev_ts = candle.timestamp
+
+    def _replay_virtual(self, candles: Iterable[Candle]) -> None:
+        """Replay on the TimeWarp: jump to each candle's time, never sleep"""
+        advance_to = self._warp.advance_to
+        if self.batch_size:
+            for batch in self._iter_batches(candles):
+                advance_to(batch[-1].timestamp)
+                self._publish_batch(batch)
+            return
+        source = self.__class__.__name__
+        publish = self.event_bus.publish
+        for candle in candles:
+            advance_to(candle.timestamp)
+            publish(EventType.FAKE_CANDLE, candle, source=source)
+            if self.emit_ticks:
+                publish(EventType.TICK, {"tick_number": candle.timestamp}, source=source)
@@ -1,6 +1,6 @@
 """
 PROJECT PREDATOR - MarketClock
-Drives periodic TICK events using TimeSource.
+Drives periodic TICK events using TimeSource (or a TimeWarp timer).
 """
 import logging
 import threading
@@ -8,6 +8,7 @@ import time
 from typing import Optional
 from backend.core.event_bus import EventBus, EventType
 from backend.simulation.time_source import TimeSource
+from backend.simulation.time_warp import TimeWarp
 
 
 class MarketClock:
@@ -18,6 +19,7 @@ class MarketClock:
         self.logger = logging.getLogger(self.__class__.__name__)
         self._running = False
         self._thread: Optional[threading.Thread] = None
+        self._timer: Optional[int] = None
         self._tick = 0
 
     def start(self) -> bool:
@@ -25,8 +27,12 @@ class MarketClock:
             self.logger.warning("MarketClock already running")
             return False
         self._running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
+        if isinstance(self.time_source, TimeWarp):
+            # Virtual time: tick whenever the driver moves the clock past a deadline
+            self._timer = self.time_source.call_every(self.tick_interval, self._publish_tick)
+        else:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
         self.logger.info("MarketClock started")
         return True
 
@@ -35,6 +41,9 @@ class MarketClock:
             self.logger.warning("MarketClock not running")
             return False
         self._running = False
+        if self._timer is not None:
+            self.time_source.cancel(self._timer)
+            self._timer = None
         if self._thread:
             self._thread.join(timeout=2.0)
         self.logger.info("MarketClock stopped")
@@ -42,13 +51,16 @@ class MarketClock:
 
     def _run(self) -> None:
         while self._running:
-            self._tick += 1
-            self.event_bus.publish(
-                EventType.TICK,
-                {"tick_number": self._tick, "sim_time": self.time_source.now().isoformat()},
-                source=self.get_name()
-            )
+            self._publish_tick()
             self.time_source.sleep(self.tick_interval)
 
+    def _publish_tick(self) -> None:
+        self._tick += 1
+        self.event_bus.publish(
+            EventType.TICK,
+            {"tick_number": self._tick, "sim_time": self.time_source.now().isoformat()},
+            source=self.get_name()
+        )
+
     def get_name(self) -> str:
         return self.__class__.__name__
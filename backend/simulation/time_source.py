@@ -6,6 +6,7 @@ Modes:
 - realtime: speed=1.0
 - accelerated: speed>1.0 (wallclock / speed)
 - paused/backtest: caller controls stepping
+- virtual: TimeWarp subclass, time jumps between scheduled events
 """
 import time
 from datetime import datetime, timedelta, timezone
@@ -20,6 +21,8 @@ class TimeSource:
         self._speed = max(speed, 0.0001)  # avoid zero division
         self._start_wall = time.time()
         self._start_sim = datetime.now(timezone.utc)
+        self._start_wall_ns = int(self._start_wall * 1e9)
+        self._start_sim_ns = int(self._start_sim.timestamp() * 1e9)
     
     @property
     def speed(self) -> float:
@@ -34,6 +37,14 @@ class TimeSource:
         elapsed_sim = elapsed_wall * self._speed
         return self._start_sim + timedelta(seconds=elapsed_sim)
 
+    def now_ns(self) -> int:
+        """
+        Current simulation time as UTC epoch nanoseconds.
+        Cheap integer path used as an EventBus clock.
+        """
+        elapsed_wall_ns = time.time_ns() - self._start_wall_ns
+        return self._start_sim_ns + int(elapsed_wall_ns * self._speed)
+
     def sleep(self, dt_seconds: float) -> None:
         """
         Sleep dt_seconds in simulation time (scaled by speed).
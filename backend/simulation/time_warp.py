@@ -0,0 +1,226 @@
+"""
+PROJECT PREDATOR - TimeWarp
+Discrete-event virtual clock for simulation/backtest.
+
+Simulated time only moves when the driver advances it (sleep,
+advance_to, step, run) and then jumps straight to the next due timer,
+so nothing ever waits on the wall clock and runs are deterministic.
+"""
+import heapq
+import logging
+import threading
+from datetime import datetime, timezone
+from typing import Callable, List, Optional, Tuple, Union
+from backend.simulation.time_source import TimeSource
+
+
+class TimeWarp(TimeSource):
+    """
+    Virtual clock with a timer queue
+
+    A drop-in TimeSource (speed is fixed at 1.0: one virtual second per
+    simulated second). Components schedule timers with call_at /
+    call_later / call_every; the driving thread advances time and each
+    timer runs on it, in deadline order, with now() equal to its
+    deadline. pause() (from any thread) holds the driver at the next
+    timer boundary until resume(); step() runs single timers by hand.
+    """
+
+    def __init__(self, start: Union[datetime, float, None] = None):
+        """
+        Initialize TimeWarp
+
+        Args:
+            start: Initial simulated time (datetime or epoch seconds; None = 0)
+        """
+        if isinstance(start, datetime):
+            start = start.timestamp()
+        self._speed = 1.0
+        self._now_ns = int(round((start or 0.0) * 1e9))
+        self.logger = logging.getLogger(self.__class__.__name__)
+        # (deadline ns, sequence, callback, interval ns or 0, timer id)
+        self._timers: List[Tuple[int, int, Callable[[], None], int, int]] = []
+        self._cancelled = set()
+        self._seq = 0
+        self._lock = threading.RLock()
+        self._resume = threading.Event()
+        self._resume.set()
+        self._timers_fired = 0
+
+    # ==================== Clock ====================
+
+    def now(self) -> datetime:
+        """Current simulated time (UTC)"""
+        return datetime.fromtimestamp(self._now_ns / 1e9, tz=timezone.utc)
+
+    def now_ns(self) -> int:
+        """Current simulated time as UTC epoch nanoseconds (EventBus / Scheduler clock)"""
+        return self._now_ns
+
+    def time(self) -> float:
+        """Current simulated time as epoch seconds"""
+        return self._now_ns / 1e9
+
+    def set_speed(self, speed: float) -> None:
+        """Ignored: virtual time is not paced against the wall clock"""
+
+    # ==================== Timers ====================
+
+    def call_at(self, deadline: float, callback: Callable[[], None]) -> int:
+        """
+        Run callback once when simulated time reaches deadline
+
+        Args:
+            deadline: Epoch seconds (a past deadline runs on the next advance)
+            callback: Zero-argument callable, run on the driving thread
+
+        Returns:
+            Timer id (for cancel())
+        """
+        return self._push(int(round(deadline * 1e9)), callback, 0)
+
+    def call_later(self, delay: float, callback: Callable[[], None]) -> int:
+        """Run callback once, delay simulated seconds from now"""
+        return self._push(self._now_ns + int(round(delay * 1e9)), callback, 0)
+
+    def call_every(self, interval: float, callback: Callable[[], None], first_at: Optional[float] = None) -> int:
+        """
+        Run callback every interval simulated seconds
+
+        Args:
+            interval: Seconds between runs (> 0)
+            callback: Zero-argument callable
+            first_at: First deadline (epoch seconds; None = now + interval)
+
+        Returns:
+            Timer id (for cancel())
+        """
+        if interval <= 0:
+            raise ValueError("interval must be > 0")
+        interval_ns = int(round(interval * 1e9))
+        deadline = int(round(first_at * 1e9)) if first_at is not None else self._now_ns + interval_ns
+        return self._push(deadline, callback, interval_ns)
+
+    def cancel(self, timer_id: int) -> None:
+        """Cancel a timer (no-op if it already ran)"""
+        with self._lock:
+            # Only pending ids: _drop_cancelled() discards them as they surface
+            if any(timer[4] == timer_id for timer in self._timers):
+                self._cancelled.add(timer_id)
+
+    def _push(self, deadline_ns: int, callback: Callable[[], None], interval_ns: int,
+              timer_id: Optional[int] = None) -> int:
+        with self._lock:
+            self._seq += 1
+            if timer_id is None:
+                timer_id = self._seq
+            heapq.heappush(self._timers, (deadline_ns, self._seq, callback, interval_ns, timer_id))
+            return timer_id
+
+    def next_deadline(self) -> Optional[float]:
+        """Deadline of the next pending timer (epoch seconds) or None"""
+        with self._lock:
+            self._drop_cancelled()
+            return self._timers[0][0] / 1e9 if self._timers else None
+
+    def _drop_cancelled(self) -> None:
+        timers = self._timers
+        while timers and timers[0][4] in self._cancelled:
+            self._cancelled.discard(heapq.heappop(timers)[4])
+
+    # ==================== Driving ====================
+
+    def step(self) -> bool:
+        """
+        Jump to the next timer and run it (works while paused)
+
+        Returns:
+            False if no timer is pending
+        """
+        with self._lock:
+            self._drop_cancelled()
+            if not self._timers:
+                return False
+            deadline_ns, _, callback, interval_ns, timer_id = heapq.heappop(self._timers)
+            if deadline_ns > self._now_ns:
+                self._now_ns = deadline_ns
+            if interval_ns:
+                self._push(deadline_ns + interval_ns, callback, interval_ns, timer_id)
+            self._timers_fired += 1
+            try:
+                callback()
+            except Exception as e:
+                self.logger.error(f"Timer callback failed: {e}")
+            return True
+
+    def advance_to(self, target: float) -> None:
+        """
+        Advance simulated time to target, running every timer due on the way
+
+        Never moves time backwards. Blocks at timer boundaries while paused.
+        """
+        target_ns = int(round(target * 1e9))
+        while True:
+            self._resume.wait()
+            with self._lock:
+                self._drop_cancelled()
+                if not self._timers or self._timers[0][0] > target_ns:
+                    if target_ns > self._now_ns:
+                        self._now_ns = target_ns
+                    return
+                self.step()
+
+    def sleep(self, dt_seconds: float) -> None:
+        """Advance simulated time by dt_seconds (returns immediately in wall time)"""
+        if dt_seconds <= 0:
+            return
+        self.advance_to(self._now_ns / 1e9 + dt_seconds)
+
+    def run(self, until: Optional[float] = None, max_timers: Optional[int] = None) -> int:
+        """
+        Run timers in deadline order
+
+        Args:
+            until: Stop before timers after this epoch time (None = no limit)
+            max_timers: Stop after this many timers (None = no limit)
+
+        Returns:
+            Number of timers run
+        """
+        count = 0
+        while max_timers is None or count < max_timers:
+            self._resume.wait()
+            with self._lock:
+                self._drop_cancelled()
+                if not self._timers:
+                    break
+                if until is not None and self._timers[0][0] > int(round(until * 1e9)):
+                    break
+                self.step()
+            count += 1
+        if until is not None and max_timers is None:
+            self.advance_to(until)
+        return count
+
+    def pause(self) -> None:
+        """Hold the driver at the next timer boundary"""
+        self._resume.clear()
+
+    def resume(self) -> None:
+        """Let a paused driver continue"""
+        self._resume.set()
+
+    @property
+    def paused(self) -> bool:
+        return not self._resume.is_set()
+
+    def get_stats(self) -> dict:
+        """Clock statistics"""
+        with self._lock:
+            pending = sum(1 for timer in self._timers if timer[4] not in self._cancelled)
+        return {
+            "now": self.time(),
+            "paused": self.paused,
+            "timers_pending": pending,
+            "timers_fired": self._timers_fired
+        }
@@ -4,8 +4,9 @@ Simple interface + EventBus adapter.
 """
 import logging
 from abc import ABC, abstractmethod
-from typing import Optional, Dict
+from typing import Iterable, List, Optional, Mapping
 from backend.core.event_bus import EventBus, EventType, Event
+from backend.market.candle import Candle
 
 
 class StrategyBase(ABC):
@@ -40,13 +41,23 @@ class StrategyBase(ABC):
         return True
 
     def _on_candle_event(self, event: Event) -> None:
-        order = self.on_candle(event.data or {})
+        order = self.on_candle(Candle.from_mapping(event.data))
         if order:
-            self.event_bus.publish(EventType.ORDER_REQUEST, order, source=self.__class__.__name__)
+            self.event_bus.publish(EventType.ORDER_REQUEST, order, source=self.__class__.__name__,
+                                   key=order.get("symbol"))
 
     @abstractmethod
-    def on_candle(self, candle: Dict) -> Optional[Dict]:
+    def on_candle(self, candle: Candle) -> Optional[Mapping]:
         """
-        Handle a candle dict. Return an order dict or None.
+        Handle a Candle (which also reads like a candle dict).
+        Return an order (OrderRequest or order dict) or None.
         """
         raise NotImplementedError
+
+    def on_candles(self, candles: Iterable[Candle]) -> List[Mapping]:
+        """
+        Run on_candle over candles offline (no EventBus).
+        Accepts a list of Candle or a CandleStore; returns the orders in order.
+        """
+        on_candle = self.on_candle
+        return [order for order in map(on_candle, candles) if order]
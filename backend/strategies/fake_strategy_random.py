@@ -3,7 +3,9 @@ PROJECT PREDATOR - FakeStrategyRandom
 Random buy/sell/do-nothing for flow testing.
 """
 import random
-from typing import Optional, Dict
+from typing import Optional
+from backend.core.payloads import OrderRequest
+from backend.market.candle import Candle
 from backend.strategies.base import StrategyBase
 from backend.interfaces.executor import OrderSide, OrderType
 
@@ -13,7 +15,7 @@ class FakeStrategyRandom(StrategyBase):
         super().__init__(event_bus)
         random.seed(seed)
 
-    def on_candle(self, candle: Dict) -> Optional[Dict]:
+    def on_candle(self, candle: Candle) -> Optional[OrderRequest]:
         r = random.random()
         if r < 0.33:
             side = OrderSide.BUY.value
@@ -21,11 +23,4 @@ class FakeStrategyRandom(StrategyBase):
             side = OrderSide.SELL.value
         else:
             return None
-        return {
-            "symbol": "BTC/USD",
-            "side": side,
-            "order_type": OrderType.MARKET.value,
-            "quantity": 0.1,
-            "price": candle.get("close", 0.0),
-            "fake": True,
-        }
+        return OrderRequest("BTC/USD", side, OrderType.MARKET.value, 0.1, candle.close, None, True)
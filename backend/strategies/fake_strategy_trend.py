@@ -3,7 +3,9 @@ PROJECT PREDATOR - FakeStrategyTrend
 Simple moving-average cross for flow testing (stub).
 """
 from collections import deque
-from typing import Optional, Dict
+from typing import Optional
+from backend.core.payloads import OrderRequest
+from backend.market.candle import Candle
 from backend.strategies.base import StrategyBase
 from backend.interfaces.executor import OrderSide, OrderType
 
@@ -20,8 +22,8 @@ class FakeStrategyTrend(StrategyBase):
     def _avg(self, q):
         return sum(q) / len(q) if q else 0.0
 
-    def on_candle(self, candle: Dict) -> Optional[Dict]:
-        close = candle.get("close", 0.0)
+    def on_candle(self, candle: Candle) -> Optional[OrderRequest]:
+        close = candle.close
         self.fast_q.append(close)
         self.slow_q.append(close)
         if len(self.fast_q) < self.fast or len(self.slow_q) < self.slow:
@@ -32,22 +34,8 @@ class FakeStrategyTrend(StrategyBase):
 
         if fast_ma > slow_ma and self.last_signal != "LONG":
             self.last_signal = "LONG"
-            return {
-                "symbol": "BTC/USD",
-                "side": OrderSide.BUY.value,
-                "order_type": OrderType.MARKET.value,
-                "quantity": 0.1,
-                "price": close,
-                "fake": True,
-            }
+            return OrderRequest("BTC/USD", OrderSide.BUY.value, OrderType.MARKET.value, 0.1, close, None, True)
         if fast_ma < slow_ma and self.last_signal != "SHORT":
             self.last_signal = "SHORT"
-            return {
-                "symbol": "BTC/USD",
-                "side": OrderSide.SELL.value,
-                "order_type": OrderType.MARKET.value,
-                "quantity": 0.1,
-                "price": close,
-                "fake": True,
-            }
+            return OrderRequest("BTC/USD", OrderSide.SELL.value, OrderType.MARKET.value, 0.1, close, None, True)
         return None
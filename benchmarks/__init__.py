@@ -0,0 +1,4 @@
+"""
+PROJECT PREDATOR - Benchmarks
+Standalone micro/macro benchmarks (run with `python -m benchmarks.<name>`)
+"""
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+PROJECT PREDATOR - Backtest Benchmarks
+
+Usage:
+    python -m benchmarks.bench_backtest [--candles N] [--repeat N] [--streaming]
+"""
+import argparse
+import logging
+import os
+import tempfile
+import time
+import tracemalloc
+from backend.backtest.backtest_engine import BacktestEngine
+from backend.core.event_bus import EventType
+from backend.market.candle import Candle
+from backend.simulation.historical_data_loader import HistoricalDataLoader
+
+
+def make_candles(n: int):
+    """Synthetic candles with enough movement to trigger trades"""
+    return [Candle.from_row(1_700_000_000 + i * 60, 100 + (i % 17), 101 + (i % 17), 99 + (i % 17), 100 + (i % 17), 1.0)
+            for i in range(n)]
+
+
+def _pipeline(candles):
+    """A started BacktestEngine whose FAKE_CANDLE pipeline is driven directly"""
+    engine = BacktestEngine(candles, strategy_name="fake_trend", speed=1e9)
+    engine.market.start()
+    engine.execution.start()
+    engine.portfolio.start()
+    engine.strategy.start()
+    return engine
+
+
+def bench_pipeline(n_candles: int, repeat: int) -> None:
+    """
+    Cost per candle of the FAKE_CANDLE -> ... -> POSITION_UPDATE pipeline.
+
+    Candles are published straight onto the bus (no replayer pacing), so
+    the numbers cover dispatch, payload construction and handler work.
+    Memory is the tracemalloc peak of a separate run divided by the
+    candle count (trades and equity points included).
+    """
+    candles = make_candles(n_candles)
+    best = None
+    for _ in range(repeat):
+        engine = _pipeline(candles)
+        publish = engine.event_bus.publish
+        start = time.perf_counter_ns()
+        for candle in candles:
+            publish(EventType.FAKE_CANDLE, candle, source="bench")
+        elapsed = time.perf_counter_ns() - start
+        best = elapsed if best is None else min(best, elapsed)
+
+    engine = _pipeline(candles)
+    publish = engine.event_bus.publish
+    tracemalloc.start()
+    for candle in candles:
+        publish(EventType.FAKE_CANDLE, candle, source="bench")
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f"candles:           {n_candles}")
+    print(f"trades:            {len(engine.trades)}")
+    print(f"us/candle:         {best / n_candles / 1000:.2f}")
+    print(f"peak bytes/candle: {peak / n_candles:.0f}")
+
+
+def _write_csv(path: str, n: int) -> None:
+    with open(path, "w") as f:
+        f.write("timestamp,open,high,low,close,volume\n")
+        for i in range(n):
+            p = 100 + (i % 17)
+            f.write(f"{1_700_000_000 + i * 60},{p},{p + 1},{p - 1},{p},1\n")
+
+
+def bench_streaming(sizes, history_window: int = 1000, chunk_rows: int = 10_000) -> None:
+    """
+    Eager (load_csv, full trade / equity history) vs streamed
+    (loader.stream, bounded history) backtests from a CSV file.
+
+    Time to first candle covers everything before the replayer can
+    publish: the whole parse when eager, one chunk when streamed. Peak
+    is the tracemalloc peak of a full virtual-time run.
+    """
+    loader = HistoricalDataLoader(chunk_rows=chunk_rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in sizes:
+            path = os.path.join(tmp, f"{n}.csv")
+            _write_csv(path, n)
+
+            start = time.perf_counter()
+            next(iter(loader.load_csv(path)))
+            eager_first = time.perf_counter() - start
+            start = time.perf_counter()
+            next(loader.stream(path))
+            stream_first = time.perf_counter() - start
+
+            peaks = []
+            for streamed in (False, True):
+                tracemalloc.start()
+                candles = loader.stream(path) if streamed else loader.load_csv(path)
+                BacktestEngine(candles, strategy_name="fake_trend", virtual_time=True,
+                               history_window=history_window if streamed else None).run()
+                peaks.append(tracemalloc.get_traced_memory()[1])
+                tracemalloc.stop()
+
+            print(f"candles {n:>9}:  first candle eager {eager_first * 1000:8.1f} ms  "
+                  f"streamed {stream_first * 1000:6.1f} ms   "
+                  f"peak eager {peaks[0] / 1e6:7.1f} MB  streamed {peaks[1] / 1e6:5.1f} MB")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PROJECT PREDATOR backtest benchmarks")
+    parser.add_argument("--candles", type=int, default=20_000, help="Candles to replay")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs (best is reported)")
+    parser.add_argument("--streaming", action="store_true", help="Eager vs streamed backtests from CSV")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    if args.streaming:
+        bench_streaming([args.candles // 4, args.candles])
+    else:
+        bench_pipeline(args.candles, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
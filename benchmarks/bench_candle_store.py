@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+PROJECT PREDATOR - CandleStore Benchmarks
+
+Usage:
+    python -m benchmarks.bench_candle_store [--candles N]
+"""
+import argparse
+import time
+import tracemalloc
+import numpy as np
+from backend.market.candle import Candle
+from backend.market.candle_store import CandleStore
+
+
+def make_columns(n: int):
+    """Synthetic 1-minute OHLCV columns"""
+    ts = 1_700_000_000 + np.arange(n, dtype=np.float64) * 60
+    close = 100 + (np.arange(n) % 17).astype(np.float64)
+    return ts, close - 0.5, close + 1, close - 1, close, np.ones(n)
+
+
+def _traced(build):
+    """(result, bytes still allocated by build)"""
+    tracemalloc.start()
+    result = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, current
+
+
+def bench_memory(n: int) -> None:
+    """
+    Resident bytes per bar: list of Candle objects vs CandleStore.
+
+    Each layout is built from scratch under tracemalloc, so the list
+    side includes its six boxed floats per bar, as after a CSV parse.
+    """
+    candles, list_bytes = _traced(lambda: list(map(Candle, *(col.tolist() for col in make_columns(n)))))
+    store, store_bytes = _traced(lambda: CandleStore(*make_columns(n)))
+
+    start = time.perf_counter()
+    view = store[n // 4: n // 2]
+    slice_us = (time.perf_counter() - start) * 1e6
+    shared = np.shares_memory(view.close, store.close)
+
+    start = time.perf_counter()
+    list_sum = sum(c.close for c in candles)
+    list_scan = time.perf_counter() - start
+    start = time.perf_counter()
+    store_sum = sum(c.close for c in store)
+    store_scan = time.perf_counter() - start
+    start = time.perf_counter()
+    column_sum = float(store.close.sum())
+    column_scan = time.perf_counter() - start
+    assert abs(list_sum - store_sum) < 1e-6 and abs(list_sum - column_sum) < 1e-3
+
+    print(f"candles:                {n}")
+    print(f"List[Candle] bytes/bar: {list_bytes / n:.0f}")
+    print(f"CandleStore bytes/bar:  {store_bytes / n:.0f}  ({list_bytes / max(store_bytes, 1):.1f}x smaller)")
+    print(f"slice of {len(view)} rows:  {slice_us:.1f} us (shares memory: {shared})")
+    print(f"iterate List[Candle]:   {list_scan / n * 1e9:.0f} ns/bar")
+    print(f"iterate CandleStore:    {store_scan / n * 1e9:.0f} ns/bar (Candle built per row)")
+    print(f"column scan:            {column_scan / n * 1e9:.1f} ns/bar")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PROJECT PREDATOR CandleStore benchmarks")
+    parser.add_argument("--candles", type=int, default=1_000_000, help="Bars to store")
+    args = parser.parse_args()
+    bench_memory(args.candles)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+PROJECT PREDATOR - Event Codec Benchmarks
+
+Encode/decode cost and encoded size of BinaryCodec against pickle and
+JSON for the event shapes the journal and IPC carry most.
+
+Usage:
+    python -m benchmarks.bench_codec [--events N]
+"""
+import argparse
+import json
+import pickle
+import time
+from backend.codec.binary import BinaryCodec
+from backend.core.event_bus import Event, EventType
+from backend.core.payloads import Fill, Payload, PriceUpdate
+from backend.market.candle import Candle
+
+_PAYLOAD_TYPES = {cls.__name__: cls for cls in (Candle, PriceUpdate, Fill)}
+
+
+def sample_events():
+    """One representative event per shape"""
+    return {
+        "candle": Event(EventType.FAKE_CANDLE, Candle(1.7e9, 42000.0, 42010.5, 41990.0, 42005.25, 12.5),
+                        1_700_000_000_000_000_000, "HistoricalReplayer"),
+        "price_update": Event(EventType.PRICE_UPDATE, PriceUpdate("BTC/USD", 42005.25, 1.7e9),
+                              1_700_000_000_000_000_001, "FakePriceFeed", "BTC/USD"),
+        "fill": Event(EventType.ORDER_FILLED,
+                      Fill("0c6ad7d4-3f0b-4a8e-9d59-8a3b1d1f2e44", "BTC/USD", "BUY", 0.01, 42005.25),
+                      1_700_000_000_000_000_002, "FakeMarket", "BTC/USD"),
+        "tick_dict": Event(EventType.TICK, {"tick_number": 1234, "timestamp": 1.7e9},
+                           1_700_000_000_000_000_003, "Scheduler"),
+    }
+
+
+def pickle_pair():
+    def encode(event):
+        return pickle.dumps((event.event_type.value, event.timestamp_ns, event.source, event.key, event.data),
+                            pickle.HIGHEST_PROTOCOL)
+
+    def decode(buf):
+        type_name, timestamp_ns, source, key, data = pickle.loads(buf)
+        return Event(EventType(type_name), data, timestamp_ns, source, key)
+    return encode, decode
+
+
+def json_pair():
+    def encode(event):
+        data = event.data
+        if isinstance(data, Payload):
+            data = {"__payload__": type(data).__name__, **data.to_dict()}
+        return json.dumps([event.event_type.value, event.timestamp_ns, event.source, event.key, data],
+                          separators=(",", ":")).encode("utf-8")
+
+    def decode(buf):
+        type_name, timestamp_ns, source, key, data = json.loads(buf)
+        cls = _PAYLOAD_TYPES.get(data.pop("__payload__", None))
+        if cls is not None:
+            data = cls(**data)
+        return Event(EventType(type_name), data, timestamp_ns, source, key)
+    return encode, decode
+
+
+def binary_pair():
+    encoder, decoder = BinaryCodec(), BinaryCodec()
+    return encoder.encode_event, decoder.decode_event
+
+
+def measure(encode, decode, event, n_events: int):
+    """(encode ns, decode ns, steady-state bytes), best of 3"""
+    buf = encode(event)
+    decode(buf)
+    buf = encode(event)
+    decode(buf)
+    best_encode = best_decode = float("inf")
+    for _ in range(3):
+        start = time.perf_counter_ns()
+        for _ in range(n_events):
+            encode(event)
+        best_encode = min(best_encode, (time.perf_counter_ns() - start) / n_events)
+        start = time.perf_counter_ns()
+        for _ in range(n_events):
+            decode(buf)
+        best_decode = min(best_decode, (time.perf_counter_ns() - start) / n_events)
+    return best_encode, best_decode, len(buf)
+
+
+def bench_codecs(n_events: int) -> None:
+    codecs = {"binary": binary_pair, "pickle": pickle_pair, "json": json_pair}
+    print(f"{'event':<14} {'codec':<8} {'encode ns':>10} {'decode ns':>10} {'bytes':>7}")
+    for shape, event in sample_events().items():
+        for name, make in codecs.items():
+            encode, decode = make()
+            assert decode(encode(event)).data == event.data
+            encode_ns, decode_ns, size = measure(encode, decode, event, n_events)
+            print(f"{shape:<14} {name:<8} {encode_ns:>10.0f} {decode_ns:>10.0f} {size:>7}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PROJECT PREDATOR event codec benchmarks")
+    parser.add_argument("--events", type=int, default=100_000, help="Encodes/decodes per measurement")
+    args = parser.parse_args()
+    bench_codecs(args.events)
+
+
+if __name__ == "__main__":
+    main()
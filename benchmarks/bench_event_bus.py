@@ -0,0 +1,362 @@
+#!/usr/bin/env python3
+"""
+PROJECT PREDATOR - EventBus Benchmarks
+
+Usage:
+    python -m benchmarks.bench_event_bus throughput [--events N]
+    python -m benchmarks.bench_event_bus publish_cost [--events N]
+    python -m benchmarks.bench_event_bus event_cost [--events N]
+    python -m benchmarks.bench_event_bus batch [--events N] [--batch-size N]
+    python -m benchmarks.bench_event_bus kill_switch [--rounds N] [--backlog N]
+    python -m benchmarks.bench_event_bus cascade [--roots N]
+    python -m benchmarks.bench_event_bus journal [--events N]
+"""
+import argparse
+import inspect
+import logging
+import os
+import tempfile
+import threading
+import time
+import tracemalloc
+import numpy as np
+from backend.core.clock import MonotonicWallClock
+from backend.core.event_bus import Event, EventBus, EventType, DispatchMode
+from backend.core.payloads import PriceUpdate
+from backend.core.policy_guard import PolicyGuard
+from backend.journal.journal import EventJournal
+from backend.market.candle import Candle
+from backend.journal.reader import JournalReader
+from backend.monitor.histogram import LatencyHistogram
+
+
+def bench_throughput(events_per_thread: int, thread_counts=(1, 4, 16)) -> None:
+    """
+    Publish throughput with N concurrent publishing threads.
+
+    Subscribers are (un)subscribed continuously from a side thread to
+    exercise the copy-on-write table while publishers run.
+    """
+    print(f"{'threads':>8} {'events':>10} {'seconds':>9} {'events/s':>12}")
+    for n_threads in thread_counts:
+        bus = EventBus()
+        received = [0]
+
+        def handler(event):
+            received[0] += 1
+
+        bus.subscribe(EventType.PRICE_UPDATE, handler)
+        stop_churn = threading.Event()
+
+        def churn():
+            def extra(event):
+                pass
+            while not stop_churn.is_set():
+                bus.subscribe(EventType.PRICE_UPDATE, extra)
+                bus.unsubscribe(EventType.PRICE_UPDATE, extra)
+
+        def publisher():
+            payload = {"symbol": "BTC/USD", "price": 100.0}
+            for _ in range(events_per_thread):
+                bus.publish(EventType.PRICE_UPDATE, payload, source="bench")
+
+        churner = threading.Thread(target=churn, daemon=True)
+        threads = [threading.Thread(target=publisher) for _ in range(n_threads)]
+        churner.start()
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+        stop_churn.set()
+        churner.join()
+
+        total = events_per_thread * n_threads
+        print(f"{n_threads:>8} {total:>10} {elapsed:>9.3f} {total / elapsed:>12,.0f}")
+
+
+def bench_publish_cost(n_events: int) -> None:
+    """
+    Nanoseconds per publish() on the hot backtest event types.
+
+    Reports the zero-subscriber path (nobody listens to the type) and the
+    single-subscriber path (Event is built and one handler runs).
+    """
+    bus = EventBus()
+    payload = {"symbol": "BTC/USD", "price": 100.0}
+
+    def noop(event):
+        pass
+
+    print(f"{'case':<28} {'ns/publish':>12}")
+    for event_type in (EventType.FAKE_CANDLE, EventType.CANDLE_EVENT, EventType.POSITION_UPDATE):
+        start = time.perf_counter_ns()
+        for _ in range(n_events):
+            bus.publish(event_type, payload, source="bench")
+        elapsed = time.perf_counter_ns() - start
+        print(f"{event_type.value + ' (0 subs)':<28} {elapsed / n_events:>12.1f}")
+
+    bus.subscribe(EventType.POSITION_UPDATE, noop)
+    start = time.perf_counter_ns()
+    for _ in range(n_events):
+        bus.publish(EventType.POSITION_UPDATE, payload, source="bench")
+    elapsed = time.perf_counter_ns() - start
+    print(f"{'POSITION_UPDATE (1 sub)':<28} {elapsed / n_events:>12.1f}")
+
+
+def bench_event_cost(n_events: int) -> None:
+    """
+    Per-event memory and construction cost (clock read included).
+    """
+    clock = MonotonicWallClock().now_ns
+
+    tracemalloc.start()
+    events = [Event(EventType.PRICE_UPDATE, None, clock(), "bench") for _ in range(n_events)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Subtract the list itself (one pointer per element)
+    per_event = (current - 8 * len(events)) / n_events
+    del events
+
+    start = time.perf_counter_ns()
+    for _ in range(n_events):
+        Event(EventType.PRICE_UPDATE, None, clock(), "bench")
+    elapsed = time.perf_counter_ns() - start
+
+    print(f"bytes/event:      {per_event:.1f}")
+    print(f"ns/construction:  {elapsed / n_events:.1f}")
+
+
+class CloseStats:
+    """
+    Running mean / variance of candle closes
+
+    on_candle() is the per-event path; on_candles() is the batch_handler
+    path, one NumPy pass over the whole batch.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.total_sq = 0.0
+
+    def on_candle(self, event) -> None:
+        close = event.data.close
+        self.count += 1
+        self.total += close
+        self.total_sq += close * close
+
+    def on_candles(self, events) -> None:
+        closes = np.fromiter((event.data.close for event in events), dtype=np.float64, count=len(events))
+        self.count += len(closes)
+        self.total += float(closes.sum())
+        self.total_sq += float(closes @ closes)
+
+
+def bench_batch(n_events: int, batch_size: int) -> None:
+    """
+    ns per candle for one statistics subscriber: publish() per candle,
+    publish_batch() into the per-event handler, and publish_batch() into
+    a vectorised batch_handler.
+    """
+    candles = [Candle(1_700_000_000.0 + 60 * i, 100.0, 101.0, 99.0, 100.0 + i % 13, 1.0) for i in range(n_events)]
+    batches = [candles[i:i + batch_size] for i in range(0, n_events, batch_size)]
+
+    print(f"{'case':<34} {'ns/candle':>12}")
+    for case in ("publish", "publish_batch (per event)", "publish_batch (batch_handler)"):
+        bus = EventBus()
+        stats = CloseStats()
+        bus.subscribe(EventType.FAKE_CANDLE, stats.on_candle,
+                      batch_handler=stats.on_candles if case.endswith("(batch_handler)") else None)
+        start = time.perf_counter_ns()
+        if case == "publish":
+            for candle in candles:
+                bus.publish(EventType.FAKE_CANDLE, candle, source="bench")
+        else:
+            for batch in batches:
+                bus.publish_batch(EventType.FAKE_CANDLE, batch, source="bench")
+        elapsed = time.perf_counter_ns() - start
+        assert stats.count == n_events
+        print(f"{case:<34} {elapsed / n_events:>12.1f}")
+
+
+def bench_kill_switch(rounds: int, backlog: int, handler_us: float = 50.0) -> None:
+    """
+    Kill-switch propagation latency behind a market-data backlog.
+
+    One agent worker (shared ASYNC group) handles PRICE_UPDATE with a busy
+    handler of `handler_us` and KILL_SWITCH_ACTIVATED. Each round queues
+    `backlog` price updates, then fires the kill switch and measures the
+    time until the kill handler runs. FIFO delivery would need roughly
+    backlog * handler_us.
+    """
+    latencies = LatencyHistogram()
+    for _ in range(rounds):
+        bus = EventBus()
+        fired = threading.Event()
+        sent_at = [0]
+        received_at = [0]
+
+        def on_price(event):
+            end = time.perf_counter_ns() + handler_us * 1000
+            while time.perf_counter_ns() < end:
+                pass
+
+        def on_kill(event):
+            received_at[0] = time.perf_counter_ns()
+            fired.set()
+
+        bus.subscribe(EventType.PRICE_UPDATE, on_price, mode=DispatchMode.ASYNC,
+                      group="agent", queue_size=backlog * 2)
+        bus.subscribe(EventType.KILL_SWITCH_ACTIVATED, on_kill, mode=DispatchMode.ASYNC, group="agent")
+        for _ in range(backlog):
+            bus.publish(EventType.PRICE_UPDATE, {"price": 1.0}, source="bench", key="BTC/USD")
+
+        guard = PolicyGuard(bus)
+        sent_at[0] = time.perf_counter_ns()
+        guard.activate_kill_switch("bench")
+        fired.wait(timeout=30.0)
+        latencies.record(received_at[0] - sent_at[0])
+        bus.shutdown()
+
+    summary = latencies.summary()
+    print(f"backlog={backlog} handler={handler_us:.0f}us rounds={rounds}")
+    print(f"kill switch p50:  {summary['p50_ms']:.3f} ms")
+    print(f"kill switch p99:  {summary['p99_ms']:.3f} ms")
+    print(f"kill switch max:  {summary['max_ms']:.3f} ms")
+    print(f"FIFO estimate:    {backlog * handler_us / 1000:.1f} ms")
+
+
+CASCADE_CHAIN = (EventType.FAKE_CANDLE, EventType.PRICE_UPDATE, EventType.MARKET_REGIME,
+                 EventType.ORDER_REQUEST, EventType.ORDER_FILLED, EventType.POSITION_UPDATE)
+
+
+def bench_cascade(n_roots: int) -> None:
+    """
+    Cost of the six-hop candle -> position chain per root event.
+
+    Each handler re-publishes the next event type, as the backtest
+    pipeline does. Compares nested (recursive) dispatch with
+    run-to-completion (best of 5 runs) and reports the Python stack
+    depth at the last hop.
+    """
+    print(f"{'mode':<20} {'us/root':>10} {'ns/hop':>10} {'stack depth':>12}")
+    for rtc in (False, True):
+        bus = EventBus(run_to_completion=rtc)
+        depth = [None]
+
+        def relay(next_type):
+            def handler(event):
+                bus.publish(next_type, event.data, source="bench")
+            return handler
+
+        def sink(event):
+            # Measured once, on the warm-up event only
+            if depth[0] is None:
+                depth[0] = len(inspect.stack(0))
+
+        for current, following in zip(CASCADE_CHAIN, CASCADE_CHAIN[1:]):
+            bus.subscribe(current, relay(following))
+        bus.subscribe(CASCADE_CHAIN[-1], sink)
+
+        payload = {"symbol": "BTC/USD", "price": 42000.0}
+        bus.publish(CASCADE_CHAIN[0], payload, source="bench")
+        best = None
+        for _ in range(5):
+            start = time.perf_counter_ns()
+            for _ in range(n_roots):
+                bus.publish(CASCADE_CHAIN[0], payload, source="bench")
+            elapsed = time.perf_counter_ns() - start
+            best = elapsed if best is None else min(best, elapsed)
+        per_root = best / n_roots
+        label = "run-to-completion" if rtc else "nested"
+        print(f"{label:<20} {per_root / 1000:>10.2f} {per_root / len(CASCADE_CHAIN):>10.1f} {depth[0]:>12}")
+
+
+def bench_journal(n_events: int) -> None:
+    """
+    Journal cost: publisher-side overhead, write-behind throughput and
+    indexed read/replay speed for PRICE_UPDATE events.
+    """
+    payload = PriceUpdate("BTC/USD", 42000.0, 1_700_000_000.0)
+
+    def publish_all(bus):
+        start = time.perf_counter_ns()
+        for _ in range(n_events):
+            bus.publish(EventType.PRICE_UPDATE, payload, source="bench", key="BTC/USD")
+        return time.perf_counter_ns() - start
+
+    bus = EventBus()
+    bus.subscribe(EventType.PRICE_UPDATE, lambda event: None)
+    baseline = publish_all(bus)
+
+    with tempfile.TemporaryDirectory() as directory:
+        bus = EventBus()
+        bus.subscribe(EventType.PRICE_UPDATE, lambda event: None)
+        journal = EventJournal(bus, directory)
+        journal.start()
+        journaled = publish_all(bus)
+        start = time.perf_counter_ns()
+        journal.stop()
+        drain = time.perf_counter_ns() - start
+        stats = journal.get_stats()
+        on_disk = sum(os.path.getsize(os.path.join(directory, name)) for name in os.listdir(directory))
+
+        reader = JournalReader(directory)
+        start = time.perf_counter_ns()
+        count = sum(1 for _ in reader.read())
+        read_ns = time.perf_counter_ns() - start
+        start = time.perf_counter_ns()
+        reader.replay(EventBus(), event_types=[EventType.PRICE_UPDATE])
+        replay_ns = time.perf_counter_ns() - start
+
+    print(f"events:                  {n_events} (codec={stats['codec']})")
+    print(f"publish ns/event:        {baseline / n_events:.0f} -> {journaled / n_events:.0f} with journal")
+    print(f"drain after stop:        {drain / 1e6:.1f} ms")
+    print(f"bytes/event on disk:     {on_disk / n_events:.1f}")
+    print(f"read events/s:           {count / (read_ns / 1e9):,.0f}")
+    print(f"replay events/s:         {count / (replay_ns / 1e9):,.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PROJECT PREDATOR EventBus benchmarks")
+    sub = parser.add_subparsers(dest="bench", required=True)
+    p_tp = sub.add_parser("throughput", help="Publish throughput with 1/4/16 publisher threads")
+    p_tp.add_argument("--events", type=int, default=50_000, help="Events per publishing thread")
+    p_pc = sub.add_parser("publish_cost", help="ns per publish with 0 and 1 subscribers")
+    p_pc.add_argument("--events", type=int, default=500_000, help="Events per case")
+    p_ec = sub.add_parser("event_cost", help="Per-event memory and construction cost")
+    p_ec.add_argument("--events", type=int, default=200_000, help="Events to build")
+    p_bt = sub.add_parser("batch", help="publish vs publish_batch, per-event vs vectorised batch handler")
+    p_bt.add_argument("--events", type=int, default=200_000, help="Candles to publish")
+    p_bt.add_argument("--batch-size", type=int, default=256, help="Candles per publish_batch")
+    p_ks = sub.add_parser("kill_switch", help="Kill-switch latency behind a market-data backlog")
+    p_ks.add_argument("--rounds", type=int, default=20, help="Measurement rounds")
+    p_ks.add_argument("--backlog", type=int, default=5_000, help="Queued price updates per round")
+    p_cc = sub.add_parser("cascade", help="Six-hop publish chain: nested vs run-to-completion")
+    p_cc.add_argument("--roots", type=int, default=50_000, help="Root events to publish")
+    p_jr = sub.add_parser("journal", help="Event journal write/read cost")
+    p_jr.add_argument("--events", type=int, default=200_000, help="Events to journal")
+    args = parser.parse_args()
+    # Keep CRITICAL-event log lines out of the measurements
+    logging.disable(logging.CRITICAL)
+
+    if args.bench == "throughput":
+        bench_throughput(args.events)
+    elif args.bench == "publish_cost":
+        bench_publish_cost(args.events)
+    elif args.bench == "event_cost":
+        bench_event_cost(args.events)
+    elif args.bench == "batch":
+        bench_batch(args.events, args.batch_size)
+    elif args.bench == "kill_switch":
+        bench_kill_switch(args.rounds, args.backlog)
+    elif args.bench == "cascade":
+        bench_cascade(args.roots)
+    elif args.bench == "journal":
+        bench_journal(args.events)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+PROJECT PREDATOR - Import-Time Benchmarks
+
+Cold-start import cost of the entry points, from `python -X importtime`
+in fresh interpreters (best of N runs), plus the heaviest modules each
+pulls in. With --gate the run fails when an entry point exceeds its
+budget or imports a module that must stay lazy.
+
+Usage:
+    python -m benchmarks.bench_import [--runs N] [--top N] [--gate]
+"""
+import argparse
+import re
+import subprocess
+import sys
+from typing import Dict, Tuple
+
+# Cumulative import budgets in milliseconds (best of --runs). The runner
+# imports the engine, loader and NumPy up front, so its figure is what a
+# backtest pays before its first candle.
+IMPORT_BUDGETS_MS = {
+    "backend.backtest.backtest_runner": 300.0,
+    "backend.backtest.backtest_engine": 150.0,
+    "backend.main": 200.0,
+}
+
+# Modules no entry point may import eagerly
+LAZY_MODULES = ("fastapi", "uvicorn", "starlette", "pydantic", "dotenv")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|(\s*)(\S+)")
+
+
+def import_profile(module: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Import a module in a fresh interpreter
+
+    Returns:
+        Module name -> (self us, cumulative us) for everything imported
+    """
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                            capture_output=True, text=True, check=True)
+    profile = {}
+    for line in result.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            profile[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return profile
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PROJECT PREDATOR import-time benchmarks")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters per entry point")
+    parser.add_argument("--top", type=int, default=8, help="Heaviest modules to list")
+    parser.add_argument("--gate", action="store_true", help="Exit 1 on a budget or lazy-module violation")
+    args = parser.parse_args()
+
+    failures = []
+    for module, budget_ms in IMPORT_BUDGETS_MS.items():
+        profiles = [import_profile(module) for _ in range(args.runs)]
+        best = min(profiles, key=lambda p: p[module][1])
+        total_ms = best[module][1] / 1000.0
+        eager = sorted(name for name in best if name.split(".")[0] in LAZY_MODULES)
+        status = "OK" if total_ms <= budget_ms and not eager else "FAIL"
+        print(f"{module:<36} {total_ms:>8.1f} ms  (budget {budget_ms:.0f} ms)  {status}")
+        heaviest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:args.top]
+        for name, (self_us, _) in heaviest:
+            print(f"    {self_us / 1000.0:>7.1f} ms  {name}")
+        if eager:
+            print(f"    eagerly imports: {', '.join(eager)}")
+        if status == "FAIL":
+            failures.append(module)
+    if args.gate and failures:
+        print(f"Import gate failed: {', '.join(failures)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+PROJECT PREDATOR - IPC Benchmarks
+
+Round-trip throughput and latency of an agent answering PRICE_UPDATE
+with ORDER_REQUEST: in-process on the EventBus vs hosted in a child
+process behind the shared-memory transport.
+
+Usage:
+    python -m benchmarks.bench_ipc [--events N] [--pings N]
+"""
+import argparse
+import logging
+import threading
+import time
+from backend.agents.base import BaseAgent
+from backend.core.event_bus import EventBus, EventType
+from backend.core.payloads import OrderRequest, PriceUpdate
+from backend.core.registry import Registry
+from backend.ipc.process_host import ProcessAgentHost
+from backend.monitor.histogram import LatencyHistogram
+
+
+class EchoAgent(BaseAgent):
+    """
+    Answers every PRICE_UPDATE with an ORDER_REQUEST
+
+    Importable, so ProcessAgentHost can run it in a child; tests/test_ipc.py
+    hosts it too.
+    """
+
+    def __init__(self, event_bus: EventBus, registry: Registry, watch_orders: bool = False):
+        """
+        Initialize EchoAgent
+
+        Args:
+            event_bus: Reference to EventBus
+            registry: Reference to Registry
+            watch_orders: Also count the ORDER_REQUEST events it receives
+        """
+        super().__init__(event_bus, registry)
+        self.watch_orders = watch_orders
+
+    def _subscribe_events(self) -> None:
+        self.event_bus.subscribe(EventType.PRICE_UPDATE, self._on_price)
+        if self.watch_orders:
+            self.event_bus.subscribe(EventType.ORDER_REQUEST, self._log_event)
+
+    def _unsubscribe_events(self) -> None:
+        self.event_bus.unsubscribe(EventType.PRICE_UPDATE, self._on_price)
+        if self.watch_orders:
+            self.event_bus.unsubscribe(EventType.ORDER_REQUEST, self._log_event)
+
+    def _on_price(self, event) -> None:
+        self._log_event(event)
+        price = event.data
+        self.event_bus.publish(EventType.ORDER_REQUEST, OrderRequest(price.symbol, "BUY", quantity=1.0,
+                                                                     price=price.price),
+                               source=self.get_name(), key=price.symbol)
+
+
+def run_case(hosted: bool, n_events: int, n_pings: int) -> None:
+    bus = EventBus()
+    received = [0]
+    answered = threading.Event()
+    target = [0]
+
+    def on_order(event):
+        received[0] += 1
+        if received[0] >= target[0]:
+            answered.set()
+
+    bus.subscribe(EventType.ORDER_REQUEST, on_order)
+    agent = ProcessAgentHost(bus, Registry(), EchoAgent) if hosted else EchoAgent(bus, Registry())
+    agent.start()
+    try:
+        payload = PriceUpdate("BTC/USD", 42000.0, 1.7e9)
+        # Throughput: publish everything, wait for every answer
+        target[0] = n_events
+        answered.clear()
+        start = time.perf_counter_ns()
+        for _ in range(n_events):
+            bus.publish(EventType.PRICE_UPDATE, payload, source="bench", key="BTC/USD")
+        answered.wait(60)
+        elapsed = time.perf_counter_ns() - start
+
+        # Latency: one event in flight at a time
+        histogram = LatencyHistogram()
+        for _ in range(n_pings):
+            target[0] = received[0] + 1
+            answered.clear()
+            sent = time.perf_counter_ns()
+            bus.publish(EventType.PRICE_UPDATE, payload, source="bench", key="BTC/USD")
+            answered.wait(5)
+            histogram.record(time.perf_counter_ns() - sent)
+    finally:
+        agent.stop()
+
+    summary = histogram.summary()
+    name = "process (shm)" if hosted else "in-process"
+    print(f"{name:<14} {n_events / (elapsed / 1e9):>14,.0f} {summary['p50_ms'] * 1000:>10.1f} "
+          f"{summary['p99_ms'] * 1000:>10.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PROJECT PREDATOR IPC benchmarks")
+    parser.add_argument("--events", type=int, default=50_000, help="Events for the throughput run")
+    parser.add_argument("--pings", type=int, default=2_000, help="Round trips for the latency run")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    print(f"{'mode':<14} {'round trips/s':>14} {'p50 us':>10} {'p99 us':>10}")
+    run_case(False, args.events, args.pings)
+    run_case(True, args.events, args.pings)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+PROJECT PREDATOR - Data Loader Benchmarks
+
+Usage:
+    python -m benchmarks.bench_loader [--rows N] [--chunk-rows N] [--skip-baseline] [--parquet]
+"""
+import argparse
+import csv
+import os
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from backend.market.candle import Candle
+from backend.simulation.candle_cache import CandleCache
+from backend.simulation.historical_data_loader import HistoricalDataLoader
+
+
+def write_epoch_csv(path: str, rows: int) -> None:
+    """1-minute bars with epoch-second timestamps"""
+    with open(path, "w") as f:
+        f.write("timestamp,open,high,low,close,volume\n")
+        for i in range(rows):
+            p = 100 + (i % 17)
+            f.write(f"{1_700_000_000 + i * 60},{p}.5,{p + 1},{p - 1},{p}.25,{i % 13}\n")
+
+
+def load_rows_baseline(path: str):
+    """Row-at-a-time loader (DictReader, ISO attempt then float per row), as before chunking"""
+    def parse(ts_raw):
+        try:
+            dt = datetime.fromisoformat(ts_raw.replace("Z", "+00:00"))
+            return (dt if dt.tzinfo else dt.replace(tzinfo=timezone.utc)).timestamp()
+        except (ValueError, AttributeError):
+            return float(ts_raw)
+    with open(path, "r", newline="") as f:
+        return [Candle(parse(row["timestamp"]), float(row["open"]), float(row["high"]), float(row["low"]),
+                       float(row["close"]), float(row.get("volume", 0.0))) for row in csv.DictReader(f)]
+
+
+def bench_csv(rows: int, chunk_rows: int, baseline: bool) -> None:
+    """
+    Rows/sec of load_csv against the row-at-a-time baseline, the
+    loader's tracemalloc peak beyond the 48 bytes/row it returns, and
+    the CandleCache conversion and warm-open times.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "epoch.csv")
+        write_epoch_csv(path, rows)
+        size_mb = os.path.getsize(path) / 1e6
+
+        loader = HistoricalDataLoader(chunk_rows=chunk_rows)
+        store = loader.load_csv(path)
+        stats = loader.get_stats()
+        del store
+
+        tracemalloc.start()
+        store = loader.load_csv(path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        overhead = peak - store.nbytes
+
+        print(f"rows:                 {rows} ({size_mb:.0f} MB, chunk_rows={chunk_rows})")
+        print(f"load_csv:             {stats['seconds']:.2f}s  {stats['rows_per_second']:,.0f} rows/s")
+        print(f"peak beyond result:   {overhead / 1e6:.1f} MB ({overhead / chunk_rows:.0f} bytes per chunk row)")
+        del store
+
+        cache = CandleCache(os.path.join(tmp, "cache"), loader)
+        start = time.perf_counter()
+        cache.build(path)
+        converted = time.perf_counter() - start
+        start = time.perf_counter()
+        mapped = cache.load(path)
+        opened = time.perf_counter() - start
+        assert len(mapped) == rows
+        print(f"cache convert:        {converted:.2f}s (parse + hash + write)")
+        print(f"cache open (mmap):    {opened * 1000:.2f} ms")
+        if baseline:
+            start = time.perf_counter()
+            candles = load_rows_baseline(path)
+            elapsed = time.perf_counter() - start
+            assert len(candles) == rows
+            print(f"row-at-a-time:        {elapsed:.2f}s  {rows / elapsed:,.0f} rows/s")
+            print(f"speedup:              {elapsed / stats['seconds']:.1f}x")
+
+
+def bench_parquet(rows: int, chunk_rows: int) -> None:
+    """
+    load_parquet over the whole file and over a 10% [start, end) window
+    (row-group pushdown), and the tracemalloc peak of streaming it with
+    iter_parquet_batches. Requires pyarrow.
+    """
+    import numpy as np
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "candles.parquet")
+        ts = 1_700_000_000 + np.arange(rows, dtype=np.int64) * 60
+        close = 100 + (np.arange(rows) % 17).astype(np.float64)
+        table = pa.table({"timestamp": pa.array(ts.astype("datetime64[s]")), "open": close - 0.5,
+                          "high": close + 1, "low": close - 1, "close": close, "volume": np.ones(rows),
+                          "symbol": pa.array(["BTC/USD"] * rows).dictionary_encode()})
+        pq.write_table(table, path, row_group_size=chunk_rows)
+        del table
+        loader = HistoricalDataLoader(chunk_rows=chunk_rows)
+
+        store = loader.load_parquet(path)
+        full = loader.get_stats()
+        start, end = float(ts[rows * 4 // 10]), float(ts[rows // 2])
+        window = loader.load_parquet(path, start, end)
+        ranged = loader.get_stats()
+        assert len(store) == rows and len(window) == rows // 2 - rows * 4 // 10
+        del store, window
+
+        # Arrow buffers are not seen by tracemalloc: sample the Arrow pool per batch
+        streamed = arrow_peak = 0
+        tracemalloc.start()
+        for batch in loader.iter_parquet_batches(path):
+            streamed += len(batch)
+            arrow_peak = max(arrow_peak, pa.total_allocated_bytes())
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        peak += arrow_peak
+        assert streamed == rows
+
+        print(f"parquet rows:         {rows} ({os.path.getsize(path) / 1e6:.0f} MB, row groups of {chunk_rows})")
+        print(f"load_parquet:         {full['seconds']:.2f}s  {full['rows_per_second']:,.0f} rows/s")
+        print(f"10% window:           {ranged['seconds']:.3f}s  "
+              f"({ranged['row_groups_read']}/{ranged['row_groups']} row groups read)")
+        print(f"streaming peak:       {peak / 1e6:.1f} MB Arrow + NumPy (whole file as columns: {rows * 48 / 1e6:.0f} MB)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PROJECT PREDATOR data loader benchmarks")
+    parser.add_argument("--rows", type=int, default=1_000_000, help="CSV rows (the target case is 5000000)")
+    parser.add_argument("--chunk-rows", type=int, default=100_000, help="Loader chunk size")
+    parser.add_argument("--skip-baseline", action="store_true", help="Do not time the row-at-a-time loader")
+    parser.add_argument("--parquet", action="store_true", help="Benchmark Parquet loading instead (needs pyarrow)")
+    args = parser.parse_args()
+    if args.parquet:
+        bench_parquet(args.rows, args.chunk_rows)
+    else:
+        bench_csv(args.rows, args.chunk_rows, not args.skip_baseline)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+PROJECT PREDATOR - Sharding Benchmarks
+
+Replay throughput of the symbol-sharded engine for 1, 2 and 4 worker
+processes over the same symbol universe. Scaling needs at least as many
+free cores as shards.
+
+Usage:
+    python -m benchmarks.bench_sharding [--symbols N] [--steps N] [--shards 1,2,4]
+"""
+import argparse
+import logging
+import os
+from backend.sharding.coordinator import ShardCoordinator
+from backend.sharding.partition import symbol_universe
+
+
+def run_case(shards: int, n_symbols: int, steps: int) -> float:
+    coordinator = ShardCoordinator(symbol_universe(n_symbols), shards, steps=steps,
+                                   max_gross_exposure=0.0, shard_log_level=logging.CRITICAL)
+    coordinator.start()
+    try:
+        coordinator.wait_for_completion(600)
+    finally:
+        coordinator.stop()
+    summary = coordinator.summary()
+    print(f"{shards:>6} {summary['events']:>10,} {summary['elapsed_s']:>10.2f} {summary['events_per_second']:>14,.0f}")
+    return summary["events_per_second"]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PROJECT PREDATOR sharding benchmarks")
+    parser.add_argument("--symbols", type=int, default=1000, help="Symbol universe size")
+    parser.add_argument("--steps", type=int, default=50, help="Price updates per symbol")
+    parser.add_argument("--shards", default="1,2,4", help="Comma-separated shard counts")
+    args = parser.parse_args()
+    logging.disable(logging.CRITICAL)
+    print(f"cores: {os.cpu_count()}")
+    print(f"{'shards':>6} {'events':>10} {'seconds':>10} {'events/s':>14}")
+    baseline = None
+    for shards in (int(n) for n in args.shards.split(",")):
+        rate = run_case(shards, args.symbols, args.steps)
+        baseline = baseline or rate
+        print(f"{'':>6} speedup x{rate / baseline:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+PROJECT PREDATOR - CandleCache Tests
+Memory-mapped candle cache: conversion, invalidation and pruning.
+"""
+import os
+import numpy as np
+from backend.simulation.candle_cache import CandleCache
+
+HEADER = "timestamp,open,high,low,close,volume\n"
+
+
+def _write(path, rows, start=1_700_000_000):
+    path.write_text(HEADER + "".join(f"{start + 60 * i},{i},{i + 1},{i - 1},{i}.5,1\n" for i in range(rows)))
+    return str(path)
+
+
+def test_converts_once_then_maps(tmp_path):
+    """First load converts, later loads are read-only mmaps of the same rows"""
+    source = _write(tmp_path / "a.csv", 50)
+    cache = CandleCache(str(tmp_path / "cache"))
+    first = cache.load(source)
+    second = CandleCache(str(tmp_path / "cache")).load(source)
+    assert cache.misses == 1 and len(second) == 50
+    assert isinstance(second.close.base, np.memmap) or isinstance(second.close, np.memmap)
+    assert not second.close.flags.writeable
+    assert list(second) == list(first)
+
+
+def test_touch_revalidates_and_edit_rebuilds(tmp_path):
+    """Same content under a new mtime is reused; new content is converted again"""
+    source = _write(tmp_path / "a.csv", 20)
+    cache = CandleCache(str(tmp_path / "cache"))
+    cache.load(source)
+    stat = os.stat(source)
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    cache.load(source)
+    assert (cache.hits, cache.misses) == (1, 1)
+    _write(tmp_path / "a.csv", 30)
+    assert len(cache.load(source)) == 30 and cache.misses == 2
+
+
+def test_prune_removes_missing_sources_and_lru(tmp_path):
+    """Gone sources go first, then least recently used entries until under max_bytes"""
+    cache = CandleCache(str(tmp_path / "cache"))
+    paths = [_write(tmp_path / f"{name}.csv", 100) for name in "abc"]
+    for i, path in enumerate(paths):
+        cache.build(path)
+        meta = os.path.join(cache.entry_dir(path), "meta.json")
+        os.utime(meta, (1_000 + i, 1_000 + i))
+    os.remove(paths[2])
+    removed = cache.prune(max_bytes=100 * 48)
+    assert sorted(m["source"] for m in removed) == sorted(os.path.abspath(p) for p in paths[::2])
+    assert [m["source"] for m in cache.entries()] == [os.path.abspath(paths[1])]
+
+
+def test_rebuild_of_same_content_keeps_the_published_entry(tmp_path):
+    """A second converter of unchanged data leaves the mapped entry in place"""
+    source = _write(tmp_path / "a.csv", 40)
+    cache = CandleCache(str(tmp_path / "cache"))
+    store = cache.load(source)
+    inode = os.stat(cache.entry_dir(source)).st_ino
+    CandleCache(str(tmp_path / "cache")).build(source, force=True)
+    assert os.stat(cache.entry_dir(source)).st_ino == inode
+    assert os.listdir(tmp_path / "cache") == [os.path.basename(cache.entry_dir(source))]
+    assert list(cache.load(source)) == list(store)
+
+
+def test_prune_keeps_touched_sources_with_the_same_content(tmp_path):
+    """Prune's staleness check matches lookup(): only changed content is stale"""
+    cache = CandleCache(str(tmp_path / "cache"))
+    touched, edited = _write(tmp_path / "a.csv", 10), _write(tmp_path / "b.csv", 10)
+    for path in (touched, edited):
+        cache.build(path)
+    stat = os.stat(touched)
+    os.utime(touched, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    _write(tmp_path / "b.csv", 10, start=1_800_000_000)
+    removed = cache.prune()
+    assert [m["source"] for m in removed] == [os.path.abspath(edited)]
@@ -0,0 +1,55 @@
+"""
+PROJECT PREDATOR - CandleStore Tests
+Columnar candles, zero-copy slicing and their consumers.
+"""
+import numpy as np
+from backend.backtest.backtest_engine import BacktestEngine
+from backend.market.candle import Candle
+from backend.market.candle_store import CandleStore
+from backend.simulation.historical_data_loader import HistoricalDataLoader
+from backend.strategies.fake_strategy_trend import FakeStrategyTrend
+
+
+def _candles(n: int = 200):
+    return [Candle.from_row(1_700_000_000 + i * 60, 100 + (i % 7), 101 + (i % 7), 99 + (i % 7), 100 + (i % 7), 1.0)
+            for i in range(n)]
+
+
+def test_rows_read_as_candles_and_slices_share_buffers():
+    """store[i] is a Candle; store[a:b] and between() are views, not copies"""
+    candles = _candles()
+    store = CandleStore.from_candles(candles)
+    assert len(store) == 200 and store.nbytes == 200 * 48
+    assert store[5] == candles[5] and isinstance(store[-1], Candle)
+    assert list(store) == candles
+
+    view = store[10:20]
+    assert np.shares_memory(view.close, store.close)
+    assert list(view) == candles[10:20]
+    window = store.between(1_700_000_000 + 60 * 50, 1_700_000_000 + 60 * 60)
+    assert np.shares_memory(window.timestamp, store.timestamp)
+    assert list(window) == candles[50:60]
+    assert not CandleStore.empty() and len(CandleStore.concat([view, window])) == 20
+
+
+def test_loader_returns_a_store(tmp_path):
+    """load_csv parses ISO and epoch timestamps into columns"""
+    path = tmp_path / "ohlcv.csv"
+    path.write_text("timestamp,open,high,low,close,volume\n"
+                    "2024-01-01T00:00:00Z,1,2,0.5,1.5,10\n"
+                    "1704067260,1.5,2.5,1,2,11\n")
+    store = HistoricalDataLoader().load_csv(str(path))
+    assert isinstance(store, CandleStore)
+    assert store.timestamp.tolist() == [1704067200.0, 1704067260.0]
+    assert store[1] == Candle(1704067260.0, 1.5, 2.5, 1.0, 2.0, 11.0)
+
+
+def test_backtest_and_strategy_accept_a_store():
+    """A CandleStore backtests and evaluates exactly like the list it came from"""
+    candles = _candles()
+    store = CandleStore.from_candles(candles)
+    from_list = BacktestEngine(candles, strategy_name="fake_trend", speed=1e9, virtual_time=True).run()
+    from_store = BacktestEngine(store, strategy_name="fake_trend", speed=1e9, virtual_time=True).run()
+    assert from_store["num_trades"] == from_list["num_trades"] > 0
+    assert from_store["final_equity"] == from_list["final_equity"]
+    assert FakeStrategyTrend(None).on_candles(store) == FakeStrategyTrend(None).on_candles(candles)
@@ -0,0 +1,86 @@
+"""
+PROJECT PREDATOR - Binary Codec Tests
+Schema layouts, symbol interning, fallbacks and versioning.
+"""
+import pytest
+from backend.codec.binary import BinaryCodec
+from backend.core.event_bus import Event, EventType
+from backend.core.payloads import Fill, OrderRequest, PositionSnapshot, PriceUpdate
+from backend.market.candle import Candle
+
+
+def test_every_schema_payload_round_trips():
+    """Typed payloads come back equal, with type, time, source and key"""
+    encoder, decoder = BinaryCodec(), BinaryCodec()
+    events = [
+        Event(EventType.FAKE_CANDLE, Candle(1.7e9, 100.0, 101.0, 99.0, 100.5, 3.0), 1, "HistoricalReplayer"),
+        Event(EventType.PRICE_UPDATE, PriceUpdate("ETH/USD", 2000.0, 1.7e9), 2, "FakePriceFeed", "ETH/USD"),
+        Event(EventType.ORDER_REQUEST, OrderRequest("BTC/USD", "BUY", quantity=0.1, price=100.0), 3, "s", "BTC/USD"),
+        Event(EventType.ORDER_FILLED, Fill("ord-é-1", "BTC/USD", "SELL", 0.1, 100.0), 4, "FakeMarket", "BTC/USD"),
+        Event(EventType.POSITION_UPDATE, PositionSnapshot("BTC/USD", 0.1, 100.0, 101.0, 0.1, 0.0), 5, "Portfolio"),
+    ]
+    for event in events:
+        decoded = decoder.decode_event(encoder.encode_event(event))
+        assert type(decoded.data) is type(event.data)
+        assert decoded.data == event.data
+        assert (decoded.event_type, decoded.timestamp_ns, decoded.source, decoded.key) == \
+               (event.event_type, event.timestamp_ns, event.source, event.key)
+
+    source, key, data = decoder.decode_body(encoder.encode_body("FakeMarket", None, events[3].data))
+    assert (source, key, data) == ("FakeMarket", None, events[3].data)
+
+
+def test_symbols_are_defined_once_per_stream_and_again_after_reset():
+    """Repeated strings cost 2 bytes; after reset() a fresh decoder can join"""
+    encoder = BinaryCodec()
+    event = Event(EventType.PRICE_UPDATE, PriceUpdate("BTC/USD", 100.0, 1.0), 1, "FakePriceFeed", "BTC/USD")
+    first = encoder.encode_event(event)
+    second = encoder.encode_event(event)
+    assert len(second) < len(first)
+    assert len(second) == 3 + 2 + 8 + 2 + 1 + 2 + 1 + (2 + 8 + 8 + 1)
+
+    with pytest.raises(ValueError):
+        BinaryCodec().decode_event(second)
+
+    encoder.reset()
+    late_joiner = BinaryCodec()
+    assert late_joiner.decode_event(encoder.encode_event(event)).data == event.data
+
+    skipped_reader = BinaryCodec()
+    skipped_reader.observe(first)
+    assert skipped_reader.decode_event(second).key == "BTC/USD"
+
+
+def test_dict_payloads_and_unstorable_values_use_the_tagged_fallback():
+    """Dicts, non-schema values and arbitrary keys round-trip exactly"""
+    encoder, decoder = BinaryCodec(), BinaryCodec()
+    payloads = [
+        {"tick_number": 7, "timestamp": 1.5, "sim_time": "2024-01-01T00:00:00"},
+        {"nested": [1, None, True, b"raw", 10 ** 30, (1, "x"), {"deep": -2.5}], "note": "x" * 300},
+        OrderRequest("BTC/USD", "BUY", price=None),
+        Fill(order_id=123),
+        {"type": EventType.TICK},
+    ]
+    for data in payloads:
+        event = Event(EventType.SYSTEM_BOOT, data, 1, None, ("BTC/USD", 60))
+        decoded = decoder.decode_event(encoder.encode_event(event))
+        assert decoded.data == data
+        assert type(decoded.data) is type(data)
+        assert decoded.source is None and decoded.key == ("BTC/USD", 60)
+
+
+def test_failed_encode_does_not_desync_the_stream():
+    """Symbols interned by an encode that raised are re-defined later"""
+    encoder, decoder = BinaryCodec(), BinaryCodec()
+    with pytest.raises(Exception):
+        encoder.encode_body("new-source", "NEW/USD", {"bad": lambda: None})
+    body = encoder.encode_body("new-source", "NEW/USD", {"ok": 1})
+    assert decoder.decode_body(body) == ("new-source", "NEW/USD", {"ok": 1})
+
+
+def test_unknown_version_is_rejected():
+    """Buffers from a newer format fail loudly instead of decoding garbage"""
+    body = bytearray(BinaryCodec().encode_body("s", None, {"a": 1}))
+    body[0] = 99
+    with pytest.raises(ValueError, match="version"):
+        BinaryCodec().decode_body(bytes(body))
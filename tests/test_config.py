@@ -0,0 +1,43 @@
+"""
+PROJECT PREDATOR - Config Tests
+Deferred loading of the environment configuration.
+"""
+import threading
+import pytest
+from backend.core.config import Config
+
+
+def test_concurrent_first_access_sees_every_value():
+    """Threads racing on the first attribute access all get loaded values"""
+    for _ in range(5):
+        config = Config()
+        barrier = threading.Barrier(16)
+        errors = []
+
+        def read():
+            barrier.wait()
+            try:
+                config.CANDLE_CACHE_DIR
+                config.ALLOW_REAL_TRADING
+            except AttributeError as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=read) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
+
+def test_bad_value_fails_on_every_access(monkeypatch):
+    """A parse error leaves the config unloaded instead of half-populated"""
+    monkeypatch.setenv("HEARTBEAT_INTERVAL", "abc")
+    config = Config()
+    config.JOURNAL_DIR = "/tmp/journal"
+    for name in ("HEARTBEAT_INTERVAL", "JOURNAL_SEGMENT_MB"):
+        with pytest.raises(ValueError):
+            getattr(config, name)
+    monkeypatch.setenv("HEARTBEAT_INTERVAL", "2.5")
+    assert config.HEARTBEAT_INTERVAL == 2.5
+    assert config.JOURNAL_DIR == "/tmp/journal"
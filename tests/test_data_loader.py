@@ -0,0 +1,75 @@
+"""
+PROJECT PREDATOR - HistoricalDataLoader Tests
+Chunked CSV and Arrow-native Parquet ingestion.
+"""
+from datetime import datetime, timezone
+import numpy as np
+import pytest
+from backend.market.candle import Candle
+from backend.simulation.historical_data_loader import HistoricalDataLoader
+
+
+def _epoch(text: str) -> float:
+    return datetime.fromisoformat(text).replace(tzinfo=timezone.utc).timestamp()
+
+
+def test_epoch_csv_parses_in_chunks(tmp_path):
+    """Column order, 'time' header, missing volume and blank lines; chunks stitch back together"""
+    path = tmp_path / "epoch.csv"
+    rows = [f"{100 + i}.5,{99 + i},{1_700_000_000 + 60 * i},{101 + i},{100 + i}\n" for i in range(10)]
+    path.write_text("close,low,time,high,open\n" + "".join(rows) + "\n")
+    loader = HistoricalDataLoader(chunk_rows=3)
+    store = loader.load_csv(str(path))
+    assert len(store) == 10
+    assert store[4] == Candle(1_700_000_240.0, 104.0, 105.0, 103.0, 104.5, 0.0)
+    assert np.all(np.diff(store.timestamp) == 60)
+    stats = loader.get_stats()
+    assert stats["rows"] == 10 and stats["timestamp_format"] == "epoch"
+    assert stats["chunks"] == 4 and stats["fallback_chunks"] == 0 and stats["rows_per_second"] > 0
+    assert [len(chunk) for chunk in loader.iter_csv_chunks(str(path), chunk_rows=4)] == [4, 4, 2]
+
+
+def test_iso_and_mixed_timestamps(tmp_path):
+    """ISO variants parse vectorised; offsets and mixed formats fall back per row"""
+    path = tmp_path / "iso.csv"
+    path.write_text("timestamp,open,high,low,close,volume\n"
+                    "2024-01-01T00:00:00Z,1,2,0.5,1.5,10\n"
+                    "2024-01-01 00:01:00,1,2,0.5,1.5,10\n"
+                    "2024-01-01T00:02:00+00:00,1,2,0.5,1.5,10\n")
+    assert HistoricalDataLoader().load_csv(str(path)).timestamp.tolist() == [
+        _epoch("2024-01-01T00:00:00"), _epoch("2024-01-01T00:01:00"), _epoch("2024-01-01T00:02:00")]
+
+    path.write_text("timestamp,open,high,low,close,volume\n"
+                    "2024-01-01T01:00:00+01:00,1,2,0.5,1.5,10\n"
+                    "1704067260,1,2,0.5,1.5,10\n")
+    assert HistoricalDataLoader().load_csv(str(path)).timestamp.tolist() == [1704067200.0, 1704067260.0]
+
+    path.write_text("timestamp,open,high,low,close,volume\n"
+                    "1704067200,1,2,0.5,1.5,10\n"
+                    "2024-01-01T00:01:00Z,1,2,0.5,1.5,10\n")
+    loader = HistoricalDataLoader()
+    assert loader.load_csv(str(path)).timestamp.tolist() == [1704067200.0, 1704067260.0]
+    assert loader.get_stats()["fallback_chunks"] == 1
+
+
+def test_parquet_projection_pushdown_and_streaming(tmp_path):
+    """Only OHLCV columns, only overlapping row groups, rows cut to [start, end)"""
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    n = 100
+    ts = 1_700_000_000 + 60 * np.arange(n)
+    path = str(tmp_path / "candles.parquet")
+    pq.write_table(pa.table({"timestamp": pa.array(ts.astype("datetime64[s]")), "open": np.arange(n, dtype=np.float32),
+                             "high": np.arange(n) + 1, "low": np.arange(n) - 1.0, "close": np.arange(n) + 0.5,
+                             "symbol": ["BTC/USD"] * n}), path, row_group_size=10)
+    loader = HistoricalDataLoader()
+    store = loader.load_parquet(path)
+    assert len(store) == n and store[3] == Candle(1_700_000_180.0, 3.0, 4.0, 2.0, 3.5, 0.0)
+
+    window = loader.load_parquet(path, float(ts[25]), float(ts[45]))
+    assert window.timestamp.tolist() == ts[25:45].astype(float).tolist()
+    assert loader.get_stats()["row_groups_read"] == 3
+
+    batches = list(loader.iter_parquet_batches(path, float(ts[25]), float(ts[45]), batch_rows=7))
+    assert max(len(b) for b in batches) <= 7 and sum(len(b) for b in batches) == 20
+    assert loader.load_parquet(path, 0.0, 1.0).timestamp.size == 0
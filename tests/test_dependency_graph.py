@@ -0,0 +1,96 @@
+"""
+PROJECT PREDATOR - Dependency Graph Tests
+Dependency-ordered, concurrent component start/stop in CoreEngine.
+"""
+import time
+import pytest
+from backend.agents.execution.agent import ExecutionAgent
+from backend.core.dependency_graph import DependencyGraph
+from backend.core.engine import CoreEngine
+from backend.market.fake_market import FakeMarket
+
+
+class Component:
+    """Component whose start/stop take `delay` seconds and log their order"""
+
+    def __init__(self, name, deps=(), delay=0.0, log=None):
+        self.name, self.deps, self.delay, self.log = name, deps, delay, log
+
+    def get_name(self):
+        return self.name
+
+    def get_dependencies(self):
+        return self.deps
+
+    def start(self):
+        time.sleep(self.delay)
+        self.log.append(("start", self.name))
+        return True
+
+    def stop(self):
+        self.log.append(("stop", self.name))
+        return True
+
+
+def test_dependencies_first_and_independent_components_concurrently():
+    """B waits for A; A and C overlap, so boot time follows the critical path"""
+    log = []
+    graph = DependencyGraph([Component("B", ("A",), 0.05, log), Component("A", (), 0.1, log),
+                             Component("C", (), 0.1, log)])
+    started = time.perf_counter()
+    durations = graph.run(lambda c: c.start(), max_workers=4)
+    elapsed = time.perf_counter() - started
+    assert log.index(("start", "A")) < log.index(("start", "B"))
+    assert elapsed < 0.25
+    assert graph.critical_path_ms(durations) == pytest.approx(durations["A"] + durations["B"])
+    graph.run(lambda c: c.stop(), reverse=True, max_workers=4)
+    assert log.index(("stop", "B")) < log.index(("stop", "A"))
+
+
+def test_serial_run_follows_topological_order():
+    """One worker (the default) applies the action in graph.order, every time"""
+    log = []
+    graph = DependencyGraph([Component("B", ("A",), 0, log), Component("C", (), 0.01, log),
+                             Component("A", (), 0, log), Component("D", (), 0, log)])
+    assert graph.order == ["C", "A", "D", "B"]
+    for _ in range(3):
+        log.clear()
+        graph.run(lambda c: c.start())
+        assert [name for _, name in log] == graph.order
+    log.clear()
+    graph.run(lambda c: c.stop(), reverse=True)
+    assert [name for _, name in log] == graph.order[::-1]
+
+
+def test_cycles_and_failures_are_reported():
+    """A cycle is rejected up front; a failed start skips its dependents"""
+    with pytest.raises(ValueError, match="cycle"):
+        DependencyGraph([Component("A", ("B",)), Component("B", ("A",))])
+
+    class Broken(Component):
+        def start(self):
+            raise RuntimeError("boom")
+
+    log = []
+    graph = DependencyGraph([Broken("A", (), 0, log), Component("B", ("A",), 0, log)])
+    with pytest.raises(RuntimeError, match="not run: B"):
+        graph.run(lambda c: c.start())
+    assert log == []
+
+
+def test_engine_starts_fake_market_before_execution_agent():
+    """ExecutionAgent binds FakeMarket even when it is registered first, and timings are exposed"""
+    engine = CoreEngine(journal_dir="")
+    execution = ExecutionAgent(engine.event_bus, engine.registry)
+    engine.register_agent(execution)
+    market = FakeMarket(engine.event_bus)
+    engine.register_simulation(market)
+    assert engine.start()
+    try:
+        assert execution._fake_market is market
+        lifecycle = engine.health_check()["lifecycle"]
+        assert set(lifecycle["components"]) == {"ExecutionAgent", "FakeMarket"}
+        assert lifecycle["start"]["critical_path_ms"] <= lifecycle["start"]["sum_ms"] + 1e-9
+    finally:
+        engine.stop()
+    assert engine.health_check()["lifecycle"]["components"]["ExecutionAgent"]["stop_ms"] is not None
@@ -0,0 +1,539 @@
+"""
+PROJECT PREDATOR - EventBus Tests
+Dispatch modes, backpressure and statistics.
+"""
+import threading
+import time
+from backend.core.event_bus import EventBus, EventType, DispatchMode
+from backend.core.subscriber_queue import BackpressurePolicy
+
+
+def test_async_subscriber_does_not_block_publisher():
+    """A slow ASYNC handler must not stall publish()"""
+    bus = EventBus()
+    release = threading.Event()
+    received = []
+
+    def slow_handler(event):
+        release.wait(timeout=2.0)
+        received.append(event.data["n"])
+
+    bus.subscribe(EventType.PRICE_UPDATE, slow_handler, mode=DispatchMode.ASYNC, queue_size=100)
+
+    start = time.perf_counter()
+    for i in range(10):
+        bus.publish(EventType.PRICE_UPDATE, {"n": i}, source="test")
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 0.5
+    release.set()
+    bus.shutdown()
+    assert received == list(range(10))
+
+
+def test_async_drop_oldest_and_drop_newest():
+    """Full queues apply the subscription's backpressure policy"""
+    bus = EventBus()
+    gate = threading.Event()
+    oldest, newest = [], []
+
+    def make_handler(sink):
+        def handler(event):
+            gate.wait(timeout=2.0)
+            sink.append(event.data["n"])
+        return handler
+
+    bus.subscribe(EventType.PRICE_UPDATE, make_handler(oldest), mode=DispatchMode.ASYNC,
+                  queue_size=2, backpressure=BackpressurePolicy.DROP_OLDEST)
+    bus.subscribe(EventType.PRICE_UPDATE, make_handler(newest), mode=DispatchMode.ASYNC,
+                  queue_size=2, backpressure=BackpressurePolicy.DROP_NEWEST)
+
+    # First event is picked up by each worker and parks on the gate
+    bus.publish(EventType.PRICE_UPDATE, {"n": 0}, source="test")
+    time.sleep(0.1)
+    for i in range(1, 6):
+        bus.publish(EventType.PRICE_UPDATE, {"n": i}, source="test")
+
+    stats = bus.get_stats()["async_queues"]
+    assert all(q["depth"] == 2 for q in stats)
+    assert all(q["dropped"] == 3 for q in stats)
+
+    gate.set()
+    bus.shutdown()
+    assert oldest == [0, 4, 5]
+    assert newest == [0, 1, 2]
+
+
+def test_handler_republishing_into_its_own_full_queue_does_not_hang():
+    """Under BLOCK the queue's own worker drops the oldest instead of waiting on itself"""
+    bus = EventBus()
+    seen = []
+
+    def handler(event):
+        seen.append(event.data["n"])
+        if event.data["n"] == 0:
+            bus.publish(EventType.PRICE_UPDATE, {"n": 1}, source="test")
+            bus.publish(EventType.PRICE_UPDATE, {"n": 2}, source="test")
+
+    bus.subscribe(EventType.PRICE_UPDATE, handler, mode=DispatchMode.ASYNC, queue_size=1)
+    bus.publish(EventType.PRICE_UPDATE, {"n": 0}, source="test")
+    deadline = time.monotonic() + 2.0
+    while len(seen) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert seen == [0, 2]
+    bus.publish(EventType.PRICE_UPDATE, {"n": 3}, source="test")
+    while len(seen) < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert seen == [0, 2, 3]
+    assert bus.get_stats()["async_queues"][0]["dropped"] == 1
+    bus.shutdown()
+
+
+def test_async_stats_report_wait_time():
+    """Queue wait time is exposed through get_stats()"""
+    bus = EventBus()
+    done = threading.Event()
+    bus.subscribe(EventType.TICK, lambda e: done.set(), mode=DispatchMode.ASYNC)
+    bus.publish(EventType.TICK, {"tick_number": 1}, source="test")
+    assert done.wait(timeout=2.0)
+    time.sleep(0.05)
+
+    (queue_stats,) = bus.get_stats()["async_queues"]
+    assert queue_stats["delivered"] == 1
+    assert queue_stats["depth"] == 0
+    assert queue_stats["wait_max_ms"] >= 0.0
+
+    bus.shutdown()
+    assert bus.get_stats()["async_queues"] == []
+
+
+def test_publish_is_safe_during_concurrent_subscribe():
+    """Publishers iterate a snapshot while the table is being swapped"""
+    bus = EventBus()
+    seen = []
+    errors = []
+
+    def stable(event):
+        seen.append(event)
+
+    bus.subscribe(EventType.PRICE_UPDATE, stable)
+    stop = threading.Event()
+
+    def churn():
+        def extra(event):
+            pass
+        while not stop.is_set():
+            bus.subscribe(EventType.PRICE_UPDATE, extra)
+            bus.unsubscribe(EventType.PRICE_UPDATE, extra)
+
+    def publisher():
+        try:
+            for _ in range(2000):
+                bus.publish(EventType.PRICE_UPDATE, {"price": 1.0}, source="test")
+        except Exception as e:  # pragma: no cover - failure path
+            errors.append(e)
+
+    churner = threading.Thread(target=churn)
+    churner.start()
+    publishers = [threading.Thread(target=publisher) for _ in range(4)]
+    for t in publishers:
+        t.start()
+    for t in publishers:
+        t.join()
+    stop.set()
+    churner.join()
+
+    assert errors == []
+    assert len(seen) == 8000
+    assert bus.get_stats()["subscriber_count"] == 1
+
+
+def test_publish_without_subscribers_skips_event_construction(monkeypatch):
+    """Zero-subscriber publishes never build an Event"""
+    import backend.core.event_bus as event_bus_module
+
+    built = []
+    real_event = event_bus_module.Event
+
+    def tracking_event(*args, **kwargs):
+        built.append(1)
+        return real_event(*args, **kwargs)
+
+    monkeypatch.setattr(event_bus_module, "Event", tracking_event)
+    bus = EventBus()
+    for _ in range(100):
+        bus.publish(EventType.FAKE_CANDLE, {"close": 1.0}, source="test")
+    assert built == []
+    assert bus.get_stats()["total_events_published"] == 100
+
+    bus.subscribe(EventType.FAKE_CANDLE, lambda e: None)
+    bus.publish(EventType.FAKE_CANDLE, {"close": 1.0}, source="test")
+    assert built == [1]
+
+
+def test_events_are_stamped_by_injected_clock():
+    """Events carry integer nanoseconds from the bus clock"""
+    from datetime import datetime, timezone
+    from backend.simulation.time_source import TimeSource
+
+    fixed_ns = 1_700_000_000_123_456_789
+    bus = EventBus(clock=lambda: fixed_ns)
+    seen = []
+    bus.subscribe(EventType.TICK, seen.append)
+    bus.publish(EventType.TICK, {"tick_number": 1}, source="test")
+
+    event = seen[0]
+    assert event.timestamp_ns == fixed_ns
+    assert event.timestamp == datetime.fromtimestamp(fixed_ns / 1e9, tz=timezone.utc)
+    assert event.data == {"tick_number": 1}
+    assert event.source == "test"
+    assert not hasattr(event, "__dict__")
+
+    # Simulation clock runs ahead of the wall clock when accelerated
+    time_source = TimeSource(speed=1000.0)
+    bus.set_clock(time_source.now_ns)
+    time.sleep(0.01)
+    bus.publish(EventType.TICK, {"tick_number": 2}, source="test")
+    assert seen[1].timestamp_ns - time.time_ns() > 1_000_000_000
+
+
+def test_publish_batch_uses_batch_handler_when_available():
+    """Batch subscribers get one call; plain subscribers get each event"""
+    bus = EventBus()
+    batches, singles = [], []
+
+    def per_event(event):
+        singles.append(event.data["n"])
+
+    def per_event_batch_capable(event):  # pragma: no cover - batch path used
+        raise AssertionError("batch handler should be used instead")
+
+    bus.subscribe(EventType.FAKE_CANDLE, per_event_batch_capable,
+                  batch_handler=lambda events: batches.append([e.data["n"] for e in events]))
+    bus.subscribe(EventType.FAKE_CANDLE, per_event)
+
+    published = bus.publish_batch(EventType.FAKE_CANDLE, ({"n": i} for i in range(5)), source="test")
+
+    assert published == 5
+    assert batches == [[0, 1, 2, 3, 4]]
+    assert singles == [0, 1, 2, 3, 4]
+    assert bus.get_stats()["total_events_published"] == 5
+
+
+def test_vectorised_batch_handler_matches_per_event_handler():
+    """A NumPy batch_handler sees every event of the batch, in one call, with the same result"""
+    from benchmarks.bench_event_bus import CloseStats
+    from backend.market.candle import Candle
+
+    candles = [Candle(60.0 * i, 1.0, 2.0, 0.5, 1.0 + i % 5, 1.0) for i in range(300)]
+    per_event, vectorised = CloseStats(), CloseStats()
+    calls = []
+    bus = EventBus()
+    bus.subscribe(EventType.FAKE_CANDLE, per_event.on_candle)
+    bus.subscribe(EventType.FAKE_CANDLE, vectorised.on_candle,
+                  batch_handler=lambda events: calls.append(len(events)) or vectorised.on_candles(events))
+    for start in range(0, len(candles), 128):
+        bus.publish_batch(EventType.FAKE_CANDLE, candles[start:start + 128], source="test")
+
+    assert calls == [128, 128, 44]
+    assert vectorised.count == per_event.count == 300
+    assert vectorised.total == per_event.total
+    assert abs(vectorised.total_sq - per_event.total_sq) < 1e-9
+
+
+def test_batched_backtest_matches_per_candle_backtest():
+    """Batch replay keeps the per-candle causal chain intact"""
+    from backend.backtest.backtest_engine import BacktestEngine
+    from backend.market.candle import Candle
+
+    candles = [Candle.from_row(1_700_000_000 + i * 60, 100 + (i % 7), 101 + (i % 7), 99 + (i % 7), 100 + (i % 7), 1.0)
+               for i in range(200)]
+    plain = BacktestEngine(candles, strategy_name="fake_trend", speed=1e9).run()
+    batched = BacktestEngine(candles, strategy_name="fake_trend", speed=1e9, batch_size=64).run()
+
+    assert plain["num_trades"] > 0
+    assert batched["num_trades"] == plain["num_trades"]
+    assert [t["price"] for t in batched["trades"]] == [t["price"] for t in plain["trades"]]
+    assert batched["final_equity"] == plain["final_equity"]
+
+
+def test_keyed_subscriptions_only_see_their_symbol():
+    """Routing index delivers keyed events to wildcard + matching key only"""
+    bus = EventBus()
+    btc, eth, everything = [], [], []
+    bus.subscribe(EventType.PRICE_UPDATE, btc.append, key="BTC/USD")
+    bus.subscribe(EventType.PRICE_UPDATE, eth.append, key="ETH/USD")
+    bus.subscribe(EventType.PRICE_UPDATE, everything.append)
+
+    bus.publish(EventType.PRICE_UPDATE, {"price": 1.0}, source="test", key="BTC/USD")
+    bus.publish(EventType.PRICE_UPDATE, {"price": 2.0}, source="test", key="SOL/USD")
+    bus.publish(EventType.PRICE_UPDATE, {"price": 3.0}, source="test")
+
+    assert [e.data["price"] for e in btc] == [1.0]
+    assert eth == []
+    assert [e.data["price"] for e in everything] == [1.0, 2.0, 3.0]
+
+    bus.unsubscribe(EventType.PRICE_UPDATE, btc.append, key="BTC/USD")
+    bus.publish(EventType.PRICE_UPDATE, {"price": 4.0}, source="test", key="BTC/USD")
+    assert len(btc) == 1
+    assert bus.get_stats()["routing_keys"] == 1
+
+
+def test_symbol_scoped_portfolio_ignores_other_symbols():
+    """Agents with a symbol universe subscribe per symbol"""
+    from backend.core.registry import Registry
+    from backend.agents.portfolio.agent import PortfolioManagerAgent
+
+    bus = EventBus()
+    portfolio = PortfolioManagerAgent(bus, Registry(), symbols=["ETH/USD"])
+    portfolio.start()
+    for symbol in ("BTC/USD", "ETH/USD"):
+        bus.publish(EventType.ORDER_FILLED,
+                    {"symbol": symbol, "side": "BUY", "quantity": 1.0, "price": 10.0},
+                    source="test", key=symbol)
+    portfolio.stop()
+
+    assert list(portfolio.get_portfolio_state()["positions"]) == ["ETH/USD"]
+
+
+def test_conflating_subscription_keeps_latest_per_symbol():
+    """Pending updates for the same (type, key) are replaced, not queued"""
+    bus = EventBus()
+    gate = threading.Event()
+    seen = []
+
+    def handler(event):
+        gate.wait(timeout=2.0)
+        seen.append((event.key, event.data["price"]))
+
+    bus.subscribe(EventType.PRICE_UPDATE, handler, mode=DispatchMode.ASYNC, conflate=True)
+
+    # First event parks the worker on the gate; the rest pile up behind it
+    bus.publish(EventType.PRICE_UPDATE, {"price": 0.0}, source="test", key="BTC/USD")
+    time.sleep(0.1)
+    for i in range(1, 101):
+        bus.publish(EventType.PRICE_UPDATE, {"price": float(i)}, source="test", key="BTC/USD")
+        bus.publish(EventType.PRICE_UPDATE, {"price": float(-i)}, source="test", key="ETH/USD")
+
+    stats = bus.get_stats()
+    assert stats["async_queues"][0]["depth"] == 2
+    assert stats["events_conflated"] == 198
+
+    gate.set()
+    bus.shutdown()
+    assert seen == [("BTC/USD", 0.0), ("BTC/USD", 100.0), ("ETH/USD", -100.0)]
+
+
+def test_kill_switch_preempts_queued_market_data():
+    """CRITICAL events overtake the market-data backlog of a shared worker"""
+    from backend.core.policy_guard import PolicyGuard
+
+    bus = EventBus()
+    gate = threading.Event()
+    order = []
+
+    def on_price(event):
+        gate.wait(timeout=2.0)
+        order.append("price")
+
+    def on_kill(event):
+        order.append("kill")
+
+    bus.subscribe(EventType.PRICE_UPDATE, on_price, mode=DispatchMode.ASYNC,
+                  group="agent", queue_size=10,
+                  backpressure=BackpressurePolicy.DROP_OLDEST)
+    bus.subscribe(EventType.KILL_SWITCH_ACTIVATED, on_kill, mode=DispatchMode.ASYNC, group="agent")
+
+    # First update parks the worker on the gate, the rest back up behind it
+    bus.publish(EventType.PRICE_UPDATE, {"price": 1.0}, source="test", key="BTC/USD")
+    time.sleep(0.05)
+    for _ in range(50):
+        bus.publish(EventType.PRICE_UPDATE, {"price": 1.0}, source="test", key="BTC/USD")
+    # Market-data lane is full, but the critical lane is never blocked/dropped
+    PolicyGuard(bus).activate_kill_switch("test")
+
+    stats = bus.get_stats()
+    assert len(stats["async_queues"]) == 1
+    assert stats["async_queues"][0]["lane_depths"][0] == 1
+
+    gate.set()
+    deadline = time.time() + 2.0
+    while len(order) < 12 and time.time() < deadline:
+        time.sleep(0.01)
+    # Only the in-flight price update ran before the kill switch
+    assert order[:2] == ["price", "kill"]
+    latency = bus.get_stats()["latency_by_priority"]
+    assert latency["CRITICAL"]["count"] == 1
+    assert latency["MARKET_DATA"]["count"] == 11
+    bus.shutdown()
+
+
+def test_handler_stats_count_calls_and_errors():
+    """Every handler invocation is timed and failures are counted"""
+    bus = EventBus()
+
+    def on_tick(event):
+        if event.data["n"] % 2:
+            raise ValueError("odd")
+
+    bus.subscribe(EventType.TICK, on_tick)
+    for n in range(10):
+        bus.publish(EventType.TICK, {"n": n}, source="test")
+
+    handlers = bus.get_stats()["handlers"]
+    assert len(handlers) == 1
+    stats = handlers[0]
+    assert stats["event_type"] == "TICK"
+    assert stats["handler"].endswith("on_tick")
+    assert stats["calls"] == 10
+    assert stats["errors"] == 5
+    assert stats["p50_ms"] <= stats["p99_ms"] <= stats["max_ms"]
+    assert not stats["quarantined"]
+
+
+def test_slow_handler_is_quarantined_off_the_sync_path():
+    """A handler that keeps overrunning its budget moves to its own worker"""
+    bus = EventBus(handler_budget_ms=1.0, quarantine_after=3)
+    publisher = threading.current_thread()
+    threads = []
+    fast_calls = []
+
+    def slow(event):
+        threads.append(threading.current_thread())
+        time.sleep(0.005)
+
+    bus.subscribe(EventType.PRICE_UPDATE, slow, key="BTC/USD")
+    bus.subscribe(EventType.PRICE_UPDATE, fast_calls.append)
+
+    for _ in range(3):
+        bus.publish(EventType.PRICE_UPDATE, {"price": 1.0}, source="test", key="BTC/USD")
+    assert all(t is publisher for t in threads)
+
+    # Quarantined: publishing no longer waits for the slow handler
+    started = time.perf_counter()
+    for _ in range(10):
+        bus.publish(EventType.PRICE_UPDATE, {"price": 1.0}, source="test", key="BTC/USD")
+    assert time.perf_counter() - started < 0.03
+    assert len(fast_calls) == 13
+
+    stats = {s["handler"].rsplit(".", 1)[-1]: s for s in bus.get_stats()["handlers"]}
+    assert stats["slow"]["quarantined"]
+    assert stats["slow"]["budget_overruns"] >= 3
+    assert any(q["name"].startswith("quarantine:") for q in bus.get_stats()["async_queues"])
+
+    bus.shutdown()
+    assert len(threads) == 13
+    assert all(t is not publisher for t in threads[3:])
+    assert bus.get_stats()["async_queues"] == []
+
+
+def test_resubscribed_handler_starts_with_fresh_stats():
+    """Unsubscribing the last route of a handler drops its quarantine flag and samples"""
+    bus = EventBus(handler_budget_ms=1.0, quarantine_after=2)
+    publisher = threading.current_thread()
+    threads = []
+
+    def slow(event):
+        threads.append(threading.current_thread())
+        time.sleep(0.005)
+
+    bus.subscribe(EventType.PRICE_UPDATE, slow, key="BTC/USD")
+    bus.subscribe(EventType.PRICE_UPDATE, slow, key="ETH/USD")
+    for _ in range(2):
+        bus.publish(EventType.PRICE_UPDATE, {"price": 1.0}, source="test", key="BTC/USD")
+    bus.unsubscribe(EventType.PRICE_UPDATE, slow, key="BTC/USD")
+    # Still subscribed for ETH/USD: the stats stay
+    assert bus.get_stats()["handlers"][0]["quarantined"]
+    bus.unsubscribe(EventType.PRICE_UPDATE, slow, key="ETH/USD")
+    assert bus.get_stats()["handlers"] == []
+
+    bus.subscribe(EventType.PRICE_UPDATE, slow, key="BTC/USD")
+    stats = bus.get_stats()["handlers"][0]
+    assert not stats["quarantined"] and stats["budget_overruns"] == 0
+    threads.clear()
+    bus.publish(EventType.PRICE_UPDATE, {"price": 1.0}, source="test", key="BTC/USD")
+    assert threads == [publisher]
+    bus.shutdown()
+
+
+def test_run_to_completion_dispatches_breadth_first_at_constant_depth():
+    """Nested publishes are queued and drained FIFO by the root publish"""
+    import inspect
+
+    bus = EventBus(run_to_completion=True)
+    order = []
+    depths = []
+
+    def on_candle(event):
+        depths.append(len(inspect.stack(0)))
+        order.append("candle")
+        bus.publish(EventType.PRICE_UPDATE, {}, source="test")
+        bus.publish(EventType.CANDLE_EVENT, {}, source="test")
+        order.append("candle done")
+
+    def on_price(event):
+        depths.append(len(inspect.stack(0)))
+        order.append("price")
+        bus.publish(EventType.MARKET_REGIME, {}, source="test")
+
+    def on_candle_event(event):
+        order.append("candle event")
+
+    def on_regime(event):
+        depths.append(len(inspect.stack(0)))
+        order.append("regime")
+
+    bus.subscribe(EventType.FAKE_CANDLE, on_candle)
+    bus.subscribe(EventType.PRICE_UPDATE, on_price)
+    bus.subscribe(EventType.CANDLE_EVENT, on_candle_event)
+    bus.subscribe(EventType.MARKET_REGIME, on_regime)
+
+    bus.publish(EventType.FAKE_CANDLE, {}, source="test")
+
+    assert order == ["candle", "candle done", "price", "candle event", "regime"]
+    assert len(set(depths)) == 1
+    stats = bus.get_stats()["run_to_completion"]
+    assert stats["cascades"] == 1
+    assert stats["max_cascade_size"] == 3
+
+
+def test_run_to_completion_caps_cascade_but_not_critical_events():
+    """max_cascade bounds a runaway feedback loop per root event"""
+    bus = EventBus(run_to_completion=True, max_cascade=10)
+    ticks = []
+    kills = []
+
+    def echo(event):
+        ticks.append(event)
+        bus.publish(EventType.TICK, {}, source="test")
+        if len(ticks) == 5:
+            bus.publish(EventType.KILL_SWITCH_ACTIVATED, {}, source="test")
+
+    bus.subscribe(EventType.TICK, echo)
+    bus.subscribe(EventType.KILL_SWITCH_ACTIVATED, kills.append)
+    bus.publish(EventType.TICK, {}, source="test")
+
+    assert len(ticks) == 11  # root + 10 queued
+    assert len(kills) == 1
+    assert bus.get_stats()["run_to_completion"]["cascade_dropped"] == 1
+
+    # The next root event starts a fresh cascade
+    bus.publish(EventType.TICK, {}, source="test")
+    assert len(ticks) == 22
+
+
+def test_run_to_completion_backtest_matches_nested_dispatch():
+    """Breadth-first dispatch keeps the backtest result unchanged"""
+    from backend.backtest.backtest_engine import BacktestEngine
+    from backend.market.candle import Candle
+
+    candles = [Candle.from_row(1_700_000_000 + i * 60, 100 + (i % 7), 101 + (i % 7), 99 + (i % 7), 100 + (i % 7), 1.0)
+               for i in range(200)]
+    nested = BacktestEngine(candles, strategy_name="fake_trend", speed=1e9).run()
+    rtc = BacktestEngine(candles, strategy_name="fake_trend", speed=1e9, run_to_completion=True).run()
+
+    assert nested["num_trades"] > 0
+    assert rtc["num_trades"] == nested["num_trades"]
+    assert [t["price"] for t in rtc["trades"]] == [t["price"] for t in nested["trades"]]
+    assert rtc["final_equity"] == nested["final_equity"]
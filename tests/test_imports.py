@@ -0,0 +1,30 @@
+"""
+PROJECT PREDATOR - Import Tests
+Lazy loading of heavy components on the CLI entry points.
+"""
+import subprocess
+import sys
+from backend.core.components import COMPONENT_PATHS, resolve
+
+LAZY = ("fastapi", "uvicorn", "starlette", "pydantic", "dotenv", "backend.agents.rrs", "backend.monitor.health")
+
+
+def _eager_modules(module: str):
+    code = (f"import sys, {module}\n"
+            f"print('\\n'.join('EAGER ' + m for m in sys.modules if m.startswith({LAZY!r})))")
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    # backend.main logs to stdout on import; keep only our lines
+    return [line[6:] for line in result.stdout.splitlines() if line.startswith("EAGER ")]
+
+
+def test_entry_points_do_not_import_lazy_components():
+    """backend.main and the backtest stack leave the web stack, agents and dotenv unloaded"""
+    for module in ("backend.main", "backend.backtest.backtest_runner", "backend.backtest.backtest_engine"):
+        assert _eager_modules(module) == [], module
+
+
+def test_component_catalog_resolves_every_path():
+    """Every catalog entry imports to the class of that name"""
+    for name in COMPONENT_PATHS:
+        assert resolve(name).__name__ == name
+    assert resolve("backend.market.fake_market:FakeMarket").__name__ == "FakeMarket"
@@ -0,0 +1,136 @@
+"""
+PROJECT PREDATOR - IPC Tests
+Shared-memory ring and agents hosted in a child process.
+"""
+import time
+import pytest
+from backend.codec.binary import BinaryCodec
+from backend.core.event_bus import EventBus, EventType
+from backend.core.payloads import PriceUpdate
+from backend.core.registry import Registry
+from backend.ipc.process_host import ProcessAgentHost
+from backend.ipc.ring import SharedRing
+from backend.ipc.remote_bus import RemoteEventBus
+from backend.ipc.transport import KIND_EVENT, ShmTransport
+from benchmarks.bench_ipc import EchoAgent
+
+
+def test_ring_readers_each_see_every_record_across_wraps():
+    """SPMC: both readers get all records in order, through many wraps"""
+    ring = SharedRing.create(capacity=1024, max_readers=2)
+    try:
+        readers = [ring.reader(ring.add_reader()), ring.reader(ring.add_reader())]
+        seen = [[], []]
+        for i in range(500):
+            ring.write(str(i).encode() * (i % 7 + 1), kind=1, peer=i % 3, timeout=1.0)
+            for reader, records in zip(readers, seen):
+                records.extend(reader.read())
+        for records in seen:
+            assert [seq for seq, _, _, _ in records] == list(range(500))
+            assert records[499] == (499, 1, 499 % 3, b"499" * (499 % 7 + 1))
+        assert all(reader.gaps == 0 for reader in readers)
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def test_ring_writer_waits_for_the_slowest_reader():
+    """A full ring never overwrites unread records; it times out instead"""
+    ring = SharedRing.create(capacity=256, max_readers=1)
+    try:
+        reader = ring.reader(ring.add_reader())
+        for i in range(8):
+            ring.write(b"x" * 16, timeout=0.1)
+        with pytest.raises(TimeoutError):
+            ring.write(b"x" * 16, timeout=0.05)
+        assert len(reader.read()) == 8
+        ring.write(b"y" * 16, timeout=0.1)
+        assert reader.read()[0][3] == b"y" * 16
+
+        reader.close()
+        for _ in range(100):
+            ring.write(b"z" * 16, timeout=0.1)
+    finally:
+        ring.close()
+        ring.unlink()
+
+
+def test_agent_hosted_in_child_process_keeps_the_bus_api():
+    """Parent events reach the child agent; its events come back, never echoed"""
+    bus = EventBus()
+    orders = []
+    bus.subscribe(EventType.ORDER_REQUEST, lambda event: orders.append(event))
+    host = ProcessAgentHost(bus, Registry(), EchoAgent, agent_kwargs={"watch_orders": True})
+    assert host.start()
+    try:
+        for i in range(20):
+            bus.publish(EventType.PRICE_UPDATE, PriceUpdate("ETH/USD", 100.0 + i, float(i)),
+                        source="feed", key="ETH/USD")
+        deadline = time.monotonic() + 10
+        while len(orders) < 20 and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert host.health_check()["alive"]
+    finally:
+        host.stop()
+
+    assert [e.data.price for e in orders] == [100.0 + i for i in range(20)]
+    assert {(e.source, e.key) for e in orders} == {("EchoAgent", "ETH/USD")}
+    # 20 prices + its own 20 orders locally, none delivered twice
+    assert host.health_check()["agent"]["events_processed"] == 40
+    assert not host.health_check()["alive"]
+
+
+def test_dropped_downlink_event_does_not_break_later_decoding():
+    """A write timeout drops the event, and the next one re-defines its symbols"""
+    bus = EventBus()
+    transport = ShmTransport(bus, ring_size=4096, max_children=1, write_timeout=0.02)
+    transport.start()
+    try:
+        reader = transport.downlink.reader(transport.downlink.add_reader())
+        transport._request(EventType.PRICE_UPDATE)
+        sent = 0
+        while transport.get_stats()["dropped"] == 0:
+            # Fresh symbol per event, so the dropped record carried new definitions
+            bus.publish(EventType.PRICE_UPDATE, PriceUpdate(f"SYM{sent}", 1.0, 0.0),
+                        source="feed", key=f"SYM{sent}")
+            sent += 1
+        dropped = f"SYM{sent - 1}"
+
+        codec = BinaryCodec()
+        records = reader.read()
+        assert len(records) == sent - 1
+        for _, kind, _, payload in records:
+            codec.decode_event(payload)
+
+        bus.publish(EventType.PRICE_UPDATE, PriceUpdate(dropped, 2.0, 0.0), source="feed", key=dropped)
+        event = codec.decode_event(reader.read()[0][3])
+        assert (event.key, event.data.price) == (dropped, 2.0)
+        assert transport.get_stats()["events_down"] == sent
+    finally:
+        transport.stop()
+
+
+def test_uplink_carries_causes_before_their_effects():
+    """An event a local handler publishes in response goes up after the event itself"""
+    uplink = SharedRing.create(capacity=64 * 1024, max_readers=1)
+    try:
+        reader = uplink.reader(uplink.add_reader())
+        bus = RemoteEventBus(uplink, write_timeout=1.0)
+        bus.subscribe(EventType.PRICE_UPDATE,
+                      lambda event: bus.publish(EventType.ORDER_REQUEST, {"n": 1}, source="agent"))
+        bus.subscribe(EventType.FAKE_CANDLE,
+                      lambda event: bus.publish(EventType.PRICE_UPDATE, PriceUpdate("ETH/USD", 1.0, 0.0),
+                                                source="agent"))
+        bus.publish(EventType.PRICE_UPDATE, PriceUpdate("ETH/USD", 1.0, 0.0), source="feed")
+        bus.publish_batch(EventType.FAKE_CANDLE, [{"n": 1}, {"n": 2}], source="feed")
+
+        codec = BinaryCodec()
+        order = [codec.decode_event(payload).event_type.value
+                 for _, kind, _, payload in reader.read() if kind == KIND_EVENT]
+        assert order == ["PRICE_UPDATE", "ORDER_REQUEST",
+                         "FAKE_CANDLE", "FAKE_CANDLE",
+                         "PRICE_UPDATE", "ORDER_REQUEST", "PRICE_UPDATE", "ORDER_REQUEST"]
+        bus.shutdown()
+    finally:
+        uplink.close()
+        uplink.unlink()
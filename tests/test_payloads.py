@@ -0,0 +1,92 @@
+"""
+PROJECT PREDATOR - Payload Tests
+Typed event payloads and their dict view.
+"""
+import pytest
+from backend.core.event_bus import EventBus, EventType
+from backend.core.payloads import Fill, OrderRequest, PositionSnapshot, PriceUpdate
+from backend.market.candle import Candle
+
+
+def test_payload_dict_view_is_backward_compatible():
+    """Typed payloads still read like the dicts they replace"""
+    fill = Fill("o-1", "BTC/USD", "BUY", 0.1, 100.0)
+
+    assert fill.price == fill["price"] == fill.get("price") == 100.0
+    assert fill.get("missing", 42) == 42
+    assert "symbol" in fill and "missing" not in fill
+    assert list(fill.keys()) == list(Fill._fields)
+    assert dict(fill) == fill.to_dict() == {
+        "order_id": "o-1", "symbol": "BTC/USD", "side": "BUY", "quantity": 0.1,
+        "price": 100.0, "status": "FILLED", "fake": True,
+    }
+    assert fill == fill.to_dict()
+    with pytest.raises(KeyError):
+        fill["missing"]
+    with pytest.raises(TypeError):
+        fill["price"] = 1.0
+    assert not hasattr(fill, "__dict__")
+
+
+def test_from_mapping_accepts_payloads_and_dicts():
+    """Handlers coerce legacy dicts and pass typed payloads through"""
+    update = PriceUpdate("ETH/USD", 2000.0, 1.0)
+    assert PriceUpdate.from_mapping(update) is update
+
+    legacy = PriceUpdate.from_mapping({"price": 5.0}, {"symbol": "UNKNOWN"})
+    assert (legacy.symbol, legacy.price, legacy.timestamp) == ("UNKNOWN", 5.0, 0.0)
+    assert OrderRequest.from_mapping(None) == OrderRequest()
+
+    order = OrderRequest("BTC/USD", "SELL", quantity=1.0)
+    stamped = order.replace(order_id="o-2")
+    assert stamped.order_id == "o-2" and order.order_id is None
+
+
+def test_backtest_pipeline_uses_typed_payloads_end_to_end():
+    """Candle -> PriceUpdate -> OrderRequest -> Fill -> PositionSnapshot"""
+    from backend.backtest.backtest_engine import BacktestEngine
+
+    candles = [Candle.from_row(1_700_000_000 + i * 60, 100 + (i % 7), 101 + (i % 7), 99 + (i % 7), 100 + (i % 7), 1.0)
+               for i in range(100)]
+    engine = BacktestEngine(candles, strategy_name="fake_trend", speed=1e9)
+    seen = {}
+    for event_type in (EventType.FAKE_CANDLE, EventType.PRICE_UPDATE, EventType.ORDER_REQUEST,
+                       EventType.ORDER_FILLED, EventType.POSITION_UPDATE):
+        engine.event_bus.subscribe(event_type, lambda e: seen.setdefault(e.event_type, type(e.data)))
+    result = engine.run()
+
+    assert result["num_trades"] > 0
+    assert seen == {
+        EventType.FAKE_CANDLE: Candle,
+        EventType.PRICE_UPDATE: PriceUpdate,
+        EventType.ORDER_REQUEST: OrderRequest,
+        EventType.ORDER_FILLED: Fill,
+        EventType.POSITION_UPDATE: PositionSnapshot,
+    }
+    assert all(trade["status"] == "FILLED" and trade["order_id"] for trade in result["trades"])
+
+
+def test_legacy_dict_order_still_fills():
+    """Dict ORDER_REQUESTs from older producers are still executed"""
+    from backend.core.registry import Registry
+    from backend.agents.execution.agent import ExecutionAgent
+    from backend.market.fake_market import FakeMarket
+
+    bus = EventBus()
+    registry = Registry()
+    market = FakeMarket(bus)
+    registry.register("FakeMarket", market)
+    execution = ExecutionAgent(bus, registry)
+    fills = []
+    bus.subscribe(EventType.ORDER_FILLED, lambda e: fills.append(e.data))
+    market.start()
+    execution.start()
+
+    bus.publish(EventType.ORDER_REQUEST, {"symbol": "ETH/USD", "side": "BUY", "quantity": 2.0, "price": 10.0},
+                source="test")
+
+    assert len(fills) == 1
+    assert (fills[0]["symbol"], fills[0]["side"], fills[0]["price"]) == ("ETH/USD", "BUY", 10.0)
+    assert fills[0].order_id
+    execution.stop()
+    market.stop()
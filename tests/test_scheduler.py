@@ -0,0 +1,102 @@
+"""
+PROJECT PREDATOR - Scheduler Tests
+Deadline heap, drift-free periodic jobs and overrun policies.
+"""
+import threading
+import time
+from backend.core.event_bus import EventBus, EventType
+from backend.core.scheduler import OverrunPolicy, Scheduler
+
+
+def _scheduler(**kwargs):
+    # Built-in TICK/HEARTBEAT far apart so they stay out of the way
+    return Scheduler(EventBus(), tick_interval=kwargs.pop("tick_interval", 60.0), heartbeat_interval=60.0, **kwargs)
+
+
+def test_periodic_job_stays_on_its_grid():
+    """Runs are spaced by the interval without accumulating drift"""
+    scheduler = _scheduler()
+    fired = []
+    first_at = scheduler.now() + 0.02
+    scheduler.schedule_every(0.01, lambda: fired.append(scheduler.now()), first_at=first_at)
+    scheduler.start()
+    time.sleep(0.25)
+    scheduler.stop()
+    assert len(fired) >= 15
+    # Deadline n is first_at + n * interval: late by a little, never drifting
+    lateness = [t - (first_at + n * 0.01) for n, t in enumerate(fired)]
+    assert min(lateness) >= 0
+    assert sorted(lateness)[len(lateness) // 2] < 0.005
+
+
+def test_overrun_policies():
+    """SKIP drops missed deadlines; CATCH_UP runs them back to back"""
+    for policy in OverrunPolicy:
+        scheduler = _scheduler()
+        runs = []
+
+        def slow():
+            runs.append(scheduler.now())
+            if len(runs) == 1:
+                time.sleep(0.055)
+
+        job_id = scheduler.schedule_every(0.02, slow, policy=policy)
+        scheduler.start()
+        time.sleep(0.2)
+        scheduler.stop()
+        stats = next(job for job in scheduler.get_stats()["jobs"] if job["job_id"] == job_id)
+        assert stats["overruns"] >= 1
+        if policy is OverrunPolicy.SKIP:
+            assert stats["skipped"] >= 2
+            assert runs[1] - runs[0] >= 0.055
+        else:
+            assert stats["skipped"] == 0
+            # The missed deadlines fire immediately after the slow run
+            assert runs[2] - runs[1] < 0.01
+
+
+def test_one_shot_cancel_and_builtin_tick():
+    """schedule_at runs once, cancelled jobs never run, TICK is a scheduled job"""
+    bus = EventBus()
+    scheduler = Scheduler(bus, tick_interval=0.02, heartbeat_interval=60.0)
+    ticks = threading.Event()
+    bus.subscribe(EventType.TICK, lambda event: ticks.set())
+    once, cancelled = [], []
+    scheduler.schedule_at(scheduler.now() + 0.01, lambda: once.append(1))
+    scheduler.cancel(scheduler.schedule_at(scheduler.now() + 0.01, lambda: cancelled.append(1)))
+    scheduler.start()
+    assert ticks.wait(1.0)
+    time.sleep(0.05)
+    scheduler.stop()
+    assert once == [1] and cancelled == []
+    assert scheduler.get_stats()["ticks_generated"] >= 1
+
+
+def test_tick_overruns_and_lag_are_measured_and_published():
+    """A TICK handler slower than the interval shows up as missed ticks, handler time and a metric event"""
+    bus = EventBus()
+    scheduler = Scheduler(bus, tick_interval=0.01, heartbeat_interval=60.0, metrics_interval=0.05)
+    metrics = []
+    bus.subscribe(EventType.TICK, lambda event: time.sleep(0.03) if event.data["tick_number"] == 2 else None)
+    bus.subscribe(EventType.METRIC_PUBLISHED, lambda event: metrics.append(event.data))
+    scheduler.start()
+    time.sleep(0.2)
+    scheduler.stop()
+    stats = scheduler.get_stats()
+    assert stats["slow_ticks"] >= 1 and stats["tick_overruns"] >= 1
+    assert stats["ticks_missed"] >= 2
+    assert stats["tick_handler"]["max_ms"] >= 30
+    assert stats["tick_lag"]["count"] == stats["ticks_generated"]
+    assert stats["scheduler_lag"]["count"] >= stats["tick_lag"]["count"]
+    assert metrics and metrics[-1]["metric"] == "scheduler" and "tick_lag" in metrics[-1]
+
+
+def test_rolling_histogram_forgets_old_windows():
+    """Samples older than the window span drop out of the snapshot"""
+    from backend.monitor.histogram import RollingHistogram
+    histogram = RollingHistogram(windows=3, window_seconds=1.0)
+    histogram.record(5_000_000, now=0.0)
+    histogram.record(1_000_000, now=1.5)
+    assert histogram.snapshot(2.0).count == 2
+    assert histogram.snapshot(3.2).count == 1
+    assert histogram.summary(10.0)["count"] == 0
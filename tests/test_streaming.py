@@ -0,0 +1,45 @@
+"""
+PROJECT PREDATOR - Streaming Backtest Tests
+Loader chunks -> replayer iterator -> bounded engine history.
+"""
+import pytest
+from backend.backtest.backtest_engine import BacktestEngine
+from backend.market.candle import Candle
+from backend.simulation.historical_data_loader import HistoricalDataLoader
+
+HEADER = "timestamp,open,high,low,close,volume\n"
+
+
+def _rows(n: int, start: int = 0) -> str:
+    return "".join(f"{1_700_000_000 + 60 * i},{100 + i % 7},{101 + i % 7},{99 + i % 7},{100 + i % 7},1\n"
+                   for i in range(start, start + n))
+
+
+def test_stream_parses_lazily(tmp_path):
+    """The first candle needs only the first chunk; ranges match load_csv"""
+    path = tmp_path / "bad_tail.csv"
+    path.write_text(HEADER + _rows(10) + "not,a,candle,row,at,all\n")
+    loader = HistoricalDataLoader(chunk_rows=10)
+    assert next(loader.stream(str(path))) == Candle(1_700_000_000.0, 100.0, 101.0, 99.0, 100.0, 1.0)
+    with pytest.raises(ValueError):
+        loader.load_csv(str(path))
+
+    path = tmp_path / "good.csv"
+    path.write_text(HEADER + _rows(50))
+    start, end = 1_700_000_000 + 60 * 12, 1_700_000_000 + 60 * 31
+    assert list(loader.stream(str(path), start, end)) == list(loader.load_csv(str(path)).between(start, end))
+
+
+def test_engine_runs_a_stream_with_bounded_history(tmp_path):
+    """A streamed run reports the same metrics as a list run but keeps only history_window entries"""
+    path = tmp_path / "candles.csv"
+    path.write_text(HEADER + _rows(300))
+    loader = HistoricalDataLoader(chunk_rows=64)
+    for virtual_time in (True, False):
+        eager = BacktestEngine(list(loader.load_csv(str(path))), speed=1e9, virtual_time=virtual_time).run()
+        streamed = BacktestEngine(loader.stream(str(path)), speed=1e9, virtual_time=virtual_time,
+                                  history_window=10).run()
+        assert streamed["num_trades"] == eager["num_trades"] > 10
+        assert len(streamed["trades"]) == 10 and len(streamed["equity_curve"]) == 10
+        for key in ("total_return", "winrate", "max_drawdown", "final_equity"):
+            assert streamed[key] == eager[key]
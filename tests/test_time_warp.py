@@ -0,0 +1,88 @@
+"""
+PROJECT PREDATOR - TimeWarp Tests
+Virtual clock, timers, and the components running on it.
+"""
+import threading
+import time
+from backend.backtest.backtest_engine import BacktestEngine
+from backend.core.event_bus import EventBus, EventType
+from backend.core.scheduler import Scheduler
+from backend.market.candle import Candle
+from backend.simulation.market_clock import MarketClock
+from backend.simulation.time_warp import TimeWarp
+
+
+def test_timers_run_in_order_at_their_deadlines():
+    """advance_to jumps from timer to timer; each sees now() == its deadline"""
+    warp = TimeWarp(start=1000.0)
+    seen = []
+    warp.call_at(1005.0, lambda: seen.append(("at", warp.time())))
+    timer = warp.call_every(2.0, lambda: seen.append(("every", warp.time())))
+    warp.call_later(3.0, lambda: warp.cancel(timer))
+    warp.advance_to(1010.0)
+    assert seen == [("every", 1002.0), ("at", 1005.0)]
+    assert warp.time() == 1010.0
+    assert not warp.step()
+
+
+def test_cancelling_a_fired_timer_is_a_no_op():
+    """Only pending timers are tracked as cancelled; the pending count stays exact"""
+    warp = TimeWarp(start=0.0)
+    fired = warp.call_at(1.0, lambda: None)
+    pending = warp.call_at(5.0, lambda: None)
+    warp.advance_to(2.0)
+    warp.cancel(fired)
+    assert warp.get_stats()["timers_pending"] == 1
+    warp.cancel(pending)
+    assert warp.get_stats()["timers_pending"] == 0
+    assert not warp.step()
+    assert not warp._cancelled
+
+
+def test_pause_holds_the_driver_and_step_runs_single_timers():
+    """A paused driver waits at a timer boundary; step() still advances by hand"""
+    warp = TimeWarp()
+    fired = []
+    for t in (1.0, 2.0, 3.0):
+        warp.call_at(t, lambda t=t: fired.append(t))
+    warp.pause()
+    assert warp.step() and fired == [1.0]
+    driver = threading.Thread(target=warp.run)
+    driver.start()
+    time.sleep(0.05)
+    assert fired == [1.0] and driver.is_alive()
+    warp.resume()
+    driver.join(1.0)
+    assert fired == [1.0, 2.0, 3.0]
+
+
+def test_scheduler_and_market_clock_run_on_virtual_time():
+    """Scheduler jobs and MarketClock ticks fire as the virtual clock passes them"""
+    warp = TimeWarp(start=0.0)
+    bus = EventBus(clock=warp.now_ns)
+    ticks = []
+    bus.subscribe(EventType.TICK, lambda event: ticks.append((event.source, event.timestamp_ns)))
+    scheduler = Scheduler(bus, tick_interval=1.0, heartbeat_interval=60.0, time_warp=warp)
+    clock = MarketClock(bus, warp, tick_interval=5.0)
+    scheduler.start()
+    clock.start()
+    started = time.perf_counter()
+    warp.advance_to(10.0)
+    scheduler.stop()
+    clock.stop()
+    assert time.perf_counter() - started < 1.0
+    assert [ts for source, ts in ticks if source == "Scheduler"] == [int(s * 1e9) for s in range(1, 11)]
+    assert [ts for source, ts in ticks if source == "MarketClock"] == [5_000_000_000, 10_000_000_000]
+
+
+def test_virtual_time_backtest_does_not_sleep():
+    """A year of daily candles replays with spacing in well under a second, stamped in candle time"""
+    candles = [Candle(1_700_000_000 + i * 86_400, 100 + i % 7, 101 + i % 7, 99 + i % 7, 100 + i % 7, 1.0)
+               for i in range(365)]
+    engine = BacktestEngine(candles, strategy_name="fake_trend", speed=100.0, virtual_time=True)
+    stamps = []
+    engine.event_bus.subscribe(EventType.FAKE_CANDLE, lambda event: stamps.append(event.timestamp_ns))
+    started = time.perf_counter()
+    engine.run()
+    assert time.perf_counter() - started < 5.0
+    assert stamps == [int(c.timestamp) * 1_000_000_000 for c in candles]